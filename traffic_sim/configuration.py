@@ -6,6 +6,19 @@ class Config:
     HEIGHT = 768
     TITLE = "Traffic Simulation"
     FPS = 60
+    # Repaint and present only the areas that changed (pg.display.update(rects))
+    # instead of flipping the whole screen; pays off on software displays
+    DIRTY_RECT_RENDERING = False
+    STATS_OVERLAY_REFRESH_S = 0.25  # Statistics overlay (key S) re-renders at most this often
+    # Road users on the map at most (App max_agents); arrivals beyond it wait
+    # in their entry queue. The intersection jams at about 45, so dense
+    # scenes raise the cap rather than the demand.
+    MAX_TOTAL_AGENTS = 30
+    # Above BOX_ABOVE visible road users they are drawn as filled collision
+    # boxes, above DOT_ABOVE as single pixels; a level is left again below
+    # its threshold * (1 - HYSTERESIS) (render/lod.py). BOX_ABOVE is just
+    # over the default MAX_TOTAL_AGENTS; DOT_ABOVE is for larger maps.
+    LEVEL_OF_DETAIL = {"BOX_ABOVE": 36, "DOT_ABOVE": 300, "HYSTERESIS": 0.2}
 
     # Colors
     BLACK = (0, 0, 0)
@@ -23,6 +36,79 @@ class Config:
         "RED": 10.0
     }
 
+    # Signal plan for the intersection Controller: path to a JSON phase table
+    # (see domain/world/phase_table.py). None uses DEFAULT_PHASE_TABLE.
+    PHASE_TABLE_FILE = None
+
+    # Signal control policy of the Controller:
+    #   "FIXED"        - fixed-time plan from the phase table
+    #   "ACTUATED"     - green extended by arrivals, empty ped/bike stages skipped
+    #   "MAX_PRESSURE" - serve the stage with the largest queue minus downstream link occupancy
+    SIGNAL_CONTROL = "FIXED"
+
+    # Virtual loop detectors (services/detectors.py) and actuated control:
+    # green is extended while arrivals pass the upstream loop within PASSAGE_GAP
+    # seconds, ped/bike stages nobody waits for are skipped
+    ACTUATED_CONTROL = {
+        "PASSAGE_GAP": 2.5,          # Seconds without arrivals before green gaps out
+        "UPSTREAM_DISTANCE": 150.0,  # Passage loop distance before the stop line (px)
+        "PRESENCE_ZONE": 40.0,       # Presence loop length before the stop line (px)
+        "BOX_LENGTH": 250.0,         # Path length past the stop line inside the intersection (px)
+    }
+
+    # Max-pressure control: after min_green the stage pressures are compared
+    # every DECISION_INTERVAL seconds
+    MAX_PRESSURE = {
+        "DECISION_INTERVAL": 2.0,
+    }
+
+    # Demand (services/demand.py): Poisson arrivals per route and actor type,
+    # in vehicles per hour. Route names are those of services/pathing.py.
+    DEMAND_RATES = {
+        "CARS_NS_UP":          {"CAR": 400.0, "TRUCK": 100.0},
+        "CARS_NS_LEFT":        {"CAR": 400.0, "TRUCK": 100.0},
+        "CARS_NS_RIGHT":       {"CAR": 400.0, "TRUCK": 100.0},
+        "CARS_EW_RIGHT":       {"CAR": 300.0, "TRUCK": 80.0},
+        "CARS_EW_LEFT":        {"CAR": 300.0, "TRUCK": 80.0},
+        "CARS_EW_TURN_RIGHT":  {"CAR": 300.0, "TRUCK": 80.0},
+        "BIKES_NS_UP":         {"CYCLIST": 240.0},
+        "BIKES_NS_LEFT":       {"CYCLIST": 240.0},
+        "BIKES_NS_RIGHT":      {"CYCLIST": 240.0},
+        "BIKES_EW_RIGHT":      {"CYCLIST": 300.0},
+        "BIKES_EW_LEFT":       {"CYCLIST": 300.0},
+        "BIKES_EW_TURN_RIGHT": {"CYCLIST": 300.0},
+        "PEDS_EW_RIGHT":       {"PEDESTRIAN": 450.0},
+    }
+
+    # Time-varying demand: path to a CSV of 15-minute turning-movement counts
+    # (see services/demand.py, read_count_profile). None uses DEMAND_RATES.
+    DEMAND_PROFILE_FILE = None
+
+    # River traffic (services/river.py): boats per hour per lane, boat sizes
+    # and speed spread. Boats keep right: RIVER_UP sails north on the east
+    # side, RIVER_DOWN south on the west side, without overtaking.
+    RIVER_TRAFFIC = {
+        "RATES": {"RIVER_UP": {"BOAT": 6.0}, "RIVER_DOWN": {"BOAT": 6.0}},
+        "SCALES": (1.0, 1.0, 1.4),   # Mostly small boats, some barges
+        "SPEED_SPREAD": 0.2,         # Boat speeds vary +/- 20% around SPEEDS["BOAT"]
+        "MAX_BOATS": 40,
+    }
+
+    # Movable road bridge (services/bridge.py): it opens for a batch of
+    # MIN_BATCH boats within APPROACH px of the bridge, or when the first waiting boat has waited
+    # MAX_WAIT seconds. Times in seconds; the road and boat delay it causes
+    # is in the statistics summary under 'bridge'.
+    BRIDGE = {
+        "ENABLED": True,
+        "MIN_BATCH": 3,
+        "MAX_WAIT": 120.0,
+        "APPROACH": 200.0,   # px before the stop position where boats count for an opening
+        "CLEARANCE": 5.0,    # Gates closed before the bridge may rise
+        "RAISE": 10.0,
+        "LOWER": 10.0,
+        "MAX_OPEN": 90.0,
+    }
+
     # Actor speeds (pixels per second)
     SPEEDS = {
         "CAR": 100.0,
@@ -81,6 +167,88 @@ class Config:
         }
     }
 
+    # Acceleration limits per vehicle type (px/s^2) for the kinematic integrator
+    KINEMATICS = {
+        "CAR":        {"MAX_ACCELERATION": 120.0, "MAX_DECELERATION": 300.0},
+        "TRUCK":      {"MAX_ACCELERATION": 40.0,  "MAX_DECELERATION": 200.0},
+        "CYCLIST":    {"MAX_ACCELERATION": 80.0,  "MAX_DECELERATION": 200.0},
+        "PEDESTRIAN": {"MAX_ACCELERATION": 150.0, "MAX_DECELERATION": 300.0},
+        "DEFAULT":    {"MAX_ACCELERATION": 120.0, "MAX_DECELERATION": 300.0},
+    }
+
+    # Fixed time step (s) for headless runs (App.run_headless)
+    HEADLESS_DT = 0.1
+
+    # Continuous collision detection: every move is swept between the old and
+    # new collision box, so large steps (0.2-0.5s) cannot jump through anything
+    CONTINUOUS_COLLISION = {
+        "ENABLED": True,
+        "MARGIN": 1.0,  # Pixels left between two boxes when a move is cut short
+    }
+
+    # Overlap resolver (services/overlap_resolver.py): pushes overlapping agents
+    # apart along their routes when an overlap slips through anyway
+    OVERLAP_RESOLVER = {
+        "MAX_ITERATIONS": 4,  # Solver passes per tick
+        "MARGIN": 1.0,        # Extra pixels of clearance after a correction
+    }
+
+    # Car-following model used for longitudinal control:
+    #   "BINARY" - full speed or complete stop at the following distance
+    #   "IDM"    - Intelligent Driver Model (smooth acceleration/braking)
+    CAR_FOLLOWING_MODEL = "BINARY"
+
+    # Intelligent Driver Model parameters per vehicle type (pixels, seconds)
+    # DESIRED_SPEED None means: use the speed the agent was spawned with.
+    # MAX_ACCELERATION is the KINEMATICS limit of the type, so the model
+    # never asks for more than the integrator allows.
+    IDM_PARAMS = {
+        "CAR": {
+            "DESIRED_SPEED": None,
+            "TIME_HEADWAY": 1.0,               # Desired time gap to the leader (s)
+            "MIN_GAP": 20.0,                   # Bumper-to-bumper gap when standing still
+            "MAX_ACCELERATION": KINEMATICS["CAR"]["MAX_ACCELERATION"],
+            "COMFORTABLE_DECELERATION": 90.0,  # px/s^2
+            "ACCELERATION_EXPONENT": 4.0,
+        },
+        "TRUCK": {
+            "DESIRED_SPEED": None,
+            "TIME_HEADWAY": 1.5,
+            "MIN_GAP": 30.0,
+            "MAX_ACCELERATION": KINEMATICS["TRUCK"]["MAX_ACCELERATION"],
+            "COMFORTABLE_DECELERATION": 60.0,
+            "ACCELERATION_EXPONENT": 4.0,
+        },
+        "CYCLIST": {
+            "DESIRED_SPEED": None,
+            "TIME_HEADWAY": 0.8,
+            "MIN_GAP": 12.0,
+            "MAX_ACCELERATION": KINEMATICS["CYCLIST"]["MAX_ACCELERATION"],
+            "COMFORTABLE_DECELERATION": 80.0,
+            "ACCELERATION_EXPONENT": 4.0,
+        },
+        "PEDESTRIAN": {
+            "DESIRED_SPEED": None,
+            "TIME_HEADWAY": 0.5,
+            "MIN_GAP": 8.0,
+            "MAX_ACCELERATION": KINEMATICS["PEDESTRIAN"]["MAX_ACCELERATION"],
+            "COMFORTABLE_DECELERATION": 120.0,
+            "ACCELERATION_EXPONENT": 4.0,
+        },
+        "DEFAULT": {
+            "DESIRED_SPEED": None,
+            "TIME_HEADWAY": 1.0,
+            "MIN_GAP": 20.0,
+            "MAX_ACCELERATION": KINEMATICS["DEFAULT"]["MAX_ACCELERATION"],
+            "COMFORTABLE_DECELERATION": 90.0,
+            "ACCELERATION_EXPONENT": 4.0,
+        }
+    }
+
+    # With IDM the strict overlap check (_check_any_collision) only runs every
+    # N ticks per agent, or immediately when the gap drops below MIN_GAP
+    SAFETY_CHECK_INTERVAL = 6
+
     # Frame boundary settings for vehicle despawning
     FRAME_BOUNDARY = {
         "DESPAWN_BUFFER": 150,                  # Extra pixels outside frame before despawning (increased for EW spawning)
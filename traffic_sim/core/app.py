@@ -3,6 +3,7 @@ import pygame as pg
 import time
 from pathlib import Path
 import time
+import os
 import sys
 import random
 import math
@@ -16,6 +17,7 @@ try:
     from ..configuration import Config
     from ..render.draw_world import draw
     from ..domain.world.intersection import Controller
+    from ..domain.world.phase_table import load_phase_table
     from ..domain.actors.car import Car
     from ..domain.actors.cyclist import Cyclist
     from ..domain.actors.pedestrian import Pedestrian
@@ -30,15 +32,29 @@ try:
         PEDS_EW_RIGHT,
     )
     from ..services.spawner import Spawner
-    from ..services.physics import check_collisions
+    from ..services.demand import PoissonDemand, read_count_profile
+    from ..services.entries import EntryQueues
+    from ..services.registry import AgentRegistry
+    from ..services.river import RiverTraffic
+    from ..services.bridge import BridgeController
+    from ..services.physics import find_contact_pairs
+    from ..services.overlap_resolver import resolve_overlaps
+    from ..services.car_following import compute_lane_accelerations
+    from ..services.kinematics import integrate
+    from ..services.sleeping import SleepScheduler, SLEEP_SPEED_THRESHOLD
+    from ..services.detectors import LoopDetectors
     from ..services.statistics import SimulationStats
     from ..domain.world.traffic_light import Light            # status enum
     from ..render.draw_traffic_light import DrawableStoplicht # visuele stoplichten
     from ..render.draw_world import WorldRenderer
+    from ..render.layers import Compositor
+    from ..render.hud import Button, Label, StatsOverlay
+    from ..render.lod import Detail, LevelOfDetail, draw_agent
 except ImportError:
     from traffic_sim.configuration import Config
     from traffic_sim.render.draw_world import draw
     from traffic_sim.domain.world.intersection import Controller
+    from traffic_sim.domain.world.phase_table import load_phase_table
     from traffic_sim.domain.actors.car import Car
     from traffic_sim.domain.actors.cyclist import Cyclist
     from traffic_sim.domain.actors.pedestrian import Pedestrian
@@ -53,11 +69,24 @@ except ImportError:
         PEDS_EW_RIGHT,
     )
     from traffic_sim.services.spawner import Spawner
-    from traffic_sim.services.physics import check_collisions
+    from traffic_sim.services.demand import PoissonDemand, read_count_profile
+    from traffic_sim.services.entries import EntryQueues
+    from traffic_sim.services.registry import AgentRegistry
+    from traffic_sim.services.river import RiverTraffic
+    from traffic_sim.services.bridge import BridgeController
+    from traffic_sim.services.physics import find_contact_pairs
+    from traffic_sim.services.overlap_resolver import resolve_overlaps
+    from traffic_sim.services.car_following import compute_lane_accelerations
+    from traffic_sim.services.kinematics import integrate
+    from traffic_sim.services.sleeping import SleepScheduler, SLEEP_SPEED_THRESHOLD
+    from traffic_sim.services.detectors import LoopDetectors
     from traffic_sim.services.statistics import SimulationStats
     from traffic_sim.domain.world.traffic_light import Light            # status enum
     from traffic_sim.render.draw_traffic_light import DrawableStoplicht # visuele stoplichten
     from traffic_sim.render.draw_world import WorldRenderer
+    from traffic_sim.render.layers import Compositor
+    from traffic_sim.render.hud import Button, Label, StatsOverlay
+    from traffic_sim.render.lod import Detail, LevelOfDetail, draw_agent
 
 config = Config()
 def load_background(path: Path):
@@ -72,7 +101,17 @@ def load_background(path: Path):
 class App:
     """Main simulation application with self-rendering agents"""
 
-    def __init__(self):
+    def __init__(self, headless: bool = False, phase_table: dict = None, demand: PoissonDemand = None,
+                 seed_agents: bool = True, max_agents: int = None):
+        # Headless: no window, the simulation is stepped with run_headless()
+        # demand: arrival model to use instead of the one from Config
+        # seed_agents: start with a few cars and trucks on the road (for the
+        # picture); runs that measure only their own demand start empty
+        # max_agents: road users at most on the map (Config.MAX_TOTAL_AGENTS);
+        # arrivals beyond it wait in their entry queue
+        self.headless = headless
+        if headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
         pg.init()
         self.size = (config.WIDTH, config.HEIGHT)
         self.screen = pg.display.set_mode(self.size)
@@ -83,8 +122,30 @@ class App:
         world_renderer = WorldRenderer()
         self.background = world_renderer.background
 
-        # Traffic controller
-        self.ctrl = Controller()
+        # Frame layers, bottom to top; the bridge sits over the boats
+        self.compositor = Compositor(self.background)
+        self.compositor.add("boats", self._draw_boats)
+        self.compositor.add_static("bridge", world_renderer.bridge_overlay, world_renderer.bridge_pos)
+        self.compositor.add("agents", self._draw_agents)
+        self.compositor.add("bridge_barriers", self._draw_bridge_barriers)
+        self.compositor.add("traffic_lights", self._draw_traffic_lights)
+        self.compositor.add("collision_outlines", lambda screen: self._draw_collision_outlines())
+        self.compositor.add("hud", self._draw_hud)
+        self.dirty_rects = getattr(config, "DIRTY_RECT_RENDERING", False)
+        # Dense scenes draw boxes or dots instead of sprites (render/lod.py)
+        lod = config.LEVEL_OF_DETAIL
+        self.lod = LevelOfDetail(lod["BOX_ABOVE"], lod["DOT_ABOVE"], lod["HYSTERESIS"])
+        self.screen_rect = self.screen.get_rect()
+
+        # Traffic controller (signal plan from the given or configured phase table)
+        table_file = getattr(config, "PHASE_TABLE_FILE", None)
+        if phase_table is None and table_file:
+            phase_table = load_phase_table(table_file)
+        self.ctrl = Controller(phase_table)
+
+        # Parked agents are skipped until their signal group changes or their leader moves
+        self.sleep = SleepScheduler()
+        self.ctrl.subscribe(self.sleep.on_signal_change)
 
         # Helper function: 0..1 → pixels
         def px(nx: float, ny: float):
@@ -113,97 +174,151 @@ class App:
         self.peds_ew_right_px = to_pixels(PEDS_EW_RIGHT, *self.size)
 
         # ====== SPAWNERS ======
+        # One per direction and actor type: builds the agent (a random route of
+        # the direction, or the one given) and binds it to its signal group
         self.car_ns_spawner = Spawner(
-            factory=lambda: Car(
-                random.choice([
+            factory=lambda path=None: Car(
+                path or random.choice([
                     self.cars_ns_up_px,
                     self.cars_ns_left_px,
                     self.cars_ns_right_px
-                ]),
-                can_cross_ok=self.ctrl.can_cars_cross_ns,
+                ])
             ),
-            interval_s=3.0, random_offset=1.0, max_count=50
+            signal_group="cars_ns",
+            signals=self.ctrl,
         )
 
         self.car_ew_spawner = Spawner(
-            factory=lambda: Car(
-                random.choice([
+            factory=lambda path=None: Car(
+                path or random.choice([
                     self.cars_ew_right_px,
                     self.cars_ew_left_px,
                     self.cars_ew_turn_right_px
                 ]),
-                speed_px_s=130,
-                can_cross_ok=self.ctrl.can_cars_cross_ew,
+                speed_px_s=130
             ),
-            interval_s=4.0, random_offset=1.5, max_count=50
+            signal_group="cars_ew",
+            signals=self.ctrl,
         )
 
         # North-South bike spawner (multiple paths)
         self.bike_ns_spawner = Spawner(
-            factory=lambda: Cyclist(
-                random.choice([
+            factory=lambda path=None: Cyclist(
+                path or random.choice([
                     self.bikes_ns_up_px,
                     self.bikes_ns_left_px,
                     self.bikes_ns_right_px
                 ]),
-                speed_px_s=90,
-                can_cross_ok=self.ctrl.can_ped_cross_ns
+                speed_px_s=90
             ),
-            interval_s=5.0, random_offset=1.0, max_count=30
+            signal_group="ped_ns",
+            signals=self.ctrl,
         )
 
         # East-West bike spawner (multiple paths) - follows pedestrian traffic lights
         self.bike_ew_spawner = Spawner(
-            factory=lambda: Cyclist(
-                random.choice([
+            factory=lambda path=None: Cyclist(
+                path or random.choice([
                     self.bikes_ew_right_px,
                     self.bikes_ew_left_px,
                     self.bikes_ew_turn_right_px
                 ]),
-                speed_px_s=90,
-                can_cross_ok=self.ctrl.can_ped_cross_ew  # Follow EW pedestrian traffic lights only
+                speed_px_s=90
             ),
-            interval_s=4.0, random_offset=1.0, max_count=25  # Increased frequency: 4s ± 1s
+            signal_group="ped_ew",
+            signals=self.ctrl,
         )
 
         # Add North-South truck spawner (same paths as cars)
         self.truck_ns_spawner = Spawner(
-            factory=lambda: Truck(
-                random.choice([
+            factory=lambda path=None: Truck(
+                path or random.choice([
                     self.cars_ns_up_px,
                     self.cars_ns_left_px, 
                     self.cars_ns_right_px
                 ]),
-                speed_px_s=100,
-                can_cross_ok=self.ctrl.can_cars_cross_ns
+                speed_px_s=config.SPEEDS["TRUCK"]
             ),
-            interval_s=12.0, random_offset=3.0, max_count=15  # Less frequent than cars
+            signal_group="cars_ns",
+            signals=self.ctrl,
         )
 
         self.truck_ew_spawner = Spawner(
-            factory=lambda: Truck(
-                random.choice([
+            factory=lambda path=None: Truck(
+                path or random.choice([
                     self.cars_ew_right_px,
                     self.cars_ew_left_px,
                     self.cars_ew_turn_right_px
                 ]),
-                speed_px_s=100,
-                can_cross_ok=self.ctrl.can_cars_cross_ew
+                speed_px_s=config.SPEEDS["TRUCK"]
             ),
-            interval_s=15.0, random_offset=4.0, max_count=10  # Less frequent than cars
+            signal_group="cars_ew",
+            signals=self.ctrl,
         )
 
         # East-West pedestrian spawner - only cross during EW pedestrian phase
-        def ew_ped_can_cross():
-            # Allow EW pedestrians to cross ONLY during EW pedestrian phase
-            # (They will continue crossing if already on intersection due to RoadUser logic)
-            return self.ctrl.can_ped_cross_ew()
-        
         self.ped_ew_spawner = Spawner(
-            factory=lambda: Pedestrian(self.peds_ew_right_px, speed_px_s=70, can_cross_ok=ew_ped_can_cross),
-            interval_s=8.0, random_offset=2.0, max_count=20  # Less frequent: 8s ± 2s (6-10s), fewer max
+            factory=lambda path=None: Pedestrian(path or self.peds_ew_right_px, speed_px_s=70),
+            signal_group="ped_ew",
+            signals=self.ctrl,
         )
 
+        # ====== DEMAND ======
+        # Poisson arrivals per route and actor type (Config.DEMAND_RATES, or the
+        # count profile of Config.DEMAND_PROFILE_FILE); a route spawns through
+        # the spawner of its direction for that type
+        cars_ns = {"CAR": self.car_ns_spawner, "TRUCK": self.truck_ns_spawner}
+        cars_ew = {"CAR": self.car_ew_spawner, "TRUCK": self.truck_ew_spawner}
+        self.routes = {
+            "CARS_NS_UP": (self.cars_ns_up_px, cars_ns),
+            "CARS_NS_LEFT": (self.cars_ns_left_px, cars_ns),
+            "CARS_NS_RIGHT": (self.cars_ns_right_px, cars_ns),
+            "CARS_EW_RIGHT": (self.cars_ew_right_px, cars_ew),
+            "CARS_EW_LEFT": (self.cars_ew_left_px, cars_ew),
+            "CARS_EW_TURN_RIGHT": (self.cars_ew_turn_right_px, cars_ew),
+            "BIKES_NS_UP": (self.bikes_ns_up_px, {"CYCLIST": self.bike_ns_spawner}),
+            "BIKES_NS_LEFT": (self.bikes_ns_left_px, {"CYCLIST": self.bike_ns_spawner}),
+            "BIKES_NS_RIGHT": (self.bikes_ns_right_px, {"CYCLIST": self.bike_ns_spawner}),
+            "BIKES_EW_RIGHT": (self.bikes_ew_right_px, {"CYCLIST": self.bike_ew_spawner}),
+            "BIKES_EW_LEFT": (self.bikes_ew_left_px, {"CYCLIST": self.bike_ew_spawner}),
+            "BIKES_EW_TURN_RIGHT": (self.bikes_ew_turn_right_px, {"CYCLIST": self.bike_ew_spawner}),
+            "PEDS_EW_RIGHT": (self.peds_ew_right_px, {"PEDESTRIAN": self.ped_ew_spawner}),
+        }
+        if demand is None:
+            if config.DEMAND_PROFILE_FILE:
+                demand = PoissonDemand(profile=read_count_profile(config.DEMAND_PROFILE_FILE))
+            else:
+                demand = PoissonDemand(config.DEMAND_RATES)
+        self.demand = demand
+        # Finished road users go back to the spawner of their kind for reuse
+        self._spawner_of_kind = {
+            (sp.signal_group, actor): sp for _, spawners in self.routes.values() for actor, sp in spawners.items()
+        }
+        # Arrivals wait in a queue per spawn point until the entry is clear;
+        # the entries count the agents near their spawn point (the shared EW
+        # bike entry takes more, its three routes split up quickly)
+        self.entries = EntryQueues()
+        self.entries.entry(self.bikes_ew_right_px[0]).limit = 8
+
+        # ====== LOOP DETECTORS ======
+        # Presence loop at every stop line, passage loop upstream on each approach
+        actuated = config.ACTUATED_CONTROL
+        self.detectors = LoopDetectors(actuated["UPSTREAM_DISTANCE"], actuated["PRESENCE_ZONE"],
+                                       actuated["BOX_LENGTH"])
+        for group, routes in (
+            ("cars_ns", [self.cars_ns_up_px, self.cars_ns_left_px, self.cars_ns_right_px]),
+            ("cars_ew", [self.cars_ew_right_px, self.cars_ew_left_px, self.cars_ew_turn_right_px]),
+            ("ped_ns", [self.bikes_ns_up_px, self.bikes_ns_left_px, self.bikes_ns_right_px]),
+            ("ped_ew", [self.bikes_ew_right_px, self.bikes_ew_left_px, self.bikes_ew_turn_right_px,
+                        self.peds_ew_right_px]),
+        ):
+            for route in routes:
+                self.detectors.add_route(group, route)
+        if config.SIGNAL_CONTROL == "ACTUATED":
+            self.ctrl.set_actuated(self.detectors, actuated["PASSAGE_GAP"])
+        elif config.SIGNAL_CONTROL == "MAX_PRESSURE":
+            self.ctrl.set_max_pressure(self.detectors, config.MAX_PRESSURE["DECISION_INTERVAL"])
+
         # ====== TRAFFIC LIGHTS ======
         # Create visual traffic lights at intersection positions
         self.traffic_lights = []
@@ -248,6 +363,15 @@ class App:
         
         self.traffic_lights = [self.tl_car_ns, self.tl_car_ew, self.tl_ped_ns, self.tl_ped_ew]
 
+        # Lights only change (and redraw) when the controller reports a change
+        self._lights_by_group = {
+            "cars_ns": self.tl_car_ns,
+            "cars_ew": self.tl_car_ew,
+            "ped_ns": self.tl_ped_ns,
+            "ped_ew": self.tl_ped_ew,
+        }
+        self.ctrl.subscribe(self._on_signal_change)
+
         # ====== BOAT ======
         # Create boat path in river area (right side) that goes under the bridge
         river_start_x = self.size[0] * 0.72  # River starts at 72% of screen width
@@ -265,6 +389,58 @@ class App:
         
         self.boat = Boat(scale=1.0, path_px=boat_path, speed_px_s=80.0)
         self.boat_active = False  # Boat starts inactive
+
+        # ====== RIVER TRAFFIC ======
+        # Scheduled boats in one lane per direction, keeping right of the fairway
+        river = config.RIVER_TRAFFIC
+        lane_up_x = self.size[0] * 0.90
+        lane_down_x = self.size[0] * 0.80
+        self.river = RiverTraffic(
+            lanes={
+                "RIVER_UP": [(lane_up_x, self.size[1] + 50), (lane_up_x, -50)],
+                "RIVER_DOWN": [(lane_down_x, -50), (lane_down_x, self.size[1] + 50)],
+            },
+            # Same seed as the road demand, own streams (common random numbers)
+            demand=PoissonDemand(river["RATES"], seed=self.demand.seed),
+            speed=config.SPEEDS["BOAT"],
+            speed_spread=river["SPEED_SPREAD"],
+            scales=river["SCALES"],
+            max_boats=river["MAX_BOATS"],
+        )
+
+        # ====== MOVABLE BRIDGE ======
+        # Routes over the road bridge obey a gate on their signal group; the
+        # bridge controller closes the gates while it is open for boats
+        self.road_bridge_rect = world_renderer.road_bridge_rect
+        self._bridge_gate_of = {}  # id(route) -> gate name
+        self.bridge = None
+        bridge = config.BRIDGE
+        if bridge["ENABLED"]:
+            for group, route in (
+                ("cars_ew", self.cars_ew_right_px),
+                ("cars_ns", self.cars_ns_right_px),
+                ("ped_ew", self.bikes_ew_right_px),
+                ("ped_ns", self.bikes_ns_right_px),
+            ):
+                gate = f"{group}>bridge"
+                self.ctrl.add_gate(gate, group)
+                self._bridge_gate_of[id(route)] = gate
+            self.bridge = BridgeController(
+                signals=self.ctrl,
+                gates=sorted(set(self._bridge_gate_of.values())),
+                river=self.river,
+                bridge_top=self.road_bridge_rect.top,
+                bridge_bottom=self.road_bridge_rect.bottom,
+                deck_clear=self._bridge_deck_clear,
+                min_batch=bridge["MIN_BATCH"],
+                max_wait=bridge["MAX_WAIT"],
+                approach_px=bridge["APPROACH"],
+                clearance_s=bridge["CLEARANCE"],
+                raise_s=bridge["RAISE"],
+                lower_s=bridge["LOWER"],
+                max_open_s=bridge["MAX_OPEN"],
+                stats=self.stats,
+            )
         
         # ====== BOAT BUTTON ======
         self.button_width = 120
@@ -273,6 +449,12 @@ class App:
         self.button_y = self.size[1] - self.button_height - 20
         self.button_rect = pg.Rect(self.button_x, self.button_y, self.button_width, self.button_height)
         self.button_font = pg.font.Font(None, 24)
+        # Button faces by boat_active: (button color, text color, label)
+        self.boat_button = Button(self.button_rect, self.button_font, {
+            False: ((0, 150, 0), (255, 255, 255), "Start Boot"),     # Green when ready to start
+            True: ((150, 150, 150), (200, 200, 200), "Boot Actief"),  # Gray when boat is active
+        })
+        self.boat_status = Label(self.stats_font, (10, 10), (0, 255, 0))
         
         # ====== COLLISION VISUALIZATION TOGGLE ======
         self.show_collision_outlines = False
@@ -282,6 +464,10 @@ class App:
         self.collision_button_y = self.button_y
         self.collision_button_rect = pg.Rect(self.collision_button_x, self.collision_button_y, 
                                            self.collision_button_width, self.collision_button_height)
+        self.collision_button = Button(self.collision_button_rect, self.button_font, {
+            True: ((0, 100, 200), (255, 255, 255), "Collision: ON"),     # Blue when active
+            False: ((100, 100, 100), (255, 255, 255), "Collision: OFF"),  # Gray when inactive
+        })
 
         # ====== PAUSE TOGGLE ======
         self.is_paused = False
@@ -291,26 +477,55 @@ class App:
         self.pause_button_y = self.button_y
         self.pause_button_rect = pg.Rect(self.pause_button_x, self.pause_button_y, 
                                         self.pause_button_width, self.pause_button_height)
+        self.pause_button = Button(self.pause_button_rect, self.button_font, {
+            True: ((255, 100, 100), (255, 255, 255), "RESUME"),  # Red when paused
+            False: ((100, 255, 100), (0, 0, 0), "PAUSE"),        # Green when running
+        })
 
-        # Domain agents (all self-rendering)
-        self.agents = []
+        # ====== STATS OVERLAY (toggled with S) ======
+        self.show_stats_overlay = False
+        self.stats_overlay = StatsOverlay(self.stats, self.stats_font, pos=(10, 40),
+                                          refresh_s=getattr(config, "STATS_OVERLAY_REFRESH_S", 0.25))
+
+        # Domain agents (all self-rendering), swap-removed when they finish
+        self.agents = AgentRegistry()
+        # Limit total number of agents to prevent lag
+        self.max_total_agents = config.MAX_TOTAL_AGENTS if max_agents is None else max_agents
 
         # Add initial agents for immediate visual
-        for _ in range(2):
-            self._add_agent(self.car_ns_spawner.factory())
-            self._add_agent(self.car_ew_spawner.factory())
-        # Add some initial trucks
-        self._add_agent(self.truck_ns_spawner.factory())
-        self._add_agent(self.truck_ew_spawner.factory())
+        if seed_agents:
+            for _ in range(2):
+                self._add_agent(self.car_ns_spawner.spawn())
+                self._add_agent(self.car_ew_spawner.spawn())
+            # Add some initial trucks
+            self._add_agent(self.truck_ns_spawner.spawn())
+            self._add_agent(self.truck_ew_spawner.spawn())
+
+    def _on_signal_change(self, group, state):
+        """Controller change notification: update the light that shows this group."""
+        light = self._lights_by_group.get(group)
+        if light is not None:
+            light.set_active(state)
 
     def _add_agent(self, agent):
+        # Routes over the movable bridge obey its gate instead of the plain group
+        gate = self._bridge_gate_of.get(id(agent.path))
+        if gate is not None:
+            agent.bind_signal(self.ctrl.green, self.ctrl.signal_index(gate), gate)
         # Check if spawn position is safe (no collision with existing vehicles)
         if self._is_safe_spawn_position(agent):
             agent.all_agents = self.agents
             self.agents.append(agent)
+            self.entries.occupy(agent)
             return True
         return False
     
+    def _recycle(self, agent) -> None:
+        """Hand a finished road user back to its spawner's pool."""
+        spawner = self._spawner_of_kind.get((agent.signal_group, agent.get_vehicle_type()))
+        if spawner is not None:
+            spawner.recycle(agent)
+
     def _is_safe_spawn_position(self, new_agent):
         """
         Check if it's safe to spawn a new agent at its starting position.
@@ -398,110 +613,32 @@ class App:
         
         return True
     
-    def _separate_colliding_vehicles(self):
+    def _separate_colliding_vehicles(self, contacts=None):
         """
-        Emergency function to separate vehicles that are too close to each other.
+        Resolve overlaps by moving vehicles back along their routes.
         This should rarely be needed if collision prevention is working correctly.
         """
-        min_separation = 30.0  # Minimum distance between vehicle centers (reduced for closer spacing)
-        
-        for i in range(len(self.agents)):
-            for j in range(i + 1, len(self.agents)):
-                agent1 = self.agents[i]
-                agent2 = self.agents[j]
-                
-                if (getattr(agent1, 'done', False) or getattr(agent2, 'done', False)):
-                    continue
-                
-                # Calculate distance between agents
-                dx = agent2.pos[0] - agent1.pos[0]
-                dy = agent2.pos[1] - agent1.pos[1]
-                distance = math.hypot(dx, dy)
-                
-                if distance < min_separation and distance > 0:
-                    # Calculate separation vector
-                    separation_needed = min_separation - distance
-                    
-                    # Normalize direction vector
-                    nx = dx / distance
-                    ny = dy / distance
-                    
-                    # Move agents apart (each moves half the required distance)
-                    move_distance = separation_needed * 0.5
-                    
-                    agent1.pos[0] -= nx * move_distance
-                    agent1.pos[1] -= ny * move_distance
-                    agent2.pos[0] += nx * move_distance
-                    agent2.pos[1] += ny * move_distance
-                    
-                    print(f"Separated vehicles: moved {move_distance:.1f}px each")
+        corrections, distance = resolve_overlaps(self.agents, contacts)
+        if corrections:
+            self.stats.record_overlap_resolution(corrections, distance)
 
     def _draw_boat_button(self):
         """Draw the boat control button"""
-        # Button colors
-        if not self.boat_active:
-            button_color = (0, 150, 0)  # Green when ready to start
-            text_color = (255, 255, 255)
-            button_text = "Start Boot"
-        else:
-            button_color = (150, 150, 150)  # Gray when boat is active
-            text_color = (200, 200, 200)
-            button_text = "Boot Actief"
-        
-        # Draw button background
-        pg.draw.rect(self.screen, button_color, self.button_rect)
-        pg.draw.rect(self.screen, (255, 255, 255), self.button_rect, 2)  # White border
-        
-        # Draw button text
-        text_surface = self.button_font.render(button_text, True, text_color)
-        text_rect = text_surface.get_rect(center=self.button_rect.center)
-        self.screen.blit(text_surface, text_rect)
+        return self.boat_button.draw(self.screen, self.boat_active)
 
     def _draw_collision_toggle_button(self):
         """Draw the collision visualization toggle button"""
-        # Button colors
-        if self.show_collision_outlines:
-            button_color = (0, 100, 200)  # Blue when active
-            text_color = (255, 255, 255)  # White text
-            button_text = "Collision: ON"
-        else:
-            button_color = (100, 100, 100)  # Gray when inactive
-            text_color = (255, 255, 255)  # White text
-            button_text = "Collision: OFF"
-
-        # Draw button background
-        pg.draw.rect(self.screen, button_color, self.collision_button_rect)
-        pg.draw.rect(self.screen, (255, 255, 255), self.collision_button_rect, 2)  # White border
-
-        # Draw button text
-        text_surface = self.button_font.render(button_text, True, text_color)
-        text_rect = text_surface.get_rect(center=self.collision_button_rect.center)
-        self.screen.blit(text_surface, text_rect)
+        return self.collision_button.draw(self.screen, self.show_collision_outlines)
 
     def _draw_pause_button(self):
         """Draw the pause/resume toggle button"""
-        if self.is_paused:
-            button_color = (255, 100, 100)  # Red when paused
-            text_color = (255, 255, 255)    # White text
-            button_text = "RESUME"
-        else:
-            button_color = (100, 255, 100)  # Green when running
-            text_color = (0, 0, 0)          # Black text
-            button_text = "PAUSE"
-
-        # Draw button background
-        pg.draw.rect(self.screen, button_color, self.pause_button_rect)
-        pg.draw.rect(self.screen, (255, 255, 255), self.pause_button_rect, 2)  # White border
-
-        # Draw button text
-        text_surface = self.button_font.render(button_text, True, text_color)
-        text_rect = text_surface.get_rect(center=self.pause_button_rect.center)
-        self.screen.blit(text_surface, text_rect)
+        return self.pause_button.draw(self.screen, self.is_paused)
 
     def _draw_collision_outlines(self):
         """Draw blue collision outlines for all vehicles (rotated rectangles)"""
+        drawn = []
         if not self.show_collision_outlines:
-            return
+            return drawn
             
         for agent in self.agents:
             if hasattr(agent, 'pos') and not isinstance(agent, Boat):
@@ -514,7 +651,7 @@ class App:
                     int_points = [(int(x), int(y)) for x, y in corner_points]
                     
                     # Draw blue rectangle outline using polygon
-                    pg.draw.polygon(self.screen, (0, 150, 255), int_points, 2)  # 2 pixel thick outline
+                    drawn.append(pg.draw.polygon(self.screen, (0, 150, 255), int_points, 2))  # 2 pixel thick outline
                     
                 except ImportError:
                     # Fallback to axis-aligned rectangle if import fails
@@ -528,72 +665,8 @@ class App:
                     rect_y = int(agent.pos[1] - rect_height / 2)
                     collision_rect = pg.Rect(rect_x, rect_y, rect_width, rect_height)
                     
-                    pg.draw.rect(self.screen, (0, 150, 255), collision_rect, 2)
-
-    def _draw_bridge_overlay(self):
-        """Draw the bridge over the river (on top of boats)"""
-        # Bridge parameters (same as in WorldRenderer)
-        river_start_x = self.size[0] * 0.7
-        river_width = self.size[0] * 0.3
-        road_width = self.size[0] * 0.15
-        bridge_thickness = road_width * 1.2
-        bridge_y = self.size[1] / 2 - bridge_thickness / 2
-
-        # Draw main road bridge crossing the river
-        bridge_color = (80, 80, 80)  # Same as road color
-        pg.draw.rect(self.screen, bridge_color,
-                     (river_start_x, bridge_y, river_width, bridge_thickness))
-
-        # Bridge railings for road bridge (top and bottom)
-        railing_color = (60, 60, 60)
-        railing_height = int(max(2, bridge_thickness * 0.08))
-        # top railing
-        pg.draw.rect(self.screen, railing_color,
-                     (river_start_x, bridge_y - railing_height, river_width, railing_height))
-        # bottom railing
-        pg.draw.rect(self.screen, railing_color,
-                     (river_start_x, bridge_y + bridge_thickness, river_width, railing_height))
-
-        # Draw wooden pedestrian bridge (north of the main road)
-        ped_bridge_y = self.size[1] * 0.30  # Where pedestrians cross (Y=0.30 normalized)
-        ped_bridge_width = 25  # Bridge width in pixels
-        ped_bridge_thickness = 20  # Bridge thickness (verbreed van 8 naar 20 pixels)
-        
-        # Wooden bridge colors
-        wood_color = (139, 90, 43)  # Brown wood color
-        wood_dark = (101, 67, 33)  # Darker wood for planks
-        railing_wood = (160, 110, 60)  # Lighter wood for railings
-        
-        # Main wooden bridge deck
-        ped_bridge_rect = (river_start_x, ped_bridge_y - ped_bridge_thickness//2, river_width, ped_bridge_thickness)
-        pg.draw.rect(self.screen, wood_color, ped_bridge_rect)
-        
-        # Wooden planks (vertical lines across the bridge)
-        plank_spacing = 15
-        for x in range(int(river_start_x), int(river_start_x + river_width), plank_spacing):
-            pg.draw.line(self.screen, wood_dark, 
-                        (x, ped_bridge_y - ped_bridge_thickness//2),
-                        (x, ped_bridge_y + ped_bridge_thickness//2), 2)
-        
-        # Wooden railings on both sides
-        railing_height_ped = 6  # Verhoogd van 4 naar 6 pixels voor proporties
-        # Top railing
-        pg.draw.rect(self.screen, railing_wood,
-                     (river_start_x, ped_bridge_y - ped_bridge_thickness//2 - railing_height_ped, 
-                      river_width, railing_height_ped))
-        # Bottom railing  
-        pg.draw.rect(self.screen, railing_wood,
-                     (river_start_x, ped_bridge_y + ped_bridge_thickness//2, 
-                      river_width, railing_height_ped))
-        
-        # Bridge support posts (vertical supports)
-        post_width = 3
-        post_spacing = river_width // 4  # 4 posts across the bridge
-        for i in range(1, 4):  # 3 posts (excluding ends)
-            post_x = river_start_x + i * post_spacing
-            pg.draw.rect(self.screen, wood_dark,
-                        (post_x - post_width//2, ped_bridge_y - ped_bridge_thickness//2 - railing_height_ped,
-                         post_width, ped_bridge_thickness + 2*railing_height_ped))
+                    drawn.append(pg.draw.rect(self.screen, (0, 150, 255), collision_rect, 2))
+        return drawn
 
     def print_stats(self):
         """Print current simulation statistics."""
@@ -613,6 +686,226 @@ class App:
         print(f"Vehicles per minute: {stats['vehicles_per_minute']:.1f}")
         print("============================\n")
 
+    def step(self, dt: float):
+        """Advance the simulation by dt seconds (no rendering)."""
+        # Update traffic controller (fires due phase events; lights and parked
+        # agents follow through its change notifications)
+        self.ctrl.update(dt)
+        self.stats.advance_clock(dt)
+
+        # Due arrivals join the queue of their entry; queues release their
+        # head once the entry is clear (nothing is dropped)
+        now = self.ctrl.time
+        for route, actor in self.demand.pop_due(now):
+            self.entries.arrive(self.routes[route][0][0], route, actor, now)
+        self.entries.update_occupancy()
+        for entry in self.entries.ready():
+            # Only spawn below the agent limit (ready entries have room)
+            if len(self.agents) >= self.max_total_agents:
+                break
+            _, route, actor = entry.queue[0]
+            path_px, spawners = self.routes[route]
+            new_agent = spawners[actor].spawn(path_px)
+            # Only add agent if spawn position is safe, else it waits another tick
+            if self._add_agent(new_agent):
+                self.stats.record_entry_delay(self.entries.release(entry, new_agent, now))
+                self.stats.record_spawn(type(new_agent).__name__)
+                self.sleep.on_agent_arrived(new_agent)
+            else:
+                spawners[actor].recycle(new_agent)
+        self.stats.record_entry_queue(self.entries.queued)
+
+        awake = [a for a in self.agents if not getattr(a, "sleeping", False)]
+        sleepers = self.sleep.get_sleepers()
+
+        # IDM: compute the following accelerations of the awake agents lane by
+        # lane in one pass; parked ones are standing leaders
+        if config.CAR_FOLLOWING_MODEL == "IDM":
+            compute_lane_accelerations(awake, standing=sleepers)
+
+        # Plan every awake road user against the same snapshot, then move them
+        # all together in one integrator pass (parked agents are obstacles)
+        planned = []
+        for a in awake:
+            if hasattr(a, "plan"):
+                if a.plan(dt):
+                    planned.append(a)
+            else:
+                a.update(dt)  # Boat
+        integrate(planned, dt, obstacles=sleepers)
+        self.river.update(dt, now)
+        if self.bridge is not None:
+            self.bridge.update(dt, now, self._road_users_held() if self.bridge.road_closed else 0)
+        self.sleep.end_tick(dt)
+        self.detectors.update(planned, self.ctrl.time)
+
+        # Moving agents wake whoever is parked behind them; standing ones may park
+        for a in planned:
+            if a.velocity > SLEEP_SPEED_THRESHOLD:
+                self.sleep.on_agent_moved(a)
+            else:
+                self.sleep.try_park(a)
+
+        # Remove finished agents
+        for a in [a for a in self.agents if getattr(a, "done", False)]:
+            # Remove agent from list first
+            self.agents.remove(a)
+            self.sleep.on_agent_moved(a)
+            self.detectors.remove(a)
+            self.entries.remove(a)
+            
+            # Special handling for boat
+            if isinstance(a, Boat):
+                self.boat_active = False
+                print("Boot heeft zijn reis voltooid! Klik op de groene knop om opnieuw te starten.")
+            else:
+                # Record completion based on the reason for non-boat agents
+                completion_reason = getattr(a, "completion_reason", "unknown")
+                total_time = getattr(a, "total_time", 0.0)
+                stopped_time = getattr(a, "total_stopped_time", 0.0)
+                if completion_reason == "frame_exit":
+                    self.stats.record_frame_exit(type(a).__name__, total_time, stopped_time)
+                else:
+                    self.stats.record_completion(type(a).__name__, total_time, stopped_time)
+                self._recycle(a)
+
+        # Check collisions with strict no-touch policy
+        contacts = find_contact_pairs(self.agents)
+        if contacts:
+            self.stats.record_collision()
+            if config.DEBUG_MODE:
+                print(f"WARNING: {len(contacts)} overlapping pairs! Total agents: {len(self.agents)}")
+            # Push overlapping vehicles apart along their routes
+            self._separate_colliding_vehicles(contacts)
+
+    # Layer functions return the areas they drew (for dirty-rect rendering),
+    # None when an agent cannot tell
+    def _draw_boats(self, screen):
+        """Boats are drawn before the bridge so they pass under it"""
+        drawn = self.river.draw(screen)
+        drawn += [agent.draw(screen) for agent in self.agents if isinstance(agent, Boat)]
+        return drawn
+
+    def _draw_agents(self, screen):
+        visible = [agent for agent in self.agents
+                   if not isinstance(agent, Boat) and self.screen_rect.collidepoint(agent.pos)]
+        detail = self.lod.update(len(visible))
+        if detail is Detail.FULL:
+            # Agents partly on screen still show their edge
+            drawn = [agent.draw(screen) for agent in self.agents if not isinstance(agent, Boat)]
+        else:
+            drawn = [draw_agent(screen, agent, detail) for agent in visible]
+        return None if None in drawn else drawn
+
+    def _draw_bridge_barriers(self, screen):
+        """Red and white barriers at both ends of the road bridge while it is closed"""
+        if self.bridge is None or not self.bridge.road_closed:
+            return []
+        deck = self.road_bridge_rect
+        drawn = []
+        for x in (deck.left + 4, deck.right - 10):
+            barrier = pg.Rect(x, deck.top + 4, 6, deck.height - 8)
+            pg.draw.rect(screen, (255, 255, 255), barrier)
+            for y in range(barrier.top, barrier.bottom, 24):
+                pg.draw.rect(screen, (200, 0, 0), (x, y, 6, min(12, barrier.bottom - y)))
+            drawn.append(barrier)
+        return drawn
+
+    def _draw_traffic_lights(self, screen):
+        # ON TOP of the agents (so vehicles appear to drive under them)
+        return [traffic_light.draw(screen) for traffic_light in self.traffic_lights]
+
+    def _draw_hud(self, screen):
+        # Draw UI buttons
+        drawn = [self._draw_boat_button(), self._draw_collision_toggle_button(), self._draw_pause_button()]
+
+        # Draw status text if boat is active
+        if self.boat_active and self.boat in self.agents and not self.boat.done:
+            drawn.append(self.boat_status.draw(screen, "Boot vaart onder de brug door!"))
+        if self.show_stats_overlay:
+            drawn.append(self.stats_overlay.draw(screen))
+        return drawn
+
+    def render(self):
+        """Draw the current state of the simulation to the screen."""
+        # Background, boats, bridge overlay, agents, lights, outlines, HUD
+        if self.dirty_rects:
+            # Only repaint and present what moved since the last frame
+            pg.display.update(self.compositor.draw_dirty(self.screen))
+        else:
+            self.compositor.draw(self.screen)
+            pg.display.flip()
+
+    def run_headless(self, duration_s: float, dt: float = None):
+        """
+        Run the simulation without rendering for duration_s simulated seconds
+        using a fixed time step (Config.HEADLESS_DT by default). Large steps
+        are safe: the integrator never moves past leaders, stop lines or
+        waypoints. Returns the statistics summary.
+        """
+        if dt is None:
+            dt = config.HEADLESS_DT
+        sim_time = 0.0
+        while sim_time < duration_s:
+            # Nothing moves and nothing is due: jump to just before the next event
+            if self._is_idle():
+                idle = min(self._time_until_next_event(), duration_s - sim_time) - dt
+                if idle >= dt:  # Only worth it when at least one step is skipped
+                    self._fast_forward(idle)
+                    sim_time += idle
+                    continue
+            self.step(dt)
+            sim_time += dt
+        return self.stats.get_summary()
+
+    def mean_stopped_time_so_far(self) -> float:
+        """
+        Stopped time per arrival so far, counting every arrival: finished
+        trips, road users still on the map (parked time included) and the
+        wait in the entry queues, released or still queued. Unlike the
+        summary's mean_stopped_time, a jam that keeps trips from finishing
+        still adds to it.
+        """
+        on_road = [a for a in self.agents if not isinstance(a, Boat)]
+        stopped = (self.stats.total_stopped_time
+                   + sum(a.total_stopped_time + self.sleep.slept(a) for a in on_road)
+                   + self.stats.total_entry_delay + self.entries.pending_delay(self.ctrl.time))
+        arrivals = self.stats.vehicles_served + len(on_road) + self.entries.queued
+        return stopped / arrivals if arrivals else 0.0
+
+    def _bridge_deck_clear(self) -> bool:
+        """True when no road user is on the road bridge"""
+        deck = self.road_bridge_rect
+        return not any(deck.collidepoint(a.pos) for a in self.agents if not isinstance(a, Boat))
+
+    def _road_users_held(self) -> int:
+        """Road users standing while their own signal group is green (held by a closed gate)"""
+        green = {name: self.ctrl.green[g] for g, name in enumerate(self.ctrl.SIGNAL_GROUPS)}
+        return sum(1 for a in self.agents
+                   if not isinstance(a, Boat) and green.get(a.signal_group, False)
+                   and getattr(a, "velocity", 0.0) <= SLEEP_SPEED_THRESHOLD)
+
+    def _is_idle(self) -> bool:
+        """True when every agent is parked (no boat, nobody moving)."""
+        return not self.river.active and all(getattr(a, "sleeping", False) for a in self.agents)
+
+    def _time_until_next_event(self) -> float:
+        """Time until a signal change or spawn could change the scene."""
+        wait = min(self.ctrl.time_until_next_transition(), self.river.time_until_next(self.ctrl.time))
+        if self.bridge is not None:
+            wait = min(wait, self.bridge.time_until_next())
+        if len(self.agents) < self.max_total_agents:
+            wait = min(wait, self.demand.time_until_next(self.ctrl.time))
+            if next(self.entries.ready(), None) is not None:
+                wait = 0.0  # A queued arrival can spawn right away
+        return wait
+
+    def _fast_forward(self, duration: float) -> None:
+        """Advance the clocks over an idle stretch without ticking any agent."""
+        self.ctrl.update(duration)
+        self.stats.advance_clock(duration)
+        self.sleep.end_tick(duration)
+
     def run(self):
         running = True
         last_stats_time = time.time()
@@ -631,14 +924,14 @@ class App:
             for e in pg.event.get():
                 if e.type == pg.QUIT or (e.type == pg.KEYDOWN and e.key == pg.K_ESCAPE):
                     running = False
+                elif e.type == pg.KEYDOWN and e.key == pg.K_s:
+                    self.show_stats_overlay = not self.show_stats_overlay
                 elif e.type == pg.MOUSEBUTTONDOWN and e.button == 1:  # Left mouse click
                     if self.button_rect.collidepoint(e.pos):
                         # Clicked on boat button
                         if not self.boat_active:
                             self.boat_active = True
-                            self.boat.i = 0  # Reset to start of path
-                            self.boat.pos = list(self.boat.path[0])  # Reset position
-                            self.boat.done = False
+                            self.boat.reset(self.boat.path)  # Back to the start of its path
                             if self.boat not in self.agents:
                                 self.agents.append(self.boat)
                             print("Boot gestart via knop!")
@@ -653,130 +946,9 @@ class App:
 
             # Only update simulation if not paused
             if not self.is_paused:
-                # Update traffic controller
-                self.ctrl.update(dt)
-                
-                # Update traffic light visual states
-                self.tl_car_ns.set_active(self.ctrl.cars_ns.state)
-                self.tl_car_ew.set_active(self.ctrl.cars_ew.state)
-                self.tl_ped_ns.set_active(self.ctrl.ped_ns.state)
-                self.tl_ped_ew.set_active(self.ctrl.ped_ew.state)
-
-                # Spawn new agents
-                spawn_items = [
-                    (self.car_ns_spawner, self.cars_ns_up_px),
-                    (self.car_ew_spawner, self.cars_ew_right_px),  # East-West cars
-                    (self.truck_ns_spawner, self.cars_ns_up_px),   # North-South trucks using same paths as cars
-                    (self.truck_ew_spawner, self.cars_ew_right_px), # East-West trucks using same paths as cars
-                    (self.bike_ns_spawner, self.bikes_ns_up_px),   # North-South bikes (multiple paths)
-                    (self.bike_ew_spawner, self.bikes_ew_right_px), # East-West bikes (multiple paths)
-                    (self.ped_ew_spawner, self.peds_ew_right_px),
-                ]
-
-                # Limit total number of agents to prevent lag
-                max_total_agents = 30
-                
-                for sp, path_px in spawn_items:
-                    # Only spawn if we haven't reached the limit
-                    if len(self.agents) < max_total_agents:
-                        # Special handling for EW bike spawner (multiple paths)
-                        if sp == self.bike_ew_spawner:
-                            # Check all possible EW bike spawn points
-                            ew_bike_paths = [self.bikes_ew_right_px, self.bikes_ew_left_px, self.bikes_ew_turn_right_px]
-                            allow_spawn = lambda: sum(
-                                1 for a in self.agents
-                                if getattr(a, "path", None) and any(
-                                    a.path[0] == bp[0] for bp in ew_bike_paths
-                                ) and not getattr(a, "done", False)
-                                and any(
-                                    ((a.pos[0]-bp[0][0])**2 + (a.pos[1]-bp[0][1])**2)**0.5 < 180 
-                                    for bp in ew_bike_paths
-                                )
-                            ) < 8  # Allow more EW bikes since they have multiple paths
-                        else:
-                            # Standard single-path spawning
-                            allow_spawn = lambda p=path_px: sum(
-                                1 for a in self.agents
-                                if getattr(a, "path", None) and a.path[0] == p[0] and not getattr(a, "done", False)
-                                and ((a.pos[0]-p[0][0])**2 + (a.pos[1]-p[0][1])**2)**0.5 < 180
-                            ) < 3  # Reduced from 4 to 3 per spawn point
-                        
-                        new_agent = sp.update(dt, allow_spawn=allow_spawn)
-                        if new_agent:
-                            # Only add agent if spawn position is safe
-                            if self._add_agent(new_agent):
-                                self.stats.record_spawn(type(new_agent).__name__)
-                            # If spawn position is not safe, the agent is discarded
-
-                # Update agents
-                for a in list(self.agents):
-                    a.update(dt)
-                    if getattr(a, "done", False):
-                        # Remove agent from list first
-                        self.agents.remove(a)
-                        
-                        # Special handling for boat
-                        if isinstance(a, Boat):
-                            self.boat_active = False
-                            print("Boot heeft zijn reis voltooid! Klik op de groene knop om opnieuw te starten.")
-                        else:
-                            # Record completion based on the reason for non-boat agents
-                            completion_reason = getattr(a, "completion_reason", "unknown")
-                            if completion_reason == "frame_exit":
-                                self.stats.record_frame_exit(type(a).__name__, getattr(a, "total_time", 0.0))
-                            else:
-                                self.stats.record_completion(type(a).__name__, getattr(a, "total_time", 0.0))
-
-                # Check collisions with strict no-touch policy
-                collisions = check_collisions(self.agents, min_dist=35.0)  # Increased to prevent any touching
-                if collisions:
-                    self.stats.record_collision()
-                    # Log collision details for debugging
-                    print(f"WARNING: Vehicles too close! Total agents: {len(self.agents)}")
-                    # Attempt to separate colliding vehicles
-                    self._separate_colliding_vehicles()
+                self.step(dt)
 
             # === RENDER ===
-            screen_fill_color = (40, 44, 52)
-            
-            # First draw basic background (without bridge)
-            if self.background:
-                # Draw everything except the bridge part
-                temp_surface = self.background.copy()
-                self.screen.blit(temp_surface, (0, 0))
-            else:
-                self.screen.fill(screen_fill_color)
-
-            # Draw boat first (so it appears under the bridge)
-            boat_agents = [agent for agent in self.agents if isinstance(agent, Boat)]
-            for boat in boat_agents:
-                boat.draw(self.screen)
-
-            # Now draw the bridge on top of the boat
-            self._draw_bridge_overlay()
-
-            # Draw all other agents (cars, trucks, etc.) FIRST
-            for agent in self.agents:
-                if not isinstance(agent, Boat):
-                    agent.draw(self.screen)
-
-            # Draw traffic lights ON TOP (so vehicles appear to drive under them)
-            for traffic_light in self.traffic_lights:
-                traffic_light.draw(self.screen)
-
-            # Draw collision outlines if enabled (on top of everything except UI)
-            self._draw_collision_outlines()
-
-            # Draw UI buttons
-            self._draw_boat_button()
-            self._draw_collision_toggle_button()
-            self._draw_pause_button()
-            
-            # Draw status text if boat is active
-            if self.boat_active and self.boat in self.agents and not self.boat.done:
-                status_text = self.stats_font.render("Boot vaart onder de brug door!", True, (0, 255, 0))
-                self.screen.blit(status_text, (10, 10))
-
-            pg.display.flip()
+            self.render()
 
-        pg.quit()
\ No newline at end of file
+        pg.quit()
@@ -0,0 +1,230 @@
+# src/traffic_sim/core/signal_optimiser.py
+"""
+Offline signal-timing optimiser.
+
+Searches the fixed-time plan of the intersection (green per phase, amber and
+all-red per kind of signal group, and with them the cycle length) by
+coordinate descent. Every candidate plan is scored by headless replications
+over the same seeds (common random numbers), run in parallel worker
+processes:
+
+    score = completions per simulated hour - STOP_WEIGHT * mean stopped time
+
+The mean stopped time is over every arrival (App.mean_stopped_time_so_far):
+road users still on the map and arrivals waiting at the entries count too,
+so a plan that jams the intersection cannot hide its delay behind the few
+trips that finish. Replications start with an empty road (no seed agents).
+
+The best plan is written as a phase table JSON, ready for
+Config.PHASE_TABLE_FILE with SIGNAL_CONTROL = "FIXED".
+
+    python -m traffic_sim.core.signal_optimiser --output plan.json
+"""
+import argparse
+import contextlib
+import copy
+import io
+import json
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+if __name__ == "__main__":
+    src_path = Path(__file__).resolve().parents[2]
+    if str(src_path) not in sys.path:
+        sys.path.insert(0, str(src_path))
+try:
+    from ..configuration import Config
+    from ..domain.world.phase_table import DEFAULT_PHASE_TABLE, compile_phase_table
+except ImportError:
+    from traffic_sim.configuration import Config
+    from traffic_sim.domain.world.phase_table import DEFAULT_PHASE_TABLE, compile_phase_table
+
+# Searched parameters: name -> (minimum, maximum, initial step) in seconds.
+# "green.<phase>" is a phase's green time, "amber.<kind>" / "all_red.<kind>"
+# apply to every signal group whose name starts with <kind>.
+SEARCH_SPACE = {
+    "green.NS_CARS_GREEN": (4.0, 30.0, 2.0),
+    "green.EW_CARS_GREEN": (4.0, 30.0, 2.0),
+    "green.NS_PED_BIKE":   (3.0, 20.0, 2.0),
+    "green.EW_PED_BIKE":   (3.0, 20.0, 2.0),
+    "amber.cars":          (2.0, 4.0, 0.5),
+    "all_red.cars":        (0.0, 3.0, 1.0),
+    "all_red.ped":         (0.0, 3.0, 1.0),
+}
+
+# Completions per hour one second of mean stopped time is worth
+STOP_WEIGHT = 10.0
+
+
+def plan_from_table(table: dict) -> Dict[str, float]:
+    """Read the searched parameters from a phase table."""
+    plan = {}
+    for name in SEARCH_SPACE:
+        kind, key = name.split(".", 1)
+        if kind == "green":
+            plan[name] = float(table["phases"][key]["green"])
+        else:
+            values = [g[kind] for group, g in table["signal_groups"].items() if group.startswith(key)]
+            plan[name] = float(max(values, default=0.0))
+    return plan
+
+
+def table_from_plan(plan: Dict[str, float], base: Optional[dict] = None) -> dict:
+    """A copy of the base phase table with the plan's timings filled in."""
+    table = copy.deepcopy(base if base is not None else DEFAULT_PHASE_TABLE)
+    for name, value in plan.items():
+        kind, key = name.split(".", 1)
+        if kind == "green":
+            phase = table["phases"][key]
+            phase["green"] = value
+            # Keep the actuated bounds around the fixed green time
+            phase["min_green"] = min(phase.get("min_green", value), value)
+            phase["max_green"] = max(phase.get("max_green", value), value)
+        else:
+            for group, settings in table["signal_groups"].items():
+                if group.startswith(key):
+                    settings[kind] = value
+    return table
+
+
+def score(throughput_per_hour: float, mean_stopped_time: float) -> float:
+    return throughput_per_hour - STOP_WEIGHT * mean_stopped_time
+
+
+def run_replication(table: dict, seed: int, duration_s: float, dt: float) -> tuple:
+    """One headless run of a fixed-time plan: (completions per hour, mean stopped time per arrival)."""
+    try:
+        from .app import App
+    except ImportError:
+        from traffic_sim.core.app import App
+
+    control, Config.SIGNAL_CONTROL = Config.SIGNAL_CONTROL, "FIXED"
+    random.seed(seed)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            app = App(headless=True, phase_table=table, seed_agents=False)
+            summary = app.run_headless(duration_s, dt)
+    finally:
+        Config.SIGNAL_CONTROL = control
+    completions = sum(summary["completions"].values())
+    return completions * 3600.0 / duration_s, app.mean_stopped_time_so_far()
+
+
+def _run_replication_args(args):
+    return run_replication(*args)
+
+
+class ReplicationEvaluator:
+    """Scores plans by the mean of their replications over fixed seeds, in parallel."""
+
+    def __init__(self, seeds: Sequence[int], duration_s: float, dt: float, workers: Optional[int] = None,
+                 base_table: Optional[dict] = None):
+        self.seeds = list(seeds)
+        self.duration_s = duration_s
+        self.dt = dt
+        self.base_table = base_table
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+        self.results: Dict[tuple, tuple] = {}  # plan -> (score, throughput, stopped)
+
+    def evaluate(self, plans: List[Dict[str, float]]) -> List[float]:
+        """Scores of several plans; all their replications run side by side."""
+        todo = [p for p in {tuple(sorted(p.items())) for p in plans} if p not in self.results]
+        jobs = [(table_from_plan(dict(p), self.base_table), seed, self.duration_s, self.dt)
+                for p in todo for seed in self.seeds]
+        outcomes = list(self.pool.map(_run_replication_args, jobs))
+        n = len(self.seeds)
+        for k, key in enumerate(todo):
+            runs = outcomes[k * n:(k + 1) * n]
+            throughput = sum(r[0] for r in runs) / n
+            stopped = sum(r[1] for r in runs) / n
+            self.results[key] = (score(throughput, stopped), throughput, stopped)
+        return [self.results[tuple(sorted(p.items()))][0] for p in plans]
+
+    def details(self, plan: Dict[str, float]) -> tuple:
+        return self.results[tuple(sorted(plan.items()))]
+
+    def close(self):
+        self.pool.shutdown()
+
+
+def coordinate_descent(evaluate: Callable[[List[Dict[str, float]]], List[float]],
+                       start: Dict[str, float], space: Dict[str, tuple] = None,
+                       min_step: float = 0.25, max_rounds: int = 10,
+                       log: Callable[[str], None] = None) -> tuple:
+    """
+    Maximise evaluate() one parameter at a time: try a step down and up,
+    keep the best, and halve all steps after a round without improvement.
+    Returns (best plan, best score).
+    """
+    space = space or SEARCH_SPACE
+    steps = {name: space[name][2] for name in start}
+    best = dict(start)
+    best_score = evaluate([best])[0]
+    for round_no in range(max_rounds):
+        improved = False
+        for name in best:
+            low, high, _ = space[name]
+            candidates = []
+            for direction in (-1, 1):
+                value = min(high, max(low, best[name] + direction * steps[name]))
+                if value != best[name]:
+                    candidates.append(dict(best, **{name: value}))
+            if not candidates:
+                continue
+            for candidate, candidate_score in zip(candidates, evaluate(candidates)):
+                if candidate_score > best_score:
+                    best, best_score, improved = candidate, candidate_score, True
+        if log:
+            log(f"round {round_no + 1}: score {best_score:.1f} {best}")
+        if not improved:
+            steps = {name: step / 2 for name, step in steps.items()}
+            if max(steps.values()) < min_step:
+                break
+    return best, best_score
+
+
+def describe_plan(table: dict) -> str:
+    """Green/amber/red per signal group and the cycle length of a phase table."""
+    compiled = compile_phase_table(table)
+    cycle = compiled.cycle_length
+    lines = [f"Cycle length: {cycle:.1f}s"]
+    for g, group in enumerate(compiled.group_names):
+        green = sum(compiled.green[s] for s, groups in enumerate(compiled.stage_groups) if g in groups)
+        amber = compiled.amber[g]
+        lines.append(f"  {group:8s} green {green:5.1f}s  amber {amber:4.1f}s  red {cycle - green - amber:5.1f}s")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Optimise the fixed-time signal plan with headless runs")
+    parser.add_argument("--seeds", type=int, default=4, help="replications per candidate plan")
+    parser.add_argument("--duration", type=float, default=600.0, help="simulated seconds per replication")
+    parser.add_argument("--dt", type=float, default=Config.HEADLESS_DT, help="headless time step")
+    parser.add_argument("--workers", type=int, default=None, help="parallel worker processes")
+    parser.add_argument("--rounds", type=int, default=10, help="maximum coordinate descent rounds")
+    parser.add_argument("--output", default="signal_plan.json", help="phase table JSON to write")
+    args = parser.parse_args(argv)
+
+    evaluator = ReplicationEvaluator(range(1, args.seeds + 1), args.duration, args.dt, args.workers)
+    try:
+        start = plan_from_table(DEFAULT_PHASE_TABLE)
+        start_score, throughput, stopped = evaluator.evaluate([start])[0], *evaluator.details(start)[1:]
+        print(f"Current plan: score {start_score:.1f} ({throughput:.0f}/h, stopped {stopped:.1f}s)")
+        best, best_score = coordinate_descent(evaluator.evaluate, start, max_rounds=args.rounds, log=print)
+        _, throughput, stopped = evaluator.details(best)
+    finally:
+        evaluator.close()
+
+    table = table_from_plan(best)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(table, f, indent=2)
+    print(f"Best plan: score {best_score:.1f} ({throughput:.0f}/h, stopped {stopped:.1f}s)")
+    print(describe_plan(table))
+    print(f"Written to {args.output} (set Config.PHASE_TABLE_FILE and SIGNAL_CONTROL = \"FIXED\")")
+
+
+if __name__ == "__main__":
+    main()
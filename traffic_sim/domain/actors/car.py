@@ -1,7 +1,7 @@
 import pygame
 import sys
 import math
-from typing import List, Tuple, Callable
+from typing import List, Tuple, Callable, Optional
 from pathlib import Path
 
 if __name__ == "__main__":
@@ -13,9 +13,11 @@ if __name__ == "__main__":
 try:
     from ...configuration import Config
     from .road_users import RoadUser
+    from ...render.sprites import rotated_sprite
 except ImportError:
     from traffic_sim.configuration import Config
     from traffic_sim.domain.actors.road_users import RoadUser
+    from traffic_sim.render.sprites import rotated_sprite
 
 config = Config()
 
@@ -36,6 +38,9 @@ class Car(RoadUser):
     centered at the actor position (self.pos).
     """
 
+    _SURFACE_ATTRS = ("_car_surf",)
+    _LOOK_ATTRS = ("width", "length", "color", "roof_color")
+
     def __init__(
         self,
         path_px: List[Vec2],
@@ -44,7 +49,7 @@ class Car(RoadUser):
         car_length: int = 64, # Reduced from 80 to 64 (20% smaller: 80 * 0.8 = 64)
         color=RED,
         roof_color=BLUE,
-        can_cross_ok: Callable[[], bool] = lambda: True,
+        can_cross_ok: Optional[Callable[[], bool]] = None,
     ):
         super().__init__(path_px, speed_px_s, can_cross_ok)
         # keep same naming as previous file for visuals
@@ -52,7 +57,7 @@ class Car(RoadUser):
         self.length = float(car_length)
         self.color = color
         self.roof_color = roof_color
-        self._car_surf = self._create_surface()
+        self._car_surf = self._shared_surface()
 
     def _create_surface(self) -> pygame.Surface:
         CAR_W, CAR_H = int(self.width), int(self.length)
@@ -76,25 +81,27 @@ class Car(RoadUser):
 
         return surf
 
-    def draw(self, surface: pygame.Surface) -> None:
-        """Draw car centered at its current position with rotation."""
+    def draw(self, surface: pygame.Surface) -> Optional[pygame.Rect]:
+        """Draw car centered at its current position with rotation; returns the area drawn."""
         x, y = int(round(self.pos[0])), int(round(self.pos[1]))
         
         # Get rotation from parent RoadUser class
         angle = super().get_rotation()
         
-        # Rotate the car surface
-        rotated = pygame.transform.rotate(self._car_surf, angle)
+        # Rotated sprite from the cache (quantised heading)
+        rotated = rotated_sprite(self._car_surf, angle)
         
         # Get the new rect centered at our position
         rect = rotated.get_rect(center=(x, y))
         
         # Draw the rotated surface
-        surface.blit(rotated, rect)
+        drawn = surface.blit(rotated, rect)
         
         # Draw following distance indicator if debug mode is enabled
         if config.DEBUG_MODE and config.SHOW_FOLLOWING_DISTANCE:
             self._draw_following_distance_debug(surface)
+            return None  # Debug lines reach other agents: area unknown
+        return drawn
     
     def _draw_following_distance_debug(self, surface: pygame.Surface) -> None:
         """Draw visual indicators for following distance (debug mode only)."""
@@ -142,11 +149,13 @@ class Car(RoadUser):
             car_length=int(self.length),
             color=self.color,
             roof_color=self.roof_color,
-            can_cross_ok=self._can_cross,
+            can_cross_ok=self._can_cross_ok,
         )
         new.pos = list(self.pos)
         new.i = self.i
         new.done = self.done
+        new.signal_group = self.signal_group
+        new.bind_signal(self.signal_flags, self.signal_index, self.signal_key)
         return new
 
 # Simple demo loop when run as a script
@@ -1,7 +1,7 @@
 # src/traffic_sim/domain/actors/cyclist.py
 import pygame
 import sys
-from typing import List, Tuple, Callable
+from typing import List, Tuple, Callable, Optional
 import math
 from pathlib import Path
 
@@ -16,9 +16,11 @@ if __name__ == "__main__":
 try:
     from ...configuration import Config
     from .road_users import RoadUser
+    from ...render.sprites import rotated_sprite
 except ImportError:
     from traffic_sim.configuration import Config
     from traffic_sim.domain.actors.road_users import RoadUser
+    from traffic_sim.render.sprites import rotated_sprite
 
 Vec2 = Tuple[float, float]
 config = Config()
@@ -28,11 +30,14 @@ class Cyclist(RoadUser):
     Fietser (logica): volgt waypoints, houdt evt. bij het kruispunt stil op rood.
     Geen tekenwerk/pygame hier.
     """
+    _SURFACE_ATTRS = ("_cyclist_surf",)
+    _LOOK_ATTRS = ("color", "skin", "hair", "scale", "radius")
+
     def __init__(
         self,
         path_px: List[Vec2],
         speed_px_s: float = config.SPEEDS["CYCLIST"],  # Use config speed
-        can_cross_ok: Callable[[], bool] = lambda: True,
+        can_cross_ok: Optional[Callable[[], bool]] = None,
         color: Tuple[int, int, int] = config.BLUE,  # Use config colors
         skin: Tuple[int, int, int] = (230, 190, 160),
         hair: Tuple[int, int, int] = (100, 60, 30),
@@ -45,7 +50,7 @@ class Cyclist(RoadUser):
         self.scale = float(scale)
         self.radius = max(4, int(config.COLLISION_RADIUS["CYCLIST"] * self.scale))  # Use config radius
         # Create surface for rotation
-        self._cyclist_surf = self._create_surface()
+        self._cyclist_surf = self._shared_surface()
 
     def _S(self, value: float) -> int:
         return max(1, int(round(value * self.scale)))
@@ -99,21 +104,21 @@ class Cyclist(RoadUser):
 
         return surf
 
-    def draw(self, surface: pygame.Surface) -> None:
-        """Draw cyclist at current position with rotation."""
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        """Draw cyclist at current position with rotation; returns the area drawn."""
         x, y = int(round(self.pos[0])), int(round(self.pos[1]))
         
         # Get rotation from RoadUser parent class
         angle = self.get_rotation()
         
-        # Rotate the surface
-        rotated = pygame.transform.rotate(self._cyclist_surf, angle)
+        # Rotated sprite from the cache (quantised heading)
+        rotated = rotated_sprite(self._cyclist_surf, angle)
         
         # Get the new rect centered at our position
         rect = rotated.get_rect(center=(x, y))
         
         # Draw the rotated surface
-        surface.blit(rotated, rect)
+        return surface.blit(rotated, rect)
 
     # Als je fietsspecifieke logica hebt, voeg die hier toe (bijv. prefer bike lanes)
     # def update(self, dt: float):
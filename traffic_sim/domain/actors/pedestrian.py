@@ -1,6 +1,6 @@
 import pygame
 import sys
-from typing import Tuple, List, Callable
+from typing import Tuple, List, Callable, Optional
 from pathlib import Path
 
 # Add src to Python path when running directly
@@ -13,9 +13,11 @@ if __name__ == "__main__":
 try:
     from ...configuration import Config
     from .road_users import RoadUser
+    from ...render.sprites import rotated_sprite
 except ImportError:
     from traffic_sim.configuration import Config
     from traffic_sim.domain.actors.road_users import RoadUser
+    from traffic_sim.render.sprites import rotated_sprite
 
 Vec2 = Tuple[float, float]
 config = Config()
@@ -51,11 +53,14 @@ class Pedestrian(RoadUser):
     It uses self.pos (list of floats) updated by RoadUser.update().
     """
 
+    _SURFACE_ATTRS = ("_ped_surf",)
+    _LOOK_ATTRS = ("color", "skin", "hair", "scale", "radius")
+
     def __init__(
         self,
         path_px: List[Tuple[float, float]],
         speed_px_s: float = config.SPEEDS["PEDESTRIAN"],
-        can_cross_ok: Callable[[], bool] = lambda: True,
+        can_cross_ok: Optional[Callable[[], bool]] = None,
         color: Tuple[int, int, int] = config.BLUE,
         skin: Tuple[int, int, int] = (255, 224, 189),
         hair: Tuple[int, int, int] = (80, 50, 20),
@@ -67,7 +72,7 @@ class Pedestrian(RoadUser):
         self.hair = hair
         self.scale = float(scale)
         self.radius = max(4, int(config.COLLISION_RADIUS["PEDESTRIAN"] * self.scale))
-        self._ped_surf = self._create_surface()
+        self._ped_surf = self._shared_surface()
 
     def _S(self, v: float) -> int:
         return max(1, int(round(v * self.scale)))
@@ -108,21 +113,21 @@ class Pedestrian(RoadUser):
         
         return surf
 
-    def draw(self, surface: pygame.Surface) -> None:
-        """Draw pedestrian at current position with rotation."""
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        """Draw pedestrian at current position with rotation; returns the area drawn."""
         x, y = int(round(self.pos[0])), int(round(self.pos[1]))
         
         # Get rotation from parent RoadUser class
         angle = -super().get_rotation()
         
-        # Rotate the surface
-        rotated = pygame.transform.rotate(self._ped_surf, angle)
+        # Rotated sprite from the cache (quantised heading)
+        rotated = rotated_sprite(self._ped_surf, angle)
         
         # Get centered rect
         rect = rotated.get_rect(center=(x, y))
         
         # Draw
-        surface.blit(rotated, rect)
+        return surface.blit(rotated, rect)
 
 # Demo runner
 if __name__ == "__main__":
@@ -4,20 +4,102 @@ import math
 Vec2 = Tuple[float, float]
 
 class RoadUser:
-    def __init__(self, path_px: List[Vec2], speed_px_s: float, can_cross_ok: Callable[[], bool]):
+    # Attributes holding a pygame Surface (shared per look, see
+    # _shared_surface); dropped when pickling and looked up again on load
+    _SURFACE_ATTRS: Tuple[str, ...] = ()
+    # Attributes describing how the agent looks: the sprite cache key, kept
+    # when the agent is recycled
+    _LOOK_ATTRS: Tuple[str, ...] = ()
+    # Attribute with the colour of the cheap drawings (render/lod.py)
+    LOD_COLOR_ATTR = "color"
+
+    def __init__(self, path_px: List[Vec2], speed_px_s: float,
+                 can_cross_ok: Optional[Callable[[], bool]] = None):
         self.path = path_px
         self.i = 0
         self.pos = list(path_px[0]) if path_px else [0.0, 0.0]
         self.speed = speed_px_s
         self.radius = 10
         self.done = False
-        self._can_cross = can_cross_ok
+        self._can_cross_ok = can_cross_ok  # Fallback when not bound to a signal table
+        # Signal broadcast table: the Controller's green flags (shared list) and
+        # our group's index into it, see bind_signal()
+        self.signal_flags: Optional[List[bool]] = None
+        self.signal_index: Optional[int] = None
+        # Name of the flag when it is not our signal group's own (a gate, see
+        # Controller.add_gate); its change notifications wake us when parked
+        self.signal_key: Optional[str] = None
         # kruispunt-regel: index van punt dicht bij de kruising waar we moeten kunnen oversteken
         self.cross_index: Optional[int] = self._guess_cross_index()
         self.last_rotation = 0.0  # in graden, voor tekenwerk e.d.
         self.total_time = 0.0  # Track total time for statistics
         self.stopped_time = 0.0  # Track how long vehicle has been stopped
+        self.total_stopped_time = 0.0  # All time spent standing still (statistics)
         self.completion_reason = "unknown"  # Track why vehicle was marked as done
+        self.velocity = float(speed_px_s)  # Current speed along the path (px/s)
+        # Car-following state filled in by the lane kernel (services/car_following.py)
+        self.idm_acceleration: Optional[float] = None
+        self.idm_gap = float('inf')
+        self.idm_max_advance = float('inf')
+        self.idm_leader = None  # Leader whose gap limits us (None when free road or stop line)
+        # Movement plan for the kinematic integrator (services/kinematics.py)
+        self.acceleration = 0.0
+        self.desired_acceleration = 0.0
+        self.max_advance = float('inf')  # Furthest we may move this tick (leader / stop line)
+        self.hard_stop = False           # Collision prevention: stop dead this tick
+        self._ticks_since_safety_check = 0
+        self._safety_conflict = False
+        self._cum_lengths_path = None
+        self._cum_lengths: List[float] = []
+        # Sleeping (services/sleeping.py): why we are standing still, so a parked
+        # agent can be woken by its signal group or by its leader moving
+        self.signal_group: Optional[str] = None
+        self.wait_reason: Optional[str] = None   # "signal", "leader" or None
+        self.blocking_leader = None
+        self.sleeping = False
+        self._parked_since = 0.0
+
+    def reset(self, path_px: List[Vec2], speed_px_s: float) -> None:
+        """
+        Reinitialise a recycled agent in place for a new trip: all state as
+        freshly constructed, same looks and surfaces (see Spawner.recycle).
+        """
+        look = {name: getattr(self, name) for name in self._LOOK_ATTRS + self._SURFACE_ATTRS}
+        self.__dict__.clear()
+        RoadUser.__init__(self, path_px, speed_px_s)
+        self.__dict__.update(look)
+
+    def bind_signal(self, flags: List[bool], index: Optional[int], key: Optional[str] = None) -> None:
+        """Obey signal group (or gate `key`) `index` of the Controller's green flag array."""
+        self.signal_flags = flags
+        self.signal_index = index
+        self.signal_key = key
+
+    def _can_cross(self) -> bool:
+        """May we pass the stop line: a lookup in the signal table, else the callback."""
+        if self.signal_index is not None:
+            return self.signal_flags[self.signal_index]
+        return self._can_cross_ok is None or self._can_cross_ok()
+
+    def _shared_surface(self):
+        """Our sprite from the shared cache (render/sprites.py), drawn once per look."""
+        try:
+            from ...render.sprites import get_sprite
+        except ImportError:
+            from traffic_sim.render.sprites import get_sprite
+        key = (type(self).__name__,) + tuple(getattr(self, name) for name in self._LOOK_ATTRS)
+        return get_sprite(key, self._create_surface)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in self._SURFACE_ATTRS:
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for name in self._SURFACE_ATTRS:
+            setattr(self, name, self._shared_surface())
 
     def get_vehicle_type(self) -> str:
         """Get the vehicle type name for configuration lookup."""
@@ -39,6 +121,50 @@ class RoadUser:
         else:
             return config.VEHICLE_SPACING["DEFAULT"]
 
+    def get_idm_settings(self) -> dict:
+        """Get vehicle-specific Intelligent Driver Model parameters from configuration."""
+        try:
+            from ...configuration import Config
+        except ImportError:
+            from traffic_sim.configuration import Config
+        
+        vehicle_type = self.get_vehicle_type()
+        return Config.IDM_PARAMS.get(vehicle_type, Config.IDM_PARAMS["DEFAULT"])
+
+    def get_lane_key(self) -> Optional[Vec2]:
+        """Agents whose paths start at the same point share a lane (same approach)."""
+        if not self.path:
+            return None
+        return tuple(self.path[0])
+
+    def _path_cumulative_lengths(self) -> List[float]:
+        """Cumulative arc length at each waypoint, cached per path."""
+        if self._cum_lengths_path is not self.path:
+            lengths = [0.0]
+            for a, b in zip(self.path, self.path[1:]):
+                lengths.append(lengths[-1] + math.hypot(b[0] - a[0], b[1] - a[1]))
+            self._cum_lengths = lengths
+            self._cum_lengths_path = self.path
+        return self._cum_lengths
+
+    def get_progress(self) -> float:
+        """Arc length travelled along the path (pixels)."""
+        if not self.path:
+            return 0.0
+        cum = self._path_cumulative_lengths()
+        i = min(self.i, len(self.path) - 1)
+        start = self.path[i]
+        if i >= len(self.path) - 1:
+            # Past the last waypoint: keep counting in the exit direction
+            return cum[-1] + math.hypot(self.pos[0] - start[0], self.pos[1] - start[1])
+        end = self.path[i + 1]
+        seg_len = cum[i + 1] - cum[i]
+        if seg_len <= 0:
+            return cum[i]
+        along = ((self.pos[0] - start[0]) * (end[0] - start[0]) +
+                 (self.pos[1] - start[1]) * (end[1] - start[1])) / seg_len
+        return cum[i] + max(0.0, along)
+
     def get_rotation(self) -> float:
         """Calculate the angle in degrees the actor should face based on movement direction."""
         # If we're in exit mode (past last waypoint), use exit direction
@@ -208,11 +334,12 @@ class RoadUser:
                 temp_vehicle = type(self)(self.path, self.speed, 
                                         car_width=int(getattr(self, 'width', 40)), 
                                         car_length=int(getattr(self, 'length', 64)),
-                                        can_cross_ok=self._can_cross)
+                                        can_cross_ok=self._can_cross_ok)
             else:
                 # For other vehicle types, use original constructor
-                temp_vehicle = type(self)(self.path, self.speed, self._can_cross)
+                temp_vehicle = type(self)(self.path, self.speed, self._can_cross_ok)
             
+            temp_vehicle.bind_signal(self.signal_flags, self.signal_index, self.signal_key)
             temp_vehicle.pos = list(position)
             temp_vehicle.i = self.i  # Copy path index for rotation calculation
         except Exception:
@@ -309,9 +436,98 @@ class RoadUser:
         # Ensure minimum following distance for this vehicle type
         desired_distance = max(desired_distance, collision_settings["MIN_FOLLOWING_DISTANCE"])
         
-        return calculate_safe_following_speed(
+        # Never close in further than the following distance in a single step
+        self.max_advance = min(self.max_advance, max(0.0, distance_to_ahead - desired_distance))
+        
+        factor = calculate_safe_following_speed(
             self, vehicle_ahead, distance_to_ahead, desired_distance
         )
+        if factor == 0.0:
+            self.wait_reason, self.blocking_leader = "leader", vehicle_ahead
+        return factor
+
+    def _calculate_desired_acceleration(self, dt: float) -> float:
+        """
+        Acceleration this agent asks the integrator for. IDM supplies it
+        directly (from the per-lane kernel run by the App, or computed here for
+        standalone agents); the binary rule asks to reach full speed or a
+        standstill within one tick, which the integrator then limits.
+        """
+        try:
+            from ...configuration import Config
+        except ImportError:
+            from traffic_sim.configuration import Config
+        
+        if Config.CAR_FOLLOWING_MODEL == "IDM":
+            try:
+                from ...services.car_following import compute_idm_acceleration_single
+            except ImportError:
+                from traffic_sim.services.car_following import compute_idm_acceleration_single
+            
+            acceleration = self.idm_acceleration
+            if acceleration is None:
+                acceleration = compute_idm_acceleration_single(self)
+            self.idm_acceleration = None  # Consumed; the kernel sets a fresh value next tick
+            self.max_advance = min(self.max_advance, self.idm_max_advance)
+            # Queued up close behind the leader: it is what we are waiting for
+            if self.idm_leader is not None and self.idm_gap < 2 * self.get_idm_settings()["MIN_GAP"]:
+                self.wait_reason, self.blocking_leader = "leader", self.idm_leader
+            return acceleration
+        
+        target_speed = self.speed * self._calculate_following_speed_adjustment()
+        return (target_speed - self.velocity) / dt if dt > 0 else 0.0
+
+    def get_max_speed(self) -> float:
+        """Top speed: the IDM desired speed when IDM is active, otherwise the spawn speed."""
+        try:
+            from ...configuration import Config
+        except ImportError:
+            from traffic_sim.configuration import Config
+        
+        if Config.CAR_FOLLOWING_MODEL == "IDM":
+            desired = self.get_idm_settings().get("DESIRED_SPEED")
+            if desired is not None:
+                return float(desired)
+        return float(self.speed)
+
+    def get_kinematic_limits(self) -> dict:
+        """Get vehicle-specific acceleration/deceleration limits from configuration."""
+        try:
+            from ...configuration import Config
+        except ImportError:
+            from traffic_sim.configuration import Config
+        
+        return Config.KINEMATICS.get(self.get_vehicle_type(), Config.KINEMATICS["DEFAULT"])
+
+    def _check_strict_collision(self, new_pos, direction, step: float) -> bool:
+        """
+        Layer 1 safety net: would we overlap another vehicle at new_pos?
+        
+        The check is expensive (temporary vehicle + SAT against every agent).
+        With IDM the gaps stay smooth, so it only runs every
+        SAFETY_CHECK_INTERVAL ticks (or when the gap to the leader gets tight),
+        probing as far ahead as we can get in that many ticks. Once the probe
+        hits something the check runs every tick until the way is clear.
+        """
+        try:
+            from ...configuration import Config
+        except ImportError:
+            from traffic_sim.configuration import Config
+        
+        if Config.CAR_FOLLOWING_MODEL != "IDM":
+            return self._check_any_collision(new_pos)
+        
+        self._ticks_since_safety_check += 1
+        if not (self._safety_conflict or
+                self._ticks_since_safety_check >= Config.SAFETY_CHECK_INTERVAL or
+                self.idm_gap < self.get_idm_settings()["MIN_GAP"]):
+            return False
+        
+        self._ticks_since_safety_check = 0
+        reach = step * Config.SAFETY_CHECK_INTERVAL
+        probe = [self.pos[0] + direction[0] * reach, self.pos[1] + direction[1] * reach]
+        self._safety_conflict = self._check_any_collision(probe)
+        return self._safety_conflict and self._check_any_collision(new_pos)
 
     def _is_outside_frame(self) -> bool:
         """
@@ -350,14 +566,137 @@ class RoadUser:
         return False
 
     def update(self, dt: float):
-        if self.done:
+        """Plan and move this agent on its own. The App plans all agents first
+        and then moves them together in one integrator pass."""
+        if self.plan(dt):
+            try:
+                from ...services.kinematics import integrate
+            except ImportError:
+                from traffic_sim.services.kinematics import integrate
+            integrate([self], dt)
+
+    def _stop(self) -> bool:
+        """Plan a standstill for this tick (waiting at red or collision prevention)."""
+        self.hard_stop = True
+        self.max_advance = 0.0
+        return True
+
+    def _wait_for_signal(self) -> bool:
+        """Stop at the stop line until our signal group turns green."""
+        self.wait_reason = "signal"
+        return self._stop()
+
+    def _wait_behind_leader(self) -> bool:
+        """
+        Stop for a vehicle in our way. If it is the one ahead of us in our lane,
+        remember it so we can be parked until it moves; anything else (cross
+        traffic) keeps us polling.
+        """
+        try:
+            from ...services.physics import find_vehicle_ahead
+        except ImportError:
+            from traffic_sim.services.physics import find_vehicle_ahead
+        
+        # Look a bit further than the following logic: queued vehicles stand
+        # bumper to bumper, centre distance is about two half-lengths
+        search_distance = 2 * self.get_collision_settings()["SEARCH_DISTANCE"]
+        result = find_vehicle_ahead(self, getattr(self, 'all_agents', None) or [], search_distance)
+        if result is not None:
+            self.wait_reason, self.blocking_leader = "leader", result[0]
+        return self._stop()
+
+    def _reach_waypoint(self) -> None:
+        """Advance to the next waypoint; set the exit direction when the last one is reached."""
+        self.i += 1
+        
+        # If this was the second-to-last waypoint, calculate exit direction
+        if self.i == len(self.path) - 1:
+            # We just reached the last waypoint - calculate exit direction
+            if len(self.path) >= 2:
+                last = self.path[-1]
+                second_last = self.path[-2]
+                dx_exit = last[0] - second_last[0]
+                dy_exit = last[1] - second_last[1]
+                dist_exit = math.hypot(dx_exit, dy_exit)
+                if dist_exit > 0:
+                    self._exit_direction = (dx_exit / dist_exit, dy_exit / dist_exit)
+                    self._exit_distance = 0.0
+
+    def advance_along_path(self, distance: float) -> None:
+        """
+        Move `distance` pixels along the path. Whatever is left after reaching a
+        waypoint carries over into the next segment, so large time steps follow
+        the corners instead of overshooting them.
+        """
+        remaining = distance
+        while remaining > 0:
+            if self.i >= len(self.path) - 1:
+                # Past the last waypoint - keep moving in the exit direction
+                if getattr(self, '_exit_direction', None):
+                    dx, dy = self._exit_direction
+                    self.pos[0] += dx * remaining
+                    self.pos[1] += dy * remaining
+                return
+            
+            target = self.path[self.i + 1]
+            dx = target[0] - self.pos[0]
+            dy = target[1] - self.pos[1]
+            dist = math.hypot(dx, dy)
+            if dist <= remaining:
+                self.pos[0], self.pos[1] = float(target[0]), float(target[1])
+                remaining -= dist
+                self._reach_waypoint()
+            else:
+                self.pos[0] += dx / dist * remaining
+                self.pos[1] += dy / dist * remaining
+                remaining = 0.0
+
+    def move_to_progress(self, progress: float) -> None:
+        """Put the agent back on its path at arc length `progress` (never off the route)."""
+        if not self.path:
             return
+        self.i = 0
+        self.pos[0], self.pos[1] = float(self.path[0][0]), float(self.path[0][1])
+        self._exit_direction = None
+        self.advance_along_path(max(0.0, progress))
+
+    def save_motion_state(self):
+        """Snapshot of where we are on the path, for rewinding a move."""
+        return (self.pos[0], self.pos[1], self.i, getattr(self, '_exit_direction', None))
+
+    def restore_motion_state(self, state) -> None:
+        """Go back to a snapshot taken with save_motion_state()."""
+        x, y, i, exit_direction = state
+        self.pos[0], self.pos[1] = x, y
+        self.i = i
+        self._exit_direction = exit_direction
+
+    def get_swept_points(self, state) -> List[Vec2]:
+        """Positions passed through since the snapshot: start, waypoints reached, current."""
+        x, y, i, _ = state
+        return [(x, y)] + [tuple(p) for p in self.path[i + 1:self.i + 1]] + [(self.pos[0], self.pos[1])]
+
+    def _distance_to_waypoint(self, index: int) -> float:
+        """Arc length from the current position to waypoint `index` (0 if already passed)."""
+        return max(0.0, self._path_cumulative_lengths()[index] - self.get_progress())
+
+    def plan(self, dt: float) -> bool:
+        """
+        Decide how to move this tick without moving: sets desired_acceleration,
+        max_advance and hard_stop for the kinematic integrator.
+        Returns False when the agent is done and takes no part in integration.
+        """
+        if self.done:
+            return False
         
         # Track total simulation time for this vehicle
         self.total_time += dt
         
-        # Store initial position to check if vehicle moved
-        initial_pos = self.pos.copy()
+        self.hard_stop = False
+        self.max_advance = float('inf')
+        self.desired_acceleration = 0.0
+        self.wait_reason = None
+        self.blocking_leader = None
         
         # Check if vehicle is outside frame boundaries and should despawn
         if self._is_outside_frame():
@@ -373,7 +712,12 @@ class RoadUser:
             
             self.completion_reason = "frame_exit"
             self.done = True
-            return
+            return False
+
+        # Red light ahead: never move past the stop line in a single step,
+        # however large dt is
+        if self.cross_index is not None and self.i < self.cross_index and not self._can_cross():
+            self.max_advance = self._distance_to_waypoint(self.cross_index)
 
         # Voor de "kruispunt" drempel: check stoplicht via callback
         # Check if we're approaching or at the stop line waypoint
@@ -400,24 +744,10 @@ class RoadUser:
                     # IMPORTANT: When stopping for red lights, also check for vehicles ahead!
                     # Don't just stop at the stop line if there are other vehicles there
                     
-                    # Calculate where we want to stop (stop line or behind other vehicles)
-                    desired_stop_pos = None
-                    
                     if self.i == self.cross_index:
-                        # We're at the stop line - check if there's a vehicle ahead at the stop line
-                        stop_line_pos = self.path[self.cross_index]
-                        
-                        # Look for vehicles ahead that are also stopped at the traffic light
-                        collision_settings = self.get_collision_settings()
-                        safe_distance = collision_settings["MIN_FOLLOWING_DISTANCE"]
-                        
-                        # Check if we can safely stay at current position without hitting vehicles ahead
-                        if self._check_collision_ahead(self.pos, safe_distance=safe_distance):
-                            # There's a vehicle too close ahead - we can't stay here
-                            return  # Don't move forward, stay back from the vehicle ahead
-                        else:
-                            # Safe to stay at stop line
-                            return  # wachten voor rood at stop line
+                        # We're at the stop line - wait here (vehicles ahead keep
+                        # us back through the following logic on the approach)
+                        return self._wait_for_signal()  # wachten voor rood at stop line
                             
                     elif self.i == self.cross_index - 1:
                         # We're approaching the stop line
@@ -443,11 +773,11 @@ class RoadUser:
                                 
                                 if self._check_collision_ahead(check_pos, safe_distance=safe_distance):
                                     # There's a vehicle ahead - stop here, don't continue to stop line
-                                    return  # wachten voor rood behind other vehicle
+                                    return self._wait_behind_leader()  # wachten voor rood behind other vehicle
                             
                             # Stop if we're within 5 pixels of the stop line and no vehicle ahead
                             if dist < 5:
-                                return  # wachten voor rood at stop line
+                                return self._wait_for_signal()  # wachten voor rood at stop line
         
         # After path point 2 (index 2), vehicles ignore traffic lights and continue moving
 
@@ -455,17 +785,13 @@ class RoadUser:
         if self.i >= len(self.path) - 1:
             # We're at or past the last waypoint - keep moving in the exit direction
             if hasattr(self, '_exit_direction') and self._exit_direction:
-                dx, dy = self._exit_direction
-                self.pos[0] += dx * self.speed * dt
-                self.pos[1] += dy * self.speed * dt
-                
                 # Check if vehicle has left the frame (will be caught by _is_outside_frame check above)
-                # No need to track distance anymore - frame boundary check handles despawning
-            else:
-                # No exit direction set, mark as done immediately
-                self.completion_reason = "path_completed"
-                self.done = True
-            return
+                self.desired_acceleration = (self.get_max_speed() - self.velocity) / dt if dt > 0 else 0.0
+                return True
+            # No exit direction set, mark as done immediately
+            self.completion_reason = "path_completed"
+            self.done = True
+            return False
 
         # Get target (next waypoint)
         target = self.path[self.i + 1]
@@ -475,21 +801,13 @@ class RoadUser:
         
         # Check if we've reached this waypoint
         if dist < 5:
-            # Move to next waypoint
-            self.i += 1
-            
-            # If this was the second-to-last waypoint, calculate exit direction
-            if self.i == len(self.path) - 1:
-                # We just reached the last waypoint - calculate exit direction
-                if len(self.path) >= 2:
-                    last = self.path[-1]
-                    second_last = self.path[-2]
-                    dx_exit = last[0] - second_last[0]
-                    dy_exit = last[1] - second_last[1]
-                    dist_exit = math.hypot(dx_exit, dy_exit)
-                    if dist_exit > 0:
-                        self._exit_direction = (dx_exit / dist_exit, dy_exit / dist_exit)
-                        self._exit_distance = 0.0
+            # Move to next waypoint - this turns our collision box in place, so
+            # wait if the turned box would swing into another vehicle
+            state = self.save_motion_state()
+            self._reach_waypoint()
+            if self._check_any_collision(self.pos):
+                self.restore_motion_state(state)
+                return self._stop()
             
             # Continue moving this frame - recalculate target if not at end
             if self.i < len(self.path) - 1:
@@ -499,18 +817,23 @@ class RoadUser:
                 dist = math.hypot(dx, dy)
             else:
                 # We're now at the last waypoint, continue in exit direction
-                return
+                self.desired_acceleration = (self.get_max_speed() - self.velocity) / dt if dt > 0 else 0.0
+                return True
 
         # Move towards target
         if dist > 0:
-            # Calculate speed adjustment based on vehicle ahead
-            speed_factor = self._calculate_following_speed_adjustment()
+            try:
+                from ...services.kinematics import predict_speed
+            except ImportError:
+                from traffic_sim.services.kinematics import predict_speed
             
-            # Calculate new position with adjusted speed
-            adjusted_speed = self.speed * speed_factor
-            vx = (dx / dist) * adjusted_speed
-            vy = (dy / dist) * adjusted_speed
-            new_pos = [self.pos[0] + vx * dt, self.pos[1] + vy * dt]
+            # Acceleration based on vehicle ahead (binary rule or IDM)
+            self.desired_acceleration = self._calculate_desired_acceleration(dt)
+            
+            # Predict where the integrator will put us, for the safety checks
+            adjusted_speed = predict_speed(self, dt)
+            step = min(adjusted_speed * dt, self.max_advance)
+            new_pos = [self.pos[0] + dx / dist * step, self.pos[1] + dy / dist * step]
             
             # Get vehicle-specific safety distances
             collision_settings = self.get_collision_settings()
@@ -524,7 +847,7 @@ class RoadUser:
             can_move = True
             
             # Layer 1: Strict collision check - absolutely no overlap
-            if self._check_any_collision(new_pos):
+            if self._check_strict_collision(new_pos, (dx / dist, dy / dist), step):
                 can_move = False
             
             # Layer 2: Emergency stopping distance check
@@ -536,18 +859,8 @@ class RoadUser:
                 if self._check_collision_ahead(new_pos, safe_distance=emergency_distance * 1.5):
                     can_move = False
             
-            # Only move if all collision checks pass
-            if can_move:
-                self.pos[0] = new_pos[0]
-                self.pos[1] = new_pos[1]
-                self.stopped_time = 0.0  # Reset stopped time when moving
-            else:
-                # Vehicle is stopped due to collision prevention
-                self.stopped_time += dt
+            # Vehicle is stopped due to collision prevention
+            if not can_move:
+                return self._wait_behind_leader()
         
-        # Check if vehicle actually moved this frame
-        moved_distance = math.hypot(self.pos[0] - initial_pos[0], self.pos[1] - initial_pos[1])
-        if moved_distance < 1.0:  # Less than 1 pixel movement counts as stopped
-            self.stopped_time += dt
-        else:
-            self.stopped_time = 0.0
+        return True
@@ -1,7 +1,7 @@
 import pygame
 import sys
 import math
-from typing import Tuple, List, Callable
+from typing import Tuple, List, Callable, Optional
 from pathlib import Path
 
 if __name__ == "__main__":
@@ -13,9 +13,11 @@ if __name__ == "__main__":
 try:
     from ...configuration import Config
     from .road_users import RoadUser
+    from ...render.sprites import rotated_sprite
 except ImportError:
     from traffic_sim.configuration import Config
     from traffic_sim.domain.actors.road_users import RoadUser
+    from traffic_sim.render.sprites import rotated_sprite
 
 config = Config()
 
@@ -37,11 +39,15 @@ class Truck(RoadUser):
     Drawing matches the original truck visuals; rotation is taken from RoadUser.get_rotation().
     """
 
+    _SURFACE_ATTRS = ("_truck_surf",)
+    _LOOK_ATTRS = ("cab_color", "trailer_color", "scale", "radius")
+    LOD_COLOR_ATTR = "trailer_color"
+
     def __init__(
         self,
         path_px: List[Vec2],
         speed_px_s: float = None,
-        can_cross_ok: Callable[[], bool] = lambda: True,
+        can_cross_ok: Optional[Callable[[], bool]] = None,
         cab_color: Tuple[int, int, int] = BLUE,
         trailer_color: Tuple[int, int, int] = WHITE,
         scale: float = 0.45,  # Increased from 0.3 to 0.45 (1.5x bigger)
@@ -52,7 +58,7 @@ class Truck(RoadUser):
         self.trailer_color = trailer_color
         self.scale = float(scale)
         self.radius = int(config.COLLISION_RADIUS.get("TRUCK", 35) * self.scale)
-        self._truck_surf = self._create_surface()
+        self._truck_surf = self._shared_surface()
 
     def _S(self, v: float) -> int:
         return max(1, int(round(v * self.scale)))
@@ -101,22 +107,25 @@ class Truck(RoadUser):
 
         return surf
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
         """
         Draw the truck centered at self.pos, rotated according to RoadUser.get_rotation().
+        Returns the area drawn.
         """
         x = int(round(self.pos[0]))
         y = int(round(self.pos[1]))
         angle = self.get_rotation()
-        rotated = pygame.transform.rotate(self._truck_surf, angle)
+        rotated = rotated_sprite(self._truck_surf, angle)
         rect = rotated.get_rect(center=(x, y))
-        surface.blit(rotated, rect)
+        return surface.blit(rotated, rect)
 
     def clone(self) -> "Truck":
-        new = Truck(list(self.path), speed_px_s=self.speed, can_cross_ok=self._can_cross, cab_color=self.cab_color, trailer_color=self.trailer_color, scale=self.scale)
+        new = Truck(list(self.path), speed_px_s=self.speed, can_cross_ok=self._can_cross_ok, cab_color=self.cab_color, trailer_color=self.trailer_color, scale=self.scale)
         new.pos = list(self.pos)
         new.i = self.i
         new.done = self.done
+        new.signal_group = self.signal_group
+        new.bind_signal(self.signal_flags, self.signal_index, self.signal_key)
         return new
 
 
@@ -12,14 +12,16 @@ if __name__ == "__main__":
 # Try relative import first, fall back to absolute if running as script
 try:
     from ...configuration import Config
+    from ...render.sprites import get_sprite, rotated_sprite
 except ImportError:
     from traffic_sim.configuration import Config
+    from traffic_sim.render.sprites import get_sprite, rotated_sprite
 
 config = Config()
 Vec2 = Tuple[float, float]
 
 class Boat:
-    """Boat that moves upwards along a vertical path."""
+    """Boat that moves along a vertical path (upwards or downwards)."""
 
     def __init__(
         self,
@@ -36,29 +38,41 @@ class Boat:
         self.path = path_px
         self.speed = float(speed_px_s)
 
+        self.reset(self.path)
+
+    def reset(self, path_px: List[Vec2]) -> None:
+        """Put the boat at the start of a (new) path."""
+        self.path = path_px
         self.i = 0
         self.pos = list(self.path[0]) if self.path else [0.0, 0.0]
         self.done = False
+        self.travelled = 0.0  # Distance sailed along the path
+        # Boats sailing down the river are drawn turned around
+        self.heading = 180.0 if len(path_px) > 1 and path_px[-1][1] > path_px[0][1] else 0.0
 
     def update(self, dt: float) -> None:
         """Move the boat along its path, only vertically (y-axis)."""
+        self.advance(self.speed * dt)
+
+    def advance(self, distance: float) -> None:
+        """Move the boat distance pixels along its path."""
         if self.done or self.i + 1 >= len(self.path):
             self.done = True
             return
-
-        target_y = self.path[self.i + 1][1]
-        dy = target_y - self.pos[1]
-
-        step = self.speed * dt
-        if abs(dy) <= step:
-            self.pos[1] = target_y
-            self.i += 1
-        else:
-            self.pos[1] += step if dy > 0 else -step
-
-    def draw(self, surface: pygame.Surface) -> None:
-        """Draw the boat at its current position."""
-        x, y = int(self.pos[0]), int(self.pos[1])
+        self.travelled += distance
+        while distance > 0.0 and self.i + 1 < len(self.path):
+            target_y = self.path[self.i + 1][1]
+            dy = target_y - self.pos[1]
+            if abs(dy) <= distance:
+                self.pos[1] = target_y
+                self.i += 1
+                distance -= abs(dy)
+            else:
+                self.pos[1] += distance if dy > 0 else -distance
+                distance = 0.0
+
+    def _create_surface(self) -> pygame.Surface:
+        """Hull, mast and sail, bow up"""
         scale = self.scale
         hull_w, hull_h = int(20 * scale), int(60 * scale)
         surf = pygame.Surface((hull_w, hull_h), pygame.SRCALPHA)
@@ -81,9 +95,14 @@ class Boat:
             (mast_x - 8 * scale, mast_y1 + 15 * scale),
             (mast_x + 8 * scale, mast_y1 + 15 * scale)
         ])
+        return surf
 
-        rect = surf.get_rect(center=(x, y))
-        surface.blit(surf, rect)
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        """Draw the boat at its current position; returns the area drawn."""
+        x, y = int(self.pos[0]), int(self.pos[1])
+        # One shared sprite per boat size (render/sprites.py)
+        sprite = rotated_sprite(get_sprite(("Boat", self.scale), self._create_surface), self.heading)
+        return surface.blit(sprite, sprite.get_rect(center=(x, y)))
 
 
 def main():
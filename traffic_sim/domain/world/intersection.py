@@ -1,5 +1,7 @@
+import heapq
 from enum import Enum, auto
 from .traffic_light import Stoplicht, Light
+from .phase_table import compile_phase_table
 
 class Phase(Enum):
     NS_CARS_GREEN = auto()   # Noord/Zuid auto's groen
@@ -8,65 +10,299 @@ class Phase(Enum):
     EW_PED_BIKE = auto()     # O/W voetganger+fietser groen
 
 class Controller:
-    """Eenvoudige 4-fasen controller. Later makkelijk uit te breiden."""
-    def __init__(self):
-        # 1 set voor auto's per richting-as
-        self.cars_ns = Stoplicht(green_s=8,  amber_s=2, red_s=10)
-        self.cars_ew = Stoplicht(green_s=8,  amber_s=2, red_s=10)
-        # 1 set voor ped/bike per as
-        self.ped_ns  = Stoplicht(green_s=6,  amber_s=0.5, red_s=13.5)
-        self.ped_ew  = Stoplicht(green_s=6,  amber_s=0.5, red_s=13.5)
-
-        self.phase = Phase.NS_CARS_GREEN
-        self._enter_phase(self.phase)
-
-    def _enter_phase(self, phase: Phase):
-        self.phase = phase
-        for l in (self.cars_ns, self.cars_ew, self.ped_ns, self.ped_ew):
-            l.set_state(Light.RED)
-        if phase is Phase.NS_CARS_GREEN:
-            self.cars_ns.set_state(Light.GREEN)
-        elif phase is Phase.EW_CARS_GREEN:
-            self.cars_ew.set_state(Light.GREEN)
-        elif phase is Phase.NS_PED_BIKE:
-            self.ped_ns.set_state(Light.GREEN)
-        elif phase is Phase.EW_PED_BIKE:
-            self.ped_ew.set_state(Light.GREEN)
+    """
+    Eenvoudige 4-fasen controller. Later makkelijk uit te breiden.
+
+    The signal plan comes from a phase table (see phase_table.py), compiled to
+    index arrays: stage -> signal groups, green times, next stage and the
+    intergreen of every transition. The can_* queries are lookups in the
+    green flag array, which is only written on a signal change and updated in
+    place: road users hold the list and their group's signal_index() and read
+    it directly (RoadUser.bind_signal) instead of calling back into us.
+
+    Event-driven: every stage schedules its own amber, red and the next stage
+    as timed events, update(dt) only fires the events that are due.
+    next_transition_time() tells the engine when the next change happens, and
+    subscribers are notified as listener(group, state) on every signal group
+    change.
+
+    Actuated mode (set_actuated): green runs at least min_green and is then
+    extended, up to max_green, while the loop detectors see arrivals within
+    the passage gap. Skippable stages (the ped/bike phases) are left out
+    when nobody waits for them.
+
+    Max-pressure mode (set_max_pressure): after min_green, every decision
+    interval the stage whose groups have the largest pressure (queues minus
+    the occupancy of the links they discharge into) is served next; the current stage keeps green while
+    it is the best one, up to max_green.
+
+    Both adaptive modes hold the next stage after its intergreen while agents
+    of the other signal groups are still inside the intersection (at most
+    MAX_CLEARANCE_HOLD seconds), so short stages don't lock up the box.
+
+    Gates (add_gate) are extra flags at the end of the green array: a gated
+    copy of a signal group is green while the group is green and the gate is
+    open. Movements that can be closed on their own (the road over the
+    movable bridge, services/bridge.py) obey a gate instead of their group;
+    gate changes are notified under the gate's name.
+    """
+    # Events due within this many seconds of a step's end fire in that step
+    _TIME_EPSILON = 1e-9
+    # Clearance hold before an adaptive stage starts: check interval and limit (s)
+    CLEARANCE_CHECK = 0.5
+    MAX_CLEARANCE_HOLD = 10.0
+
+    def __init__(self, phase_table: dict = None):
+        # Callbacks called as listener(group, state) when a signal group changes
+        self._listeners = []
+        # Scheduled events: heap of (time, sequence, action, args)
+        self.time = 0.0
+        self._events = []
+        self._event_seq = 0
+
+        self.table = compile_phase_table(phase_table)
+        self.SIGNAL_GROUPS = tuple(self.table.group_names)
+        self.green = [False] * len(self.SIGNAL_GROUPS)
+
+        # Eén Stoplicht per signal group (cars_ns, cars_ew, ped_ns, ped_ew)
+        cycle = self.table.cycle_length
+        self.lights = []
+        for g, name in enumerate(self.SIGNAL_GROUPS):
+            green_s = max([self.table.green[s] for s, groups in enumerate(self.table.stage_groups)
+                           if g in groups], default=0.0)
+            amber_s = self.table.amber[g]
+            light = Stoplicht(green_s=green_s, amber_s=amber_s, red_s=max(0.0, cycle - green_s - amber_s))
+            self.lights.append(light)
+            setattr(self, name, light)
+
+        # Gates: name -> [flag index, signal group index, open]
+        self._gates = {}
+        self._gates_of = {}  # Signal group index -> names of its gates
+
+        # Array indices for the fixed queries below
+        self._CARS_NS = self.table.group_index.get("cars_ns")
+        self._CARS_EW = self.table.group_index.get("cars_ew")
+        self._PED_NS = self.table.group_index.get("ped_ns")
+        self._PED_EW = self.table.group_index.get("ped_ew")
+
+        # Control policy: "fixed", "actuated" or "max_pressure" (the latter two read detectors)
+        self.policy = "fixed"
+        self.detectors = None
+        self.passage_gap = 2.5
+        self.decision_interval = 2.0
+        self._stage_start = 0.0
+
+        self.stage = 0
+        self.phase = self._phase_name(0)
+        self._enter_stage(0)
+
+    def set_actuated(self, detectors, passage_gap: float = 2.5):
+        """
+        Switch to vehicle-actuated control. detectors answers has_demand(group),
+        has_arrivals(group, now, gap), time_until_gap_out(group, now, gap) and
+        box_clear(groups) (services/detectors.py). Pass None to go back to
+        fixed time.
+        """
+        self.policy = "actuated" if detectors is not None else "fixed"
+        self.detectors = detectors
+        self.passage_gap = passage_gap
+        self._enter_stage(self.stage)
+
+    def set_max_pressure(self, detectors, decision_interval: float = 2.0):
+        """
+        Switch to max-pressure control. detectors answers pressure(group): the
+        queues of its movements minus the occupancy of their downstream links,
+        and box_clear(groups).
+        """
+        self.policy = "max_pressure"
+        self.detectors = detectors
+        self.decision_interval = decision_interval
+        self._enter_stage(self.stage)
+
+    def _phase_name(self, stage: int):
+        """Phase enum member for single-ring stages that have one, else the stage name."""
+        name = self.table.stage_names[stage]
+        return Phase[name] if name in Phase.__members__ else name
+
+    def subscribe(self, listener):
+        """Get notified as listener(group, state) whenever a signal group changes state."""
+        self._listeners.append(listener)
+
+    def __getstate__(self):
+        # Listeners belong to whoever subscribed; they subscribe again after loading
+        state = self.__dict__.copy()
+        state["_listeners"] = []
+        return state
+
+    def _set_groups(self, groups, state: Light, reset=True):
+        """Set the given group indices to state and notify the listeners of real changes."""
+        changed = []
+        for g in groups:
+            light = self.lights[g]
+            if light.state is not state:
+                light.set_state(state, reset=reset)
+                changed.append(g)
+            self.green[g] = state is Light.GREEN
+        for g in changed:
+            for listener in self._listeners:
+                listener(self.SIGNAL_GROUPS[g], state)
+            for name in self._gates_of.get(g, ()):
+                self._update_gate(name)
+
+    def add_gate(self, name: str, group: str) -> int:
+        """Add an (open) gate on a signal group; returns its index in the green flag array."""
+        base = self.table.group_index[group]
+        index = len(self.green)
+        self.green.append(self.green[base])
+        self._gates[name] = [index, base, True]
+        self._gates_of.setdefault(base, []).append(name)
+        return index
+
+    def set_gate(self, name: str, is_open: bool) -> None:
+        """Open or close a gate; its flag follows at once."""
+        self._gates[name][2] = is_open
+        self._update_gate(name)
+
+    def gate_is_open(self, name: str) -> bool:
+        return self._gates[name][2]
+
+    def _update_gate(self, name: str) -> None:
+        index, base, is_open = self._gates[name]
+        green = is_open and self.green[base]
+        if self.green[index] is not green:
+            self.green[index] = green
+            for listener in self._listeners:
+                listener(name, Light.GREEN if green else Light.RED)
+
+    def _schedule(self, delay: float, action, *args):
+        heapq.heappush(self._events, (self.time + delay, self._event_seq, action, args))
+        self._event_seq += 1
+
+    def _enter_phase(self, phase):
+        """Jump straight to a phase (Phase member, stage name or stage index)."""
+        if isinstance(phase, Phase):
+            phase = phase.name
+        stage = self.table.stage_index[phase] if isinstance(phase, str) else phase
+        others = [g for g in range(len(self.lights)) if g not in self.table.stage_groups[stage]]
+        self._set_groups(others, Light.RED)
+        self._enter_stage(stage)
+
+    def _enter_stage(self, stage: int):
+        # Entering a stage replaces whatever was still scheduled
+        self._events.clear()
+        self.stage = stage
+        self.phase = self._phase_name(stage)
+        self._stage_start = self.time
+        self._set_groups(self.table.stage_groups[stage], Light.GREEN)
+        if self.policy == "actuated":
+            self._schedule(self.table.min_green[stage], self._check_extension, stage)
+        elif self.policy == "max_pressure":
+            self._schedule(self.table.min_green[stage], self._check_pressure, stage)
+        else:
+            self._schedule(self.table.green[stage], self._end_green, stage)
+
+    def _check_extension(self, stage: int):
+        """Actuated: keep green while arrivals keep coming, up to max_green."""
+        remaining = self._stage_start + self.table.max_green[stage] - self.time
+        groups = [self.SIGNAL_GROUPS[g] for g in self.table.stage_groups[stage]]
+        if remaining > self._TIME_EPSILON and any(
+                self.detectors.has_arrivals(g, self.time, self.passage_gap) for g in groups):
+            wait = max(self.detectors.time_until_gap_out(g, self.time, self.passage_gap) for g in groups)
+            # Presence without new arrivals: look again after one passage gap
+            self._schedule(min(remaining, wait or self.passage_gap), self._check_extension, stage)
+        else:
+            self._end_green(stage)
+
+    def stage_pressure(self, stage: int) -> int:
+        """Sum of the pressures of the signal groups a stage serves."""
+        return sum(self.detectors.pressure(self.SIGNAL_GROUPS[g]) for g in self.table.stage_groups[stage])
+
+    def _check_pressure(self, stage: int):
+        """Max-pressure: keep green while this stage is the best one, else switch to the best."""
+        t = self.table
+        pressures = [self.stage_pressure(s) for s in range(len(t.stage_names))]
+        # Best other stage, ties go to the one that comes first in the cycle
+        best, candidate = None, t.next_stage[stage]
+        while candidate != stage:
+            if best is None or pressures[candidate] > pressures[best]:
+                best = candidate
+            candidate = t.next_stage[candidate]
+
+        remaining = self._stage_start + t.max_green[stage] - self.time
+        if best is not None and pressures[best] > 0 and (
+                pressures[best] > pressures[stage] or remaining <= self._TIME_EPSILON):
+            self._end_green(stage, best)
+        elif remaining > self._TIME_EPSILON:
+            self._schedule(min(self.decision_interval, remaining), self._check_pressure, stage)
+        else:
+            # Past max_green but nobody else waits: rest in green
+            self._schedule(self.decision_interval, self._check_pressure, stage)
+
+    def _choose_next_stage(self, stage: int) -> int:
+        """Next stage in the cycle; actuated control skips skippable stages without demand."""
+        t = self.table
+        target = t.next_stage[stage]
+        if self.policy != "actuated":
+            return target
+        candidate = target
+        for _ in range(len(t.stage_names)):
+            if not t.skippable[candidate] or any(
+                    self.detectors.has_demand(self.SIGNAL_GROUPS[g]) for g in t.stage_groups[candidate]):
+                return candidate
+            candidate = t.next_stage[candidate]
+        return target
+
+    def _end_green(self, stage: int, target: int = None):
+        """Stop the groups that are not in the next (or given) stage and schedule it."""
+        t = self.table
+        if target is None:
+            target = self._choose_next_stage(stage)
+        ending, _, delay = t.transitions[stage][target]
+        amber = [g for g in ending if t.amber[g] > 0]
+        self._set_groups(amber, Light.AMBER, reset=False)  # Don't reset timer
+        self._set_groups([g for g in ending if t.amber[g] <= 0], Light.RED)
+        for g in amber:
+            self._schedule(t.amber[g], self._set_groups, (g,), Light.RED)
+        self._schedule(delay, self._start_stage, target)
+
+    def _start_stage(self, stage: int, held: float = 0.0):
+        """Enter a stage once the box is clear of the other groups (adaptive modes)."""
+        if self.policy != "fixed" and held < self.MAX_CLEARANCE_HOLD:
+            others = [name for g, name in enumerate(self.SIGNAL_GROUPS)
+                      if g not in self.table.stage_groups[stage]]
+            if not self.detectors.box_clear(others):
+                self._schedule(self.CLEARANCE_CHECK, self._start_stage, stage, held + self.CLEARANCE_CHECK)
+                return
+        self._enter_stage(stage)
 
     def update(self, dt: float):
-        # Update all traffic light timers
-        for l in (self.cars_ns, self.cars_ew, self.ped_ns, self.ped_ew):
-            l.update(dt)
-
-        # Handle phase transitions based on current phase
-        if self.phase is Phase.NS_CARS_GREEN:
-            # Check if we need to transition to amber
-            if self.cars_ns.state == Light.GREEN and self.cars_ns.t >= self.cars_ns.green_s:
-                self.cars_ns.set_state(Light.AMBER, reset=False)  # Don't reset timer
-            # Check if amber period is over
-            elif self.cars_ns.state == Light.AMBER and self.cars_ns.t >= self.cars_ns.green_s + self.cars_ns.amber_s:
-                self._enter_phase(Phase.EW_CARS_GREEN)
-
-        elif self.phase is Phase.EW_CARS_GREEN:
-            # Check if we need to transition to amber
-            if self.cars_ew.state == Light.GREEN and self.cars_ew.t >= self.cars_ew.green_s:
-                self.cars_ew.set_state(Light.AMBER, reset=False)  # Don't reset timer
-            # Check if amber period is over
-            elif self.cars_ew.state == Light.AMBER and self.cars_ew.t >= self.cars_ew.green_s + self.cars_ew.amber_s:
-                self._enter_phase(Phase.NS_PED_BIKE)
-
-        elif self.phase is Phase.NS_PED_BIKE:
-            # Pedestrian lights don't have amber, go straight to red
-            if self.ped_ns.t >= self.ped_ns.green_s:
-                self._enter_phase(Phase.EW_PED_BIKE)
-
-        elif self.phase is Phase.EW_PED_BIKE:
-            # Pedestrian lights don't have amber, go straight to red
-            if self.ped_ew.t >= self.ped_ew.green_s:
-                self._enter_phase(Phase.NS_CARS_GREEN)
+        """Advance the clock by dt and fire every event that falls due."""
+        end = self.time + dt
+        while self._events and self._events[0][0] <= end + self._TIME_EPSILON:
+            event_time, _, action, args = heapq.heappop(self._events)
+            self.time = max(self.time, event_time)  # Schedule follow-ups from the event time
+            action(*args)
+        self.time = end
+
+    def next_transition_time(self) -> float:
+        """Simulation time of the next signal change (inf if none is scheduled)."""
+        return self._events[0][0] if self._events else float('inf')
+
+    def time_until_next_transition(self) -> float:
+        return max(0.0, self.next_transition_time() - self.time)
+
+    def signal_index(self, group: str) -> int:
+        """Index of a signal group or gate in the green flag array (for RoadUser.bind_signal)."""
+        if group in self._gates:
+            return self._gates[group][0]
+        return self.table.group_index[group]
+
+    def is_green(self, group: int) -> bool:
+        """Green flag of a signal group index."""
+        return self.green[group]
 
     # Query’s waar agents op kunnen beslissen:
-    def can_cars_cross_ns(self) -> bool: return self.cars_ns.state is Light.GREEN
-    def can_cars_cross_ew(self) -> bool: return self.cars_ew.state is Light.GREEN
-    def can_ped_cross_ns(self)  -> bool: return self.ped_ns.state  is Light.GREEN
-    def can_ped_cross_ew(self)  -> bool: return self.ped_ew.state  is Light.GREEN
+    def can_cars_cross_ns(self) -> bool: return self.green[self._CARS_NS]
+    def can_cars_cross_ew(self) -> bool: return self.green[self._CARS_EW]
+    def can_ped_cross_ns(self)  -> bool: return self.green[self._PED_NS]
+    def can_ped_cross_ew(self)  -> bool: return self.green[self._PED_EW]
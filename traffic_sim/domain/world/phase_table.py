@@ -0,0 +1,130 @@
+# src/traffic_sim/domain/world/phase_table.py
+"""
+Data-driven ring-and-barrier phase tables for the signal Controller.
+
+A phase table describes an intersection's signal plan as data:
+
+- signal_groups: name -> {"amber": s, "all_red": s}
+- phases: name -> {"groups": [...], "green": s, "min_green": s, "max_green": s}
+  ("green" is the fixed-time duration, min/max bound actuated control;
+  "skippable" phases are left out by actuated control when nobody waits)
+- rings: lists of phase names. Rings run side by side; the phases at the same
+  position in every ring form one stage, and every stage boundary is a barrier
+- intergreen: optional matrix {ending group: {starting group: s}} with the
+  time from the end of green of one group to the start of green of the other.
+  Missing entries default to the ending group's amber + all-red time.
+
+compile_phase_table() turns it into flat, index-based arrays (stage -> group
+indices, per-stage timings, transition delays), so the controller runs any
+plan without per-phase Python branching.
+"""
+import json
+from typing import Dict, List, Optional
+
+# The classic four-phase plan of this intersection: cars N/S, cars E/W, then
+# the pedestrian/bike crossings. Pedestrian lights go straight to red.
+DEFAULT_PHASE_TABLE = {
+    "signal_groups": {
+        "cars_ns": {"amber": 2.0, "all_red": 0.0},
+        "cars_ew": {"amber": 2.0, "all_red": 0.0},
+        "ped_ns":  {"amber": 0.0, "all_red": 0.0},
+        "ped_ew":  {"amber": 0.0, "all_red": 0.0},
+    },
+    "phases": {
+        "NS_CARS_GREEN": {"groups": ["cars_ns"], "green": 8.0, "min_green": 5.0, "max_green": 20.0},
+        "EW_CARS_GREEN": {"groups": ["cars_ew"], "green": 8.0, "min_green": 5.0, "max_green": 20.0},
+        "NS_PED_BIKE":   {"groups": ["ped_ns"],  "green": 6.0, "min_green": 4.0, "max_green": 10.0,
+                          "skippable": True},
+        "EW_PED_BIKE":   {"groups": ["ped_ew"],  "green": 6.0, "min_green": 4.0, "max_green": 10.0,
+                          "skippable": True},
+    },
+    "rings": [
+        ["NS_CARS_GREEN", "EW_CARS_GREEN", "NS_PED_BIKE", "EW_PED_BIKE"],
+    ],
+    "intergreen": {},
+}
+
+
+class CompiledPhaseTable:
+    """Array form of a phase table. Stages and signal groups are plain indices."""
+
+    def __init__(self, table: dict):
+        groups = table["signal_groups"]
+        phases = table["phases"]
+        rings = table["rings"]
+        if not rings or any(len(ring) != len(rings[0]) for ring in rings):
+            raise ValueError("All rings need the same number of phases (one per stage)")
+
+        # Signal groups
+        self.group_names: List[str] = list(groups)
+        self.group_index: Dict[str, int] = {name: k for k, name in enumerate(self.group_names)}
+        self.amber: List[float] = [float(groups[g].get("amber", 0.0)) for g in self.group_names]
+        self.all_red: List[float] = [float(groups[g].get("all_red", 0.0)) for g in self.group_names]
+
+        # Intergreen matrix [ending][starting]
+        n = len(self.group_names)
+        self.intergreen: List[List[float]] = [
+            [self.amber[i] + self.all_red[i]] * n for i in range(n)
+        ]
+        for ending, row in (table.get("intergreen") or {}).items():
+            for starting, seconds in row.items():
+                self.intergreen[self.group_index[ending]][self.group_index[starting]] = float(seconds)
+
+        # Stages: the phases at the same position in every ring run together
+        self.stage_names: List[str] = []
+        self.stage_groups: List[tuple] = []
+        self.green: List[float] = []
+        self.min_green: List[float] = []
+        self.max_green: List[float] = []
+        self.skippable: List[bool] = []
+        for stage_phases in zip(*rings):
+            members = [phases[p] for p in stage_phases]
+            self.stage_names.append("+".join(stage_phases))
+            self.stage_groups.append(tuple(sorted({self.group_index[g] for m in members for g in m["groups"]})))
+            self.green.append(max(float(m["green"]) for m in members))
+            self.min_green.append(max(float(m.get("min_green", m["green"])) for m in members))
+            self.max_green.append(max(float(m.get("max_green", m["green"])) for m in members))
+            self.skippable.append(all(m.get("skippable", False) for m in members))
+        self.stage_index: Dict[str, int] = {name: k for k, name in enumerate(self.stage_names)}
+
+        # Transition table [from stage][to stage]: which groups stop and start,
+        # and how long the intergreen between them lasts. Fixed-time control
+        # only uses from -> next_stage, actuated control may skip stages.
+        count = len(self.stage_names)
+        self.next_stage: List[int] = [(s + 1) % count for s in range(count)]
+        self.transitions: List[List[tuple]] = [
+            [self._compile_transition(s, t) for t in range(count)] for s in range(count)
+        ]
+        self.ending: List[tuple] = [self.transitions[s][self.next_stage[s]][0] for s in range(count)]
+        self.starting: List[tuple] = [self.transitions[s][self.next_stage[s]][1] for s in range(count)]
+        self.transition_delay: List[float] = [self.transitions[s][self.next_stage[s]][2] for s in range(count)]
+
+    def _compile_transition(self, stage: int, target: int) -> tuple:
+        current, following = set(self.stage_groups[stage]), set(self.stage_groups[target])
+        ending = tuple(sorted(current - following))
+        starting = tuple(sorted(following - current))
+        delay = max(
+            [self.intergreen[e][b] for e in ending for b in starting] +
+            [self.amber[e] + self.all_red[e] for e in ending],
+            default=0.0,
+        )
+        return ending, starting, delay
+
+    @property
+    def cycle_length(self) -> float:
+        """Fixed-time cycle length in seconds."""
+        return sum(g + d for g, d in zip(self.green, self.transition_delay))
+
+
+def compile_phase_table(table: Optional[dict] = None) -> CompiledPhaseTable:
+    """Compile a phase table (DEFAULT_PHASE_TABLE when None)."""
+    return CompiledPhaseTable(table if table is not None else DEFAULT_PHASE_TABLE)
+
+
+def load_phase_table(path: str) -> dict:
+    """Read a phase table from a JSON file."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+__all__ = ["DEFAULT_PHASE_TABLE", "CompiledPhaseTable", "compile_phase_table", "load_phase_table"]
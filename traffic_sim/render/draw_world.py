@@ -29,6 +29,15 @@ class WorldRenderer:
         # Create base surface
         self.background = pg.Surface((WIDTH, HEIGHT))
         self._create_background()
+
+        # Bridges are drawn over the boats: pre-baked once into a transparent
+        # overlay cropped to the bridges, blitted at bridge_pos
+        self.bridge_overlay, self.bridge_pos = self._create_bridge_overlay()
+
+        # Match the display format so the per-frame blits need no conversion
+        if pg.display.get_surface() is not None:
+            self.background = self.background.convert()
+            self.bridge_overlay = self.bridge_overlay.convert_alpha()
         
     def _create_background(self):
         """Create the static background with roads, river, and markings"""
@@ -80,7 +89,74 @@ class WorldRenderer:
                          (x, HEIGHT/2), (x + dash_length, HEIGHT/2), line_width)
             x += dash_length + gap_length
 
-        # Note: Bridge is now drawn separately in testapp.py to ensure proper layering with boats
+        # Note: Bridge is drawn separately (bridge overlay) to ensure proper layering with boats
+
+    def _create_bridge_overlay(self):
+        """Create the road and pedestrian bridges over the river on a transparent surface"""
+        overlay = pg.Surface((WIDTH, HEIGHT), pg.SRCALPHA)
+        river_start_x = WIDTH * 0.7
+        river_width = WIDTH * 0.3
+        road_width = WIDTH * 0.15
+        bridge_thickness = road_width * 1.2
+        bridge_y = HEIGHT / 2 - bridge_thickness / 2
+
+        # Draw main road bridge crossing the river
+        bridge_color = self.ROAD_COLOR
+        pg.draw.rect(overlay, bridge_color,
+                     (river_start_x, bridge_y, river_width, bridge_thickness))
+
+        # Bridge railings for road bridge (top and bottom)
+        railing_color = (60, 60, 60)
+        railing_height = int(max(2, bridge_thickness * 0.08))
+        # The movable road bridge, railings included (services/bridge.py)
+        self.road_bridge_rect = pg.Rect(int(river_start_x), int(bridge_y - railing_height),
+                                        int(river_width), int(bridge_thickness + 2 * railing_height))
+        pg.draw.rect(overlay, railing_color,
+                     (river_start_x, bridge_y - railing_height, river_width, railing_height))
+        pg.draw.rect(overlay, railing_color,
+                     (river_start_x, bridge_y + bridge_thickness, river_width, railing_height))
+
+        # Draw wooden pedestrian bridge (north of the main road)
+        ped_bridge_y = HEIGHT * 0.30  # Where pedestrians cross (Y=0.30 normalized)
+        ped_bridge_thickness = 20
+
+        # Wooden bridge colors
+        wood_color = (139, 90, 43)  # Brown wood color
+        wood_dark = (101, 67, 33)  # Darker wood for planks
+        railing_wood = (160, 110, 60)  # Lighter wood for railings
+
+        # Main wooden bridge deck
+        pg.draw.rect(overlay, wood_color,
+                     (river_start_x, ped_bridge_y - ped_bridge_thickness//2, river_width, ped_bridge_thickness))
+
+        # Wooden planks (vertical lines across the bridge)
+        plank_spacing = 15
+        for x in range(int(river_start_x), int(river_start_x + river_width), plank_spacing):
+            pg.draw.line(overlay, wood_dark,
+                         (x, ped_bridge_y - ped_bridge_thickness//2),
+                         (x, ped_bridge_y + ped_bridge_thickness//2), 2)
+
+        # Wooden railings on both sides
+        railing_height_ped = 6
+        pg.draw.rect(overlay, railing_wood,
+                     (river_start_x, ped_bridge_y - ped_bridge_thickness//2 - railing_height_ped,
+                      river_width, railing_height_ped))
+        pg.draw.rect(overlay, railing_wood,
+                     (river_start_x, ped_bridge_y + ped_bridge_thickness//2,
+                      river_width, railing_height_ped))
+
+        # Bridge support posts (vertical supports)
+        post_width = 3
+        post_spacing = river_width // 4  # 4 posts across the bridge
+        for i in range(1, 4):  # 3 posts (excluding ends)
+            post_x = river_start_x + i * post_spacing
+            pg.draw.rect(overlay, wood_dark,
+                         (post_x - post_width//2, ped_bridge_y - ped_bridge_thickness//2 - railing_height_ped,
+                          post_width, ped_bridge_thickness + 2*railing_height_ped))
+
+        # Keep only the part with bridges on it
+        bounds = overlay.get_bounding_rect()
+        return overlay.subsurface(bounds).copy(), bounds.topleft
 
 def draw(screen, background, views=()):
     """Draw entire scene"""
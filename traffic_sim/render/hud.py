@@ -0,0 +1,93 @@
+# src/traffic_sim/render/hud.py
+"""
+HUD widgets with cached text.
+
+font.render is slow compared to a blit, and HUD labels hardly ever change.
+Buttons pre-render their whole face (background, border, label) once per
+state, labels keep the surface of their last text, and the statistics
+overlay is re-rendered at most every refresh_s seconds. Drawing the HUD is
+then a handful of blits. Every draw() returns the area it covered (see
+render/layers.py).
+"""
+import time
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+import pygame as pg
+
+Color = Tuple[int, int, int]
+
+BORDER_COLOR = (255, 255, 255)
+LINE_HEIGHT = 20  # SimulationStats.render_stats_overlay line spacing
+
+
+class Button:
+    """A clickable rectangle whose face depends on a state (e.g. on/off)"""
+
+    def __init__(self, rect: pg.Rect, font: pg.font.Font,
+                 faces: Dict[Hashable, Tuple[Color, Color, str]]):
+        # faces: state -> (button color, text color, label)
+        self.rect = rect
+        self.font = font
+        self.faces = faces
+        self._surfaces: Dict[Hashable, pg.Surface] = {}
+
+    def _create_surface(self, state: Hashable) -> pg.Surface:
+        button_color, text_color, label = self.faces[state]
+        surface = pg.Surface(self.rect.size)
+        local = surface.get_rect()
+        pg.draw.rect(surface, button_color, local)
+        pg.draw.rect(surface, BORDER_COLOR, local, 2)  # White border
+        text = self.font.render(label, True, text_color)
+        surface.blit(text, text.get_rect(center=local.center))
+        return surface
+
+    def draw(self, screen: pg.Surface, state: Hashable) -> pg.Rect:
+        surface = self._surfaces.get(state)
+        if surface is None:
+            surface = self._surfaces[state] = self._create_surface(state)
+        return screen.blit(surface, self.rect)
+
+
+class Label:
+    """A line of text, rendered again only when the text changes"""
+
+    def __init__(self, font: pg.font.Font, pos: Tuple[int, int], color: Color = (255, 255, 255)):
+        self.font = font
+        self.pos = pos
+        self.color = color
+        self._text: Optional[str] = None
+        self._surface: Optional[pg.Surface] = None
+
+    def draw(self, screen: pg.Surface, text: str) -> pg.Rect:
+        if text != self._text:
+            self._text = text
+            self._surface = self.font.render(text, True, self.color)
+        return screen.blit(self._surface, self.pos)
+
+
+class StatsOverlay:
+    """SimulationStats.render_stats_overlay, re-rendered at most every refresh_s seconds"""
+
+    def __init__(self, stats, font: pg.font.Font, pos: Tuple[int, int] = (10, 10),
+                 refresh_s: float = 0.25, size: Tuple[int, int] = (260, 8 * LINE_HEIGHT),
+                 clock: Callable[[], float] = time.monotonic):
+        self.stats = stats
+        self.font = font
+        self.pos = pos
+        self.refresh_s = refresh_s
+        self.clock = clock
+        self.surface = pg.Surface(size, pg.SRCALPHA)
+        self.renders = 0
+        self._rendered_at: Optional[float] = None
+
+    def draw(self, screen: pg.Surface) -> pg.Rect:
+        now = self.clock()
+        if self._rendered_at is None or now - self._rendered_at >= self.refresh_s:
+            self._rendered_at = now
+            self.renders += 1
+            self.surface.fill((0, 0, 0, 0))
+            self.stats.render_stats_overlay(self.surface, self.font, pos=(0, 0))
+        return screen.blit(self.surface, self.pos)
+
+
+__all__ = ["Button", "Label", "StatsOverlay"]
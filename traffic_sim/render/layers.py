@@ -0,0 +1,102 @@
+# src/traffic_sim/render/layers.py
+"""
+Layered frame compositor.
+
+A frame is a fixed stack of layers drawn bottom to top: the static
+background, then the layers added with add() (boats, the pre-baked bridge
+overlay, agents, lights, HUD, ...). Static layers are pre-rendered surfaces,
+so the static part of a frame is a couple of blits and no allocations.
+
+Dirty-rectangle mode (draw_dirty) keeps the static scene on screen and only
+repairs what changed: the rectangles the dynamic layers covered last frame
+are restored from the background (and static overlays), every dynamic layer
+is drawn again and the old plus new rectangles are returned for
+pg.display.update(). A dynamic layer reports what it covered by returning a
+Rect or a list of Rects; returning None means "unknown" and makes that frame
+and the next one full-screen.
+"""
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+
+import pygame as pg
+
+FILL_COLOR = (40, 44, 52)  # Used when there is no background
+
+Drawn = Union[None, pg.Rect, Iterable[pg.Rect]]
+DrawFn = Callable[[pg.Surface], Drawn]
+
+
+class Compositor:
+    """Draws the layers of a frame in order"""
+
+    def __init__(self, background: Optional[pg.Surface] = None):
+        self.background = background
+        # (name, draw, static) with static = (surface, pos) for pre-rendered layers
+        self.layers: List[Tuple[str, Optional[DrawFn], Optional[Tuple[pg.Surface, Tuple[int, int]]]]] = []
+        self._drawn: Optional[List[pg.Rect]] = None  # Covered by dynamic layers last dirty frame
+
+    def add(self, name: str, draw: DrawFn) -> None:
+        """Add a dynamic layer, draw(screen) is called every frame"""
+        self.layers.append((name, draw, None))
+
+    def add_static(self, name: str, surface: pg.Surface, pos: Tuple[int, int] = (0, 0)) -> None:
+        """Add a pre-rendered layer (use per-pixel alpha for overlays)"""
+        self.layers.append((name, None, (surface, pos)))
+
+    def draw(self, screen: pg.Surface) -> None:
+        """Draw the whole frame"""
+        self._compose(screen, None)
+        self._drawn = None
+
+    def draw_dirty(self, screen: pg.Surface) -> List[pg.Rect]:
+        """Repair only what changed since the last dirty frame; returns the rects to update"""
+        restore = self._drawn
+        drawn = self._compose(screen, restore)
+        self._drawn = drawn
+        if restore is None or drawn is None:
+            return [screen.get_rect()]
+        bounds = screen.get_rect()
+        return [r.clip(bounds) for r in restore + drawn if r.colliderect(bounds)]
+
+    def _compose(self, screen: pg.Surface, restore: Optional[List[pg.Rect]]) -> Optional[List[pg.Rect]]:
+        """
+        Draw the layers over the background, everywhere (restore None) or
+        only on the restore rects. Returns the rects the dynamic layers
+        covered, None when a layer did not say.
+        """
+        if restore is None:
+            if self.background is not None:
+                screen.blit(self.background, (0, 0))
+            else:
+                screen.fill(FILL_COLOR)
+        else:
+            for rect in restore:
+                if self.background is not None:
+                    screen.blit(self.background, rect, rect)
+                else:
+                    screen.fill(FILL_COLOR, rect)
+
+        drawn: Optional[List[pg.Rect]] = []
+        for _, draw, static in self.layers:
+            if static is not None:
+                surface, pos = static
+                if restore is None or drawn is None:
+                    screen.blit(surface, pos)
+                    continue
+                # Only where something below was repaired or redrawn
+                area = surface.get_rect(topleft=pos)
+                for rect in restore + drawn:
+                    clip = area.clip(rect)
+                    if clip.width and clip.height:
+                        screen.blit(surface, clip.topleft, clip.move(-pos[0], -pos[1]))
+                continue
+            result = draw(screen)
+            if result is None or drawn is None:
+                drawn = None
+            elif isinstance(result, pg.Rect):
+                drawn.append(result)
+            else:
+                drawn.extend(result)
+        return drawn
+
+
+__all__ = ["Compositor", "FILL_COLOR"]
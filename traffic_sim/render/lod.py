@@ -0,0 +1,109 @@
+# src/traffic_sim/render/lod.py
+"""
+Level of detail for road users.
+
+The full art (a rotated sprite per agent) is wasted when the screen is
+packed with agents a few pixels large. Above a number of visible agents
+they are drawn cheaper:
+
+    FULL  the rotated sprite (Car.draw, Truck.draw, ...)
+    BOX   a filled polygon over the collision corners, in the agent's colour
+          (corners cached per type and quantised heading)
+    DOT   a single pixel at the agent's position
+
+Each level is entered above its threshold and only left again below
+threshold * (1 - hysteresis), so a count hovering around a threshold does
+not make the picture flicker between levels every frame.
+"""
+import math
+from enum import IntEnum
+from typing import Dict, List, Optional, Tuple
+
+import pygame as pg
+
+try:
+    from ..services.physics import get_collision_half_extents
+    from .sprites import ROTATION_STEP
+except ImportError:
+    from traffic_sim.services.physics import get_collision_half_extents
+    from traffic_sim.render.sprites import ROTATION_STEP
+
+DEFAULT_COLOR = (200, 200, 200)
+
+# (type, heading) -> collision corners relative to the centre; headings are
+# quantised like the rotated sprites (render/sprites.py)
+_box_offsets: Dict[Tuple[str, float], List[Tuple[float, float]]] = {}
+
+
+class Detail(IntEnum):
+    FULL = 0
+    BOX = 1
+    DOT = 2
+
+
+class LevelOfDetail:
+    """Picks the detail for a frame from the number of visible agents"""
+
+    def __init__(self, box_above: int = 300, dot_above: int = 1500, hysteresis: float = 0.2):
+        self.box_above = box_above
+        self.dot_above = dot_above
+        self.hysteresis = hysteresis
+        self.detail = Detail.FULL
+
+    def _above(self, detail: Detail) -> int:
+        return self.box_above if detail is Detail.BOX else self.dot_above
+
+    def update(self, visible: int) -> Detail:
+        detail = self.detail
+        # Step up while the count is past the next threshold ...
+        while detail < Detail.DOT and visible > self._above(Detail(detail + 1)):
+            detail = Detail(detail + 1)
+        # ... and down only once it is well below the current one
+        while detail > Detail.FULL and visible < self._above(detail) * (1.0 - self.hysteresis):
+            detail = Detail(detail - 1)
+        self.detail = detail
+        return detail
+
+
+def lod_color(agent):
+    """The agent's main colour (RoadUser.LOD_COLOR_ATTR)"""
+    return getattr(agent, getattr(agent, "LOD_COLOR_ATTR", "color"), None) or DEFAULT_COLOR
+
+
+def box_offsets(agent) -> List[Tuple[float, float]]:
+    """Corners of the agent's collision rectangle (physics.get_rotated_collision_points) around its centre"""
+    angle = (round(agent.get_rotation() / ROTATION_STEP) * ROTATION_STEP) % 360.0
+    key = (type(agent).__name__, angle)
+    offsets = _box_offsets.get(key)
+    if offsets is None:
+        half_width, half_length = get_collision_half_extents(agent)
+        cos_a, sin_a = math.cos(math.radians(-angle)), math.sin(math.radians(-angle))
+        offsets = _box_offsets[key] = [
+            (x * cos_a - y * sin_a, x * sin_a + y * cos_a)
+            for x, y in ((-half_width, -half_length), (half_width, -half_length),
+                         (half_width, half_length), (-half_width, half_length))
+        ]
+    return offsets
+
+
+def draw_box(surface: pg.Surface, agent) -> pg.Rect:
+    """The agent's collision rectangle, filled; returns the area drawn."""
+    x, y = agent.pos
+    return pg.draw.polygon(surface, lod_color(agent), [(x + dx, y + dy) for dx, dy in box_offsets(agent)])
+
+
+def draw_dot(surface: pg.Surface, agent) -> pg.Rect:
+    """One pixel at the agent's position; returns the area drawn."""
+    return surface.fill(lod_color(agent), (int(agent.pos[0]), int(agent.pos[1]), 1, 1))
+
+
+def draw_agent(surface: pg.Surface, agent, detail: Detail) -> Optional[pg.Rect]:
+    """Draw agent at the given detail (FULL: its own draw())."""
+    if detail is Detail.FULL:
+        return agent.draw(surface)
+    if detail is Detail.BOX:
+        return draw_box(surface, agent)
+    return draw_dot(surface, agent)
+
+
+__all__ = ["Detail", "LevelOfDetail", "box_offsets", "draw_agent", "draw_box", "draw_dot", "lod_color"]
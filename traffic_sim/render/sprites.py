@@ -0,0 +1,66 @@
+# src/traffic_sim/render/sprites.py
+"""
+Shared sprite cache.
+
+Every road user used to draw its own vector art into a new surface. Agents
+that look the same (type, colours, size) now share one surface: the first
+agent with a look draws it, the others get the cached one. Memory grows
+with the number of distinct looks, not with the number of agents. Shared
+surfaces must never be drawn on.
+
+Rotated copies are cached too: headings are quantised to ROTATION_STEP
+degrees and each (sprite, heading) pair is rotated once, the first time it
+is drawn. Drawing is a lookup and a blit; an agent driving straight keeps
+hitting the same entry and never rotates anything.
+"""
+from typing import Callable, Dict, Hashable, Tuple
+
+import pygame as pg
+
+ROTATION_STEP = 2.0  # Degrees between cached headings
+
+_sprites: Dict[Hashable, pg.Surface] = {}
+_rotations: Dict[Tuple[pg.Surface, float], pg.Surface] = {}
+
+
+def _hashable(value):
+    if isinstance(value, list):
+        return tuple(_hashable(v) for v in value)
+    return value
+
+
+def get_sprite(key, build: Callable[[], pg.Surface]) -> pg.Surface:
+    """The surface for a look, drawn with build() the first time it is asked for."""
+    key = _hashable(key)
+    surface = _sprites.get(key)
+    if surface is None:
+        surface = _sprites[key] = build()
+    return surface
+
+
+def rotated_sprite(sprite: pg.Surface, angle: float, step: float = ROTATION_STEP) -> pg.Surface:
+    """sprite rotated by angle (degrees, counter-clockwise) rounded to step."""
+    angle = (round(angle / step) * step) % 360.0
+    if angle == 0.0:
+        return sprite
+    key = (sprite, angle)
+    rotated = _rotations.get(key)
+    if rotated is None:
+        rotated = _rotations[key] = pg.transform.rotate(sprite, angle)
+    return rotated
+
+
+def sprite_count() -> int:
+    return len(_sprites)
+
+
+def rotation_count() -> int:
+    return len(_rotations)
+
+
+def clear_sprites() -> None:
+    _sprites.clear()
+    _rotations.clear()
+
+
+__all__ = ["ROTATION_STEP", "get_sprite", "rotated_sprite", "sprite_count", "rotation_count", "clear_sprites"]
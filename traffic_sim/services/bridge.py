@@ -0,0 +1,176 @@
+# src/traffic_sim/services/bridge.py
+"""
+Movable bridge controller: boats against road traffic.
+
+The road bridge east of the intersection opens for boats. Road users whose
+route crosses it obey gates on their signal groups (Controller.add_gate),
+so closing the road is closing those gates: they stop at their stop line
+like at red, the rest of the intersection keeps running. Boats stop in
+front of the closed bridge (Lane.stop_at of services/river.py).
+
+One opening cycle:
+
+    ROAD_OPEN  boats gather in front of the bridge; it opens for a batch of
+               min_batch boats within approach_px of the stop position, or
+               when the first one has waited max_wait
+    CLEARING   gates closed, wait clearance_s and until the deck is empty
+    RAISING    raise_s to lift the bridge
+    OPEN       boats pass; the bridge stays open while boats are within
+               approach_px of the stop position, at most max_open_s
+    LOWERING   new boats stop again; once the last one is through, lower_s
+               to lower the bridge, then the gates open
+
+Delay cost is accumulated per tick: road users standing while their own
+signal is green (held by a gate or queued behind one) while the road is
+closed, and boats held in front of the bridge (SimulationStats 'bridge').
+min_batch and max_wait are the opening schedule to tune against their sum.
+"""
+from enum import Enum, auto
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+try:
+    from .river import RiverTraffic
+except ImportError:
+    from traffic_sim.services.river import RiverTraffic
+
+# Water kept between a waiting boat's bow and the bridge (px)
+STOP_MARGIN = 10.0
+# Half the length of the largest boat (60 px * 1.4 scale / 2)
+HALF_BOAT = 42.0
+
+
+class BridgeState(Enum):
+    ROAD_OPEN = auto()
+    CLEARING = auto()
+    RAISING = auto()
+    OPEN = auto()
+    LOWERING = auto()
+
+
+def lane_span(path, bridge_top: float, bridge_bottom: float) -> Tuple[float, float]:
+    """
+    (stop, clear) distances along a vertical boat lane: boats wait at stop
+    and have passed the bridge at clear.
+    """
+    start_y = path[0][1]
+    if path[-1][1] < start_y:  # Sailing up: the bottom edge comes first
+        return start_y - bridge_bottom - STOP_MARGIN - HALF_BOAT, start_y - bridge_top + HALF_BOAT
+    return bridge_top - start_y - STOP_MARGIN - HALF_BOAT, bridge_bottom - start_y + HALF_BOAT
+
+
+class BridgeController:
+    """Opens the bridge for batches of boats, closing the road through signal gates"""
+
+    def __init__(self, signals, gates: Iterable[str], river: RiverTraffic,
+                 bridge_top: float, bridge_bottom: float, deck_clear: Callable[[], bool],
+                 min_batch: int = 3, max_wait: float = 120.0, approach_px: float = 200.0,
+                 clearance_s: float = 5.0,
+                 raise_s: float = 10.0, lower_s: float = 10.0, max_open_s: float = 90.0, stats=None):
+        self.signals = signals
+        self.gates = list(gates)
+        self.river = river
+        self.deck_clear = deck_clear  # True when no road user is on the bridge
+        self.min_batch = min_batch
+        self.max_wait = max_wait
+        self.approach_px = approach_px  # Boats further upstream do not count for an opening
+        self.clearance_s = clearance_s
+        self.raise_s = raise_s
+        self.lower_s = lower_s
+        self.max_open_s = max_open_s
+        self.stats = stats
+        # Lane name -> (stop, clear) distances along the lane
+        self.spans: Dict[str, Tuple[float, float]] = {
+            name: lane_span(lane.path, bridge_top, bridge_bottom) for name, lane in river.lanes.items()
+        }
+        self.state = BridgeState.ROAD_OPEN
+        self._since = 0.0  # Time the current state (or LOWERING's timer) started
+        self._first_wait: Optional[float] = None  # When the first boat reached the closed bridge
+        self._lowered = False  # LOWERING: the last boat is through, the bridge is coming down
+        self._batch = 0
+        self._hold_boats(True)
+
+    @property
+    def road_closed(self) -> bool:
+        return self.state is not BridgeState.ROAD_OPEN
+
+    def _hold_boats(self, hold: bool) -> None:
+        for name, lane in self.river.lanes.items():
+            lane.stop_at = self.spans[name][0] if hold else None
+
+    def _set_gates(self, is_open: bool) -> None:
+        for gate in self.gates:
+            self.signals.set_gate(gate, is_open)
+
+    def approaching(self) -> int:
+        """Boats within approach_px before the stop position (held ones included)"""
+        return sum(1 for name, lane in self.river.lanes.items() for boat in lane.boats
+                   if self.spans[name][0] - self.approach_px <= boat.travelled <= self.spans[name][0])
+
+    def waiting(self) -> int:
+        """Boats standing at the closed bridge or queued behind one"""
+        return sum(lane.held for lane in self.river.lanes.values())
+
+    def passing(self) -> int:
+        """Boats between the stop position and past the bridge"""
+        return sum(1 for name, lane in self.river.lanes.items() for boat in lane.boats
+                   if self.spans[name][0] < boat.travelled < self.spans[name][1])
+
+    def _at_stop(self) -> bool:
+        """True when a boat has reached the stop position of its lane"""
+        return any(self.spans[name][0] - 0.5 <= boat.travelled <= self.spans[name][0]
+                   for name, lane in self.river.lanes.items() for boat in lane.boats)
+
+    def _enter(self, state: BridgeState, now: float) -> None:
+        self.state = state
+        self._since = now
+
+    def update(self, dt: float, now: float, road_waiting: int = 0) -> None:
+        """
+        Advance the opening cycle. road_waiting: road users standing at green
+        this tick (counted as delay while the road is closed).
+        """
+        if self.stats is not None:
+            self.stats.record_bridge_delay(dt, self.road_closed, road_waiting if self.road_closed else 0,
+                                           self.waiting())
+        state = self.state
+        if state is BridgeState.ROAD_OPEN:
+            if self._first_wait is None and self._at_stop():
+                self._first_wait = now
+            batch = self.approaching()
+            if batch and (batch >= self.min_batch or
+                          (self._first_wait is not None and now - self._first_wait >= self.max_wait)):
+                self._batch = batch
+                self._set_gates(False)
+                self._enter(BridgeState.CLEARING, now)
+        elif state is BridgeState.CLEARING:
+            if now - self._since >= self.clearance_s and self.deck_clear():
+                self._enter(BridgeState.RAISING, now)
+        elif state is BridgeState.RAISING:
+            if now - self._since >= self.raise_s:
+                self._hold_boats(False)
+                self._enter(BridgeState.OPEN, now)
+                if self.stats is not None:
+                    self.stats.record_bridge_opening(self._batch)
+        elif state is BridgeState.OPEN:
+            if not self.approaching() or now - self._since >= self.max_open_s:
+                self._hold_boats(True)
+                self._lowered = False
+                self._enter(BridgeState.LOWERING, now)
+        elif state is BridgeState.LOWERING:
+            if not self._lowered and not self.passing():
+                self._lowered = True
+                self._since = now
+            if self._lowered and now - self._since >= self.lower_s:
+                self._set_gates(True)
+                self._first_wait = None
+                self._enter(BridgeState.ROAD_OPEN, now)
+                # Boats that were held back this time wait from now on
+                if self._at_stop():
+                    self._first_wait = now
+
+    def time_until_next(self) -> float:
+        """0 during an opening cycle (timers run), inf while the road is open"""
+        return 0.0 if self.road_closed else float('inf')
+
+
+__all__ = ["BridgeController", "BridgeState", "lane_span"]
@@ -0,0 +1,221 @@
+# src/traffic_sim/services/car_following.py
+"""
+Intelligent Driver Model (IDM) car-following.
+
+The binary rule in physics.calculate_safe_following_speed either drives at full
+speed or stops dead, which makes queues oscillate. IDM gives a smooth
+acceleration from the gap to the leader and the speed difference:
+
+    a = a_max * [1 - (v / v0)^delta - (s* / s)^2]
+    s* = s0 + max(0, v*T + v*dv / (2*sqrt(a_max*b)))
+
+compute_lane_accelerations() evaluates this for all agents at once, lane by
+lane: agents are grouped by their approach (path start point), sorted by
+progress along the path, and each one gets its leader from the sorted order
+instead of scanning every other agent. Parked agents (services/sleeping.py)
+are not computed; they only stand in their lane as leaders, so the cost
+follows the moving agents. Select the model with
+Config.CAR_FOLLOWING_MODEL = "IDM".
+"""
+import math
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from ..configuration import Config
+    from .physics import get_collision_half_extents, find_vehicle_ahead
+except ImportError:
+    from traffic_sim.configuration import Config
+    from traffic_sim.services.physics import get_collision_half_extents, find_vehicle_ahead
+
+# Lateral offset (px) beyond which an agent further along the same lane no
+# longer counts as a leader (it has turned off onto another road)
+LANE_HALF_WIDTH = 25.0
+
+# How far ahead (in arc length) the kernel looks for a leader
+LOOKAHEAD_DISTANCE = 400.0
+
+# Smallest gap used in the formula, avoids division by zero on contact
+_MIN_EFFECTIVE_GAP = 0.1
+
+
+def get_desired_speed(agent) -> float:
+    """Desired speed v0: configured per type, or the agent's spawn speed."""
+    desired = agent.get_idm_settings().get("DESIRED_SPEED")
+    return float(desired) if desired is not None else float(agent.speed)
+
+
+def idm_acceleration(v: float, v0: float, gap: float, dv: float, params: dict) -> float:
+    """
+    IDM acceleration for one agent.
+
+    Args:
+        v: current speed
+        v0: desired speed
+        gap: bumper-to-bumper distance to the leader (inf when free road)
+        dv: approach rate, own speed minus leader speed
+        params: IDM parameters for this vehicle type (Config.IDM_PARAMS)
+    """
+    a_max = params["MAX_ACCELERATION"]
+    b = params["COMFORTABLE_DECELERATION"]
+    free_road = 1.0 - (v / v0) ** params["ACCELERATION_EXPONENT"] if v0 > 0 else -1.0
+    if math.isinf(gap):
+        return a_max * free_road
+    s_star = params["MIN_GAP"] + max(0.0, v * params["TIME_HEADWAY"] + v * dv / (2.0 * math.sqrt(a_max * b)))
+    s = max(gap, _MIN_EFFECTIVE_GAP)
+    return a_max * (free_road - (s_star / s) ** 2)
+
+
+def _stop_line_gap(agent, progress: float) -> Optional[float]:
+    """
+    Gap to the stop line when the agent must wait for red, treated as a
+    standing leader. MIN_GAP is added so the equilibrium is exactly at the line.
+    """
+    cross_index = getattr(agent, 'cross_index', None)
+    if cross_index is None or agent.i > cross_index or cross_index >= len(agent.path):
+        return None
+    stop_progress = agent._path_cumulative_lengths()[cross_index]
+    if progress > stop_progress or agent._can_cross():
+        return None
+    return stop_progress - progress + agent.get_idm_settings()["MIN_GAP"]
+
+
+def _bumper_gap(follower, leader) -> float:
+    centre_distance = math.hypot(leader.pos[0] - follower.pos[0], leader.pos[1] - follower.pos[1])
+    return centre_distance - get_collision_half_extents(follower)[1] - get_collision_half_extents(leader)[1]
+
+
+def _leader_gap(agent, leader) -> Tuple[float, float]:
+    """(bumper gap, approach rate) to the leader; free road when there is none."""
+    if leader is None:
+        return float('inf'), 0.0
+    return _bumper_gap(agent, leader), agent.velocity - getattr(leader, 'velocity', 0.0)
+
+
+def _heading(agent) -> Optional[Tuple[float, float]]:
+    if agent.i < len(agent.path) - 1:
+        nxt = agent.path[agent.i + 1]
+        dx, dy = nxt[0] - agent.pos[0], nxt[1] - agent.pos[1]
+    else:
+        exit_direction = getattr(agent, '_exit_direction', None)
+        if not exit_direction:
+            return None
+        dx, dy = exit_direction
+    length = math.hypot(dx, dy)
+    if length == 0:
+        return None
+    return dx / length, dy / length
+
+
+def _find_lane_leader(lane: List, progress: List[float], k: int):
+    """Nearest agent ahead of lane[k] that is still on the same road."""
+    follower = lane[k]
+    heading = _heading(follower)
+    if heading is None:
+        return None
+    hx, hy = heading
+    for j in range(k + 1, len(lane)):
+        if progress[j] - progress[k] > LOOKAHEAD_DISTANCE:
+            break
+        other = lane[j]
+        to_x = other.pos[0] - follower.pos[0]
+        to_y = other.pos[1] - follower.pos[1]
+        if to_x * hx + to_y * hy <= 0:
+            continue
+        if abs(to_x * hy - to_y * hx) > LANE_HALF_WIDTH:
+            continue  # Turned off onto another road
+        return other
+    return None
+
+
+def group_by_lane(agents: List) -> Dict[Tuple[float, float], List]:
+    """Group active road users by lane key (start point of their path)."""
+    lanes: Dict[Tuple[float, float], List] = {}
+    for agent in agents:
+        if getattr(agent, 'done', False) or not hasattr(agent, 'get_lane_key'):
+            continue
+        key = agent.get_lane_key()
+        if key is not None:
+            lanes.setdefault(key, []).append(agent)
+    return lanes
+
+
+def compute_lane_accelerations(agents: List, standing: List = ()) -> None:
+    """
+    Compute the IDM acceleration of every road user in one pass per lane.
+
+    Results are stored on the agents (idm_acceleration, idm_gap,
+    idm_max_advance, the distance it may move before touching its leader, and
+    idm_leader) and consumed by RoadUser.plan on the same tick.
+    standing: parked agents; they get nothing computed but are leaders in
+    their lane (lanes without any of `agents` are not looked at).
+    """
+    lanes = group_by_lane(agents)
+    parked = set()
+    for agent in standing:
+        lane = lanes.get(agent.get_lane_key())
+        if lane is not None:
+            lane.append(agent)
+            parked.add(id(agent))
+
+    for lane in lanes.values():
+        progress = [a.get_progress() for a in lane]
+        order = sorted(range(len(lane)), key=progress.__getitem__)
+        lane = [lane[k] for k in order]
+        progress = [progress[k] for k in order]
+        movers = [k for k, agent in enumerate(lane) if id(agent) not in parked]
+
+        # Gather the state of the moving agents as parallel arrays
+        params = [lane[k].get_idm_settings() for k in movers]
+        v = [lane[k].velocity for k in movers]
+        v0 = [get_desired_speed(lane[k]) for k in movers]
+        gaps: List[float] = []
+        dvs: List[float] = []
+        for n, k in enumerate(movers):
+            agent = lane[k]
+            leader = _find_lane_leader(lane, progress, k)
+            gap, dv = _leader_gap(agent, leader)
+            agent.idm_max_advance = max(0.0, gap)
+            agent.idm_leader = leader
+            stop_gap = _stop_line_gap(agent, progress[k])
+            if stop_gap is not None and stop_gap < gap:
+                gap, dv = stop_gap, v[n]
+                agent.idm_leader = None
+            gaps.append(gap)
+            dvs.append(dv)
+
+        accelerations = [idm_acceleration(*state) for state in zip(v, v0, gaps, dvs, params)]
+        for agent, acceleration, gap in zip((lane[k] for k in movers), accelerations, gaps):
+            agent.idm_acceleration = acceleration
+            agent.idm_gap = gap
+
+
+def compute_idm_acceleration_single(agent) -> float:
+    """
+    IDM acceleration for a single agent without the lane kernel, for agents
+    updated on their own (demo scripts, tests).
+    """
+    v = agent.velocity
+    leader = None
+    all_agents = getattr(agent, 'all_agents', None)
+    if all_agents:
+        result = find_vehicle_ahead(agent, all_agents)
+        if result is not None:
+            leader, _ = result
+    gap, dv = _leader_gap(agent, leader)
+    agent.idm_max_advance = max(0.0, gap)
+    agent.idm_leader = leader
+    stop_gap = _stop_line_gap(agent, agent.get_progress())
+    if stop_gap is not None and stop_gap < gap:
+        gap, dv = stop_gap, v
+        agent.idm_leader = None
+    agent.idm_gap = gap
+    return idm_acceleration(v, get_desired_speed(agent), gap, dv, agent.get_idm_settings())
+
+
+__all__ = [
+    "idm_acceleration",
+    "compute_lane_accelerations",
+    "compute_idm_acceleration_single",
+    "get_desired_speed",
+    "group_by_lane",
+]
@@ -0,0 +1,212 @@
+# src/traffic_sim/services/demand.py
+"""
+Poisson demand model.
+
+Demand is given as origin-destination flows: a rate in vehicles per hour per
+route (the CARS_/BIKES_/PEDS_ names of services/pathing.py) and actor type.
+Arrivals of a Poisson process have exponentially distributed gaps, so the
+arrival times of a whole block of simulated time are drawn in one batch per
+flow (gaps, then a running sum) and merged into one heap. The App pops what
+is due each tick; between arrivals spawning costs nothing.
+
+Every flow draws from its own random stream, seeded from the model's seed
+and the flow's name, so two runs with the same seed see the same arrivals
+on a route whatever the other rates are (common random numbers).
+
+Rates can also vary over the day: read_count_profile() streams a CSV of
+15-minute turning-movement counts as piecewise-constant rates, and
+PoissonDemand(profile=...) generates one block per counting interval.
+The file is read one row ahead of the simulation, so multi-day files
+never sit in memory.
+"""
+import bisect
+import csv
+import heapq
+import itertools
+import math
+import random
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Simulated seconds of arrivals generated at a time
+BLOCK_SECONDS = 900.0
+
+# Counting interval assumed for the last row of a count file
+COUNT_INTERVAL = 900.0
+
+# Actor type counted by a count-file column that only names the route
+DEFAULT_ACTORS = {"CARS_": "CAR", "BIKES_": "CYCLIST", "PEDS_": "PEDESTRIAN"}
+
+# (start, end, {route: {actor type: vehicles per hour}}) in simulated seconds
+Interval = Tuple[float, float, Dict[str, Dict[str, float]]]
+
+
+class PoissonDemand:
+    """Pre-generated Poisson arrivals per (route, actor type), released in time order."""
+
+    def __init__(self, rates: Optional[Dict[str, Dict[str, float]]] = None, seed: Optional[int] = None,
+                 block_s: float = BLOCK_SECONDS, profile: Optional[Iterable[Interval]] = None):
+        # rates: route name -> {actor type: vehicles per hour}, constant over
+        # time; or a profile of intervals with their own rates
+        self.rates = {route: dict(actors) for route, actors in (rates or {}).items()}
+        self.profile: Optional[Iterator[Interval]] = iter(profile) if profile is not None else None
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self.block_s = float(block_s)
+        self.interval: Optional[Tuple[float, float]] = None  # Latest generated profile interval
+        self.released = 0  # Arrivals handed out by pop_due()
+        self._streams: Dict[Tuple[str, str], random.Random] = {}
+        self._heap: List[Tuple[float, int, str, str]] = []  # (time, seq, route, actor)
+        self._seq = itertools.count()
+        self._horizon = 0.0  # Arrivals are generated up to here
+
+    def _stream(self, route: str, actor: str) -> random.Random:
+        key = (route, actor)
+        if key not in self._streams:
+            self._streams[key] = random.Random(f"{self.seed}:{route}:{actor}")
+        return self._streams[key]
+
+    def _next_block(self) -> Optional[Interval]:
+        if self.profile is None:
+            return self._horizon, self._horizon + self.block_s, self.rates
+        return next(self.profile, None)
+
+    def _generate_block(self) -> None:
+        """Draw the arrivals of every flow in the next block in one batch each."""
+        block = self._next_block()
+        if block is None:  # Profile exhausted: no more demand
+            self._horizon = float('inf')
+            return
+        start, end, rates = block
+        if self.profile is not None:
+            self.rates, self.interval = rates, (start, end)
+        for route, actors in rates.items():
+            for actor, rate in actors.items():
+                if rate > 0:
+                    for t in arrival_times(self._stream(route, actor), rate / 3600.0, end - start):
+                        self._heap.append((start + t, next(self._seq), route, actor))
+        heapq.heapify(self._heap)
+        self._horizon = end
+
+    def _fill(self, now: float) -> None:
+        while self._horizon <= now or (not self._heap and self._more_demand()):
+            self._generate_block()
+
+    def _more_demand(self) -> bool:
+        if self.profile is not None:
+            return self._horizon < float('inf')
+        return any(rate > 0 for actors in self.rates.values() for rate in actors.values())
+
+    def pop_due(self, now: float) -> List[Tuple[str, str]]:
+        """(route, actor) of every arrival up to time `now`, in order."""
+        self._fill(now)
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, route, actor = heapq.heappop(self._heap)
+            due.append((route, actor))
+        self.released += len(due)
+        return due
+
+    def time_until_next(self, now: float) -> float:
+        """Seconds until the next arrival (inf without demand)."""
+        self._fill(now)
+        if not self._heap:
+            return float('inf')
+        return max(0.0, self._heap[0][0] - now)
+
+    def expected_per_hour(self) -> float:
+        """Total demand rate (of the latest profile interval)."""
+        return sum(rate for actors in self.rates.values() for rate in actors.values())
+
+
+def arrival_times(rng: random.Random, rate_per_s: float, length: float) -> List[float]:
+    """Poisson arrival times in [0, length): exponential gaps drawn in batches and summed."""
+    expected = rate_per_s * length
+    batch = int(expected + 3.0 * math.sqrt(expected)) + 1  # Nearly always one batch
+    times: List[float] = []
+    t = 0.0
+    while True:
+        gaps = [rng.expovariate(rate_per_s) for _ in range(batch)]
+        cumulative = list(itertools.accumulate(gaps, initial=t))[1:]
+        cut = bisect.bisect_left(cumulative, length)
+        times.extend(cumulative[:cut])
+        if cut < batch:
+            return times
+        t = cumulative[-1]
+
+
+def _parse_time(text: str) -> datetime:
+    """'HH:MM[:SS]', 'YYYY-MM-DD HH:MM[:SS]' (or with a T) or plain seconds."""
+    text = text.strip()
+    try:
+        return datetime.min + timedelta(seconds=float(text))
+    except ValueError:
+        pass
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M",
+                "%H:%M:%S", "%H:%M"):
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognised time in count file: {text!r}")
+
+
+def _column_flow(name: str) -> Tuple[str, str]:
+    """'ROUTE:ACTOR', or 'ROUTE' for the route's usual actor type."""
+    route, _, actor = name.strip().partition(":")
+    if not actor:
+        actor = next((a for prefix, a in DEFAULT_ACTORS.items() if route.startswith(prefix)), "CAR")
+    return route, actor.upper()
+
+
+def read_count_profile(path, interval_s: float = COUNT_INTERVAL) -> Iterator[Interval]:
+    """
+    Stream a turning-movement count file as piecewise-constant demand.
+
+    The first column is the start of a counting interval, every other column
+    the count of one flow ("CARS_NS_UP" or "CARS_NS_UP:TRUCK") in it:
+
+        start,CARS_NS_UP,CARS_NS_UP:TRUCK,PEDS_EW_RIGHT
+        07:00,95,12,30
+        07:15,120,10,41
+
+    An interval ends where the next row starts (interval_s for the last
+    row); its counts become vehicles per hour. Times run in simulated
+    seconds from the first row, passing midnight when a time without a
+    date goes backwards. Rows are read one ahead of the caller.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(row for row in f if row.strip() and not row.lstrip().startswith("#"))
+        header = next(reader, None)
+        if header is None:
+            return
+        flows = [_column_flow(name) for name in header[1:]]
+        origin = previous = None
+        day = timedelta(0)
+        pending = None  # (start s, counts) of the row waiting for its end time
+        for row in reader:
+            when = _parse_time(row[0]) + day
+            if previous is not None and when < previous:  # Time of day wrapped past midnight
+                day += timedelta(days=1)
+                when += timedelta(days=1)
+            previous = when
+            origin = origin or when
+            start = (when - origin).total_seconds()
+            counts = [float(c) if c.strip() else 0.0 for c in row[1:]]
+            if pending is not None:
+                if start <= pending[0]:
+                    raise ValueError(f"Count file rows out of order at {row[0]!r}")
+                yield _interval(pending[0], start, flows, pending[1])
+            pending = (start, counts)
+        if pending is not None:
+            yield _interval(pending[0], pending[0] + interval_s, flows, pending[1])
+
+
+def _interval(start: float, end: float, flows, counts) -> Interval:
+    rates: Dict[str, Dict[str, float]] = {}
+    for (route, actor), count in zip(flows, counts):
+        rates.setdefault(route, {})
+        rates[route][actor] = rates[route].get(actor, 0.0) + count * 3600.0 / (end - start)
+    return start, end, rates
+
+
+__all__ = ["PoissonDemand", "arrival_times", "read_count_profile", "BLOCK_SECONDS", "COUNT_INTERVAL"]
@@ -0,0 +1,170 @@
+# src/traffic_sim/services/detectors.py
+"""
+Virtual loop detectors for vehicle-actuated signal control.
+
+Every approach (routes that share their start point and stop line, see
+services/pathing.py) gets two loops:
+
+- a passage loop upstream of the stop line, which counts arrivals and
+  remembers when the last one passed
+- a presence loop just before the stop line, occupied while someone is
+  standing or driving on it
+
+Agents are tracked by the zone they are in (before the upstream loop, between
+the loops, on the presence loop, inside the intersection, cleared).
+update() only looks at
+the agents that moved this tick and adjusts the per-group counters when one
+changes zone, so nothing is rescanned. Parked agents keep their zone.
+
+The Controller's actuated mode reads has_demand() to skip ped/bike stages
+nobody waits for, and has_arrivals() to extend green while traffic keeps
+coming. Max-pressure control reads pressure(): per movement (a group's
+routes to one exit link, the link being the road the route leaves by, keyed
+by its end point) the queue on the approach minus the agents of any group
+occupying that downstream link, summed over the group's movements that have
+a queue. A blocked exit (a closed bridge, a jam) thus lowers the pressure of
+the movements feeding it. Both
+adaptive modes hold the next stage while box_clear() says agents of other
+groups are still inside the intersection.
+"""
+import math
+from typing import Dict, List, Tuple
+
+# Zones along an approach
+BEFORE_LOOP, APPROACHING, AT_STOP_LINE, IN_BOX, PASSED = 0, 1, 2, 3, 4
+
+# Agents may still stop for red this far past the stop line (RoadUser.plan),
+# so they only count as discharged beyond it
+COMMITMENT_DISTANCE = 30.0
+
+
+class LoopDetectors:
+    """Presence and passage loops per signal group, kept up to date incrementally."""
+
+    def __init__(self, upstream_distance: float = 150.0, presence_zone: float = 40.0,
+                 box_length: float = 250.0):
+        self.upstream_distance = upstream_distance  # Passage loop: px before the stop line
+        self.presence_zone = presence_zone          # Presence loop length before the stop line
+        self.box_length = box_length                # Path length inside the intersection
+        self.loops: Dict[Tuple, Dict] = {}          # Approach (start, stop line) -> loop positions
+        self.presence: Dict[str, int] = {}          # Agents on the presence loop
+        self.queued: Dict[str, int] = {}            # Agents between passage loop and stop line
+        self.passages: Dict[str, int] = {}          # Arrivals counted by the passage loop
+        self.discharged: Dict[str, int] = {}        # Agents that crossed the stop line
+        self.queued_to: Dict[Tuple, int] = {}       # (group, exit link) -> agents queued for it
+        self.link_occupancy: Dict[Tuple, int] = {}  # Exit link -> discharged agents still on it
+        self.in_box: Dict[str, int] = {}            # Discharged agents still inside the intersection
+        self.last_passage: Dict[str, float] = {}    # Time of the last arrival per group
+
+    def add_route(self, group: str, path_px: List) -> None:
+        """Place loops on the approach of a route (once per start point and stop line)."""
+        if len(path_px) < 3:
+            return
+        start, stop = tuple(path_px[0]), tuple(path_px[1])
+        if (start, stop) in self.loops:
+            return
+        length = math.hypot(stop[0] - start[0], stop[1] - start[1])
+        back = min(self.upstream_distance, length) / length if length > 0 else 0.0
+        self.loops[(start, stop)] = {
+            "group": group,
+            "stop_line": stop,
+            "passage": (stop[0] + (start[0] - stop[0]) * back, stop[1] + (start[1] - stop[1]) * back),
+        }
+        for counter in (self.presence, self.queued, self.passages, self.discharged, self.in_box):
+            counter.setdefault(group, 0)
+        link = self._link(path_px)
+        self.queued_to.setdefault((group, link), 0)
+        self.link_occupancy.setdefault(link, 0)
+        self.last_passage.setdefault(group, float('-inf'))
+
+    @staticmethod
+    def _link(path_px) -> Tuple:
+        """The exit link a route leaves the intersection by: its end point"""
+        return tuple(path_px[-1])
+
+    def _zone(self, agent) -> int:
+        # Arc length to the stop line (waypoint 1), negative once past it
+        distance = agent._path_cumulative_lengths()[1] - agent.get_progress()
+        if distance < -self.box_length:
+            return PASSED
+        if distance < -COMMITMENT_DISTANCE:
+            return IN_BOX
+        if distance <= self.presence_zone:
+            return AT_STOP_LINE
+        if distance <= self.upstream_distance:
+            return APPROACHING
+        return BEFORE_LOOP
+
+    def update(self, agents, now: float) -> None:
+        """Move the agents that moved this tick to their new zone."""
+        for agent in agents:
+            group = getattr(agent, 'signal_group', None)
+            if group not in self.presence or not getattr(agent, 'path', None):
+                continue
+            old = getattr(agent, '_loop_zone', BEFORE_LOOP)
+            new = self._zone(agent)
+            if new > old:  # Zones only count forwards (small push-backs don't re-count)
+                link = self._link(agent.path)
+                self._leave(group, link, old)
+                self._enter(group, link, old, new, now)
+                agent._loop_zone = new
+
+    def _enter(self, group: str, link: Tuple, old: int, new: int, now: float) -> None:
+        if old == BEFORE_LOOP and new != BEFORE_LOOP:
+            self.passages[group] += 1
+            self.last_passage[group] = now
+        if new in (APPROACHING, AT_STOP_LINE):
+            self.queued[group] += 1
+            self.queued_to[(group, link)] = self.queued_to.get((group, link), 0) + 1
+        if new == AT_STOP_LINE:
+            self.presence[group] += 1
+        if new == IN_BOX or (new == PASSED and old != IN_BOX):
+            self.discharged[group] += 1
+            self.link_occupancy[link] = self.link_occupancy.get(link, 0) + 1
+        if new == IN_BOX:
+            self.in_box[group] += 1
+
+    def _leave(self, group: str, link: Tuple, old: int) -> None:
+        if old in (APPROACHING, AT_STOP_LINE):
+            self.queued[group] -= 1
+            self.queued_to[(group, link)] -= 1
+        if old == AT_STOP_LINE:
+            self.presence[group] -= 1
+        if old == IN_BOX:
+            self.in_box[group] -= 1
+
+    def remove(self, agent) -> None:
+        """An agent left the simulation."""
+        group = getattr(agent, 'signal_group', None)
+        zone = getattr(agent, '_loop_zone', None)
+        if group in self.presence and zone is not None:
+            link = self._link(agent.path)
+            self._leave(group, link, zone)
+            if zone in (IN_BOX, PASSED):
+                self.link_occupancy[link] -= 1
+            agent._loop_zone = None
+
+    # --- Queries for the Controller ---
+    def has_demand(self, group: str) -> bool:
+        """Someone is on its way to, or waiting at, the stop line."""
+        return self.queued.get(group, 0) > 0
+
+    def has_arrivals(self, group: str, now: float, gap: float) -> bool:
+        """The presence loop is occupied or the last arrival passed less than `gap` ago."""
+        return self.presence.get(group, 0) > 0 or now - self.last_passage.get(group, float('-inf')) < gap
+
+    def pressure(self, group: str) -> int:
+        """Sum over the group's queued movements of queue minus downstream link occupancy."""
+        return sum(queued - self.link_occupancy.get(link, 0)
+                   for (g, link), queued in self.queued_to.items() if g == group and queued > 0)
+
+    def box_clear(self, groups) -> bool:
+        """No agent of these groups is inside the intersection any more."""
+        return not any(self.in_box.get(group, 0) for group in groups)
+
+    def time_until_gap_out(self, group: str, now: float, gap: float) -> float:
+        """Seconds until the passage gap runs out (0 if it already has)."""
+        return max(0.0, self.last_passage.get(group, float('-inf')) + gap - now)
+
+
+__all__ = ["LoopDetectors", "BEFORE_LOOP", "APPROACHING", "AT_STOP_LINE", "IN_BOX", "PASSED"]
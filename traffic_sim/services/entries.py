@@ -0,0 +1,134 @@
+# src/traffic_sim/services/entries.py
+"""
+Entry queues: demand waiting to get into the simulation.
+
+Every spawn point (the start of one or more routes, see services/pathing.py)
+has a virtual queue of arrivals that could not be spawned yet because the
+entry was occupied or the agent limit was reached. Arrivals are never
+dropped: they wait in order and are released once the entry is clear, and
+the time they waited is their entry delay.
+
+An entry is blocked while the last agent released there has not moved
+CLEARANCE px away from the spawn point; that is one distance per entry per
+tick, whatever the number of agents. Only entries with a queue are looked
+at. Agents are pooled and come back on other trips (Spawner.recycle), so
+the App calls remove() when one leaves and the entry forgets it.
+
+Each entry also counts the agents within SPAWN_RADIUS of its spawn point
+(an occupancy registry): agents are added when they spawn there and
+dropped once they drive out of the radius or finish. Only those agents are
+looked at again, so whether an entry has room is a counter read.
+"""
+import math
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Tuple
+
+Vec2 = Tuple[float, float]
+
+# Distance (px) the last released agent must have driven before the next one
+CLEARANCE = 90.0
+
+# Agents this close (px) to a spawn point occupy the entry, at most
+# MAX_OCCUPANCY of them before it takes no new agents
+SPAWN_RADIUS = 180.0
+MAX_OCCUPANCY = 3
+
+
+class Entry:
+    """One spawn point: pending arrivals in order, the last agent released and its occupants."""
+
+    def __init__(self, point: Vec2, limit: int = MAX_OCCUPANCY):
+        self.point = point
+        self.queue: Deque[Tuple[float, str, str]] = deque()  # (arrival time, route, actor)
+        self.last_agent = None
+        self.occupants: List = []  # Agents within the spawn radius
+        self.limit = limit
+
+    def has_room(self) -> bool:
+        return len(self.occupants) < self.limit
+
+    def blocked(self, clearance: float) -> bool:
+        agent = self.last_agent
+        if agent is None or getattr(agent, "done", False):
+            return False
+        return math.hypot(agent.pos[0] - self.point[0], agent.pos[1] - self.point[1]) < clearance
+
+
+class EntryQueues:
+    """Virtual queues per spawn point."""
+
+    def __init__(self, clearance: float = CLEARANCE, radius: float = SPAWN_RADIUS):
+        self.clearance = clearance
+        self.radius = radius
+        self.entries: Dict[Vec2, Entry] = {}
+        self._waiting: Dict[Vec2, Entry] = {}   # Entries with a queue
+        self._occupied: Dict[Vec2, Entry] = {}  # Entries with agents in their radius
+        self.queued = 0  # Arrivals waiting over all entries
+
+    def entry(self, point: Vec2) -> Entry:
+        point = tuple(point)
+        if point not in self.entries:
+            self.entries[point] = Entry(point)
+        return self.entries[point]
+
+    def arrive(self, point: Vec2, route: str, actor: str, now: float) -> None:
+        """An arrival joins the back of its entry's queue."""
+        entry = self.entry(point)
+        entry.queue.append((now, route, actor))
+        self._waiting[entry.point] = entry
+        self.queued += 1
+
+    def ready(self) -> Iterator[Entry]:
+        """Entries with a queue whose spawn point is clear and that have room."""
+        for entry in list(self._waiting.values()):
+            if entry.has_room() and not entry.blocked(self.clearance):
+                yield entry
+
+    def occupy(self, agent) -> None:
+        """An agent appeared at the start of its path: it occupies that entry."""
+        entry = self.entry(agent.path[0])
+        entry.occupants.append(agent)
+        self._occupied[entry.point] = entry
+
+    def update_occupancy(self) -> None:
+        """Drop occupants that left the spawn radius or the simulation."""
+        r2 = self.radius * self.radius
+        for point, entry in list(self._occupied.items()):
+            entry.occupants = [
+                a for a in entry.occupants
+                if not getattr(a, "done", False)
+                and (a.pos[0] - point[0]) ** 2 + (a.pos[1] - point[1]) ** 2 < r2
+            ]
+            if not entry.occupants:
+                del self._occupied[point]
+
+    def remove(self, agent) -> None:
+        """An agent left the simulation: it no longer blocks or occupies its entry."""
+        entry = self.entries.get(tuple(agent.path[0])) if getattr(agent, "path", None) else None
+        if entry is None:
+            return
+        if entry.last_agent is agent:
+            entry.last_agent = None
+        if agent in entry.occupants:
+            entry.occupants.remove(agent)
+            if not entry.occupants:
+                self._occupied.pop(entry.point, None)
+
+    def release(self, entry: Entry, agent, now: float) -> float:
+        """The head of the queue was spawned as agent; returns its entry delay."""
+        arrived, _, _ = entry.queue.popleft()
+        if not entry.queue:
+            del self._waiting[entry.point]
+        entry.last_agent = agent
+        self.queued -= 1
+        return now - arrived
+
+    def pending_delay(self, now: float) -> float:
+        """Time waited so far by the arrivals still queued at all entries."""
+        return sum(now - arrived for entry in self._waiting.values() for arrived, _, _ in entry.queue)
+
+    def queue_lengths(self) -> Dict[Vec2, int]:
+        return {point: len(entry.queue) for point, entry in self.entries.items()}
+
+
+__all__ = ["EntryQueues", "Entry", "CLEARANCE", "SPAWN_RADIUS", "MAX_OCCUPANCY"]
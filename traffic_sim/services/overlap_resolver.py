@@ -0,0 +1,102 @@
+# src/traffic_sim/services/overlap_resolver.py
+"""
+Constraint-based overlap resolver.
+
+Each overlapping pair from the collision broad phase (physics.find_contact_pairs)
+is a constraint "these two boxes must not overlap". The solver projects the
+agents back onto that constraint one pair at a time (Gauss-Seidel style) and
+repeats for a few iterations, because pushing one agent back can create a new
+contact behind it.
+
+Agents are only ever moved along their own route: the one that ran into the
+other goes back in arc length until the boxes separate. Nothing is pushed
+sideways off its lane. If it is already at the start of its route, the one in
+front is moved forward instead.
+"""
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    from ..configuration import Config
+    from .physics import find_contact_pairs, get_heading_vector, separation_distance, rectangles_collide
+except ImportError:
+    from traffic_sim.configuration import Config
+    from traffic_sim.services.physics import find_contact_pairs, get_heading_vector, separation_distance, rectangles_collide
+
+
+def _order_pair(a, b) -> Tuple:
+    """(follower, leader): the follower is the one whose nose points at the other."""
+    heading_a = get_heading_vector(a)
+    heading_b = get_heading_vector(b)
+    b_ahead_of_a = (b.pos[0] - a.pos[0]) * heading_a[0] + (b.pos[1] - a.pos[1]) * heading_a[1]
+    a_ahead_of_b = (a.pos[0] - b.pos[0]) * heading_b[0] + (a.pos[1] - b.pos[1]) * heading_b[1]
+    return (a, b) if b_ahead_of_a >= a_ahead_of_b else (b, a)
+
+
+def _resolve_pair(a, b, margin: float) -> float:
+    """Separate one overlapping pair along their routes. Returns the distance moved."""
+    follower, leader = _order_pair(a, b)
+    heading = get_heading_vector(follower)
+    depth = separation_distance(follower, (-heading[0], -heading[1]), leader)
+    if depth == 0.0:
+        return 0.0
+
+    progress = follower.get_progress()
+    if depth != float('inf') and progress > 0.0:
+        back = min(progress, depth + margin)
+        follower.move_to_progress(progress - back)
+        return back
+
+    # The follower cannot back up (route start, or backing up never separates):
+    # move the leader forward along its own route instead
+    heading = get_heading_vector(leader)
+    depth = separation_distance(leader, heading, follower)
+    if depth == float('inf'):
+        return 0.0
+    forward = depth + margin
+    leader.move_to_progress(leader.get_progress() + forward)
+    return forward
+
+
+def resolve_overlaps(agents: Sequence, contacts: Optional[List[Tuple]] = None,
+                     max_iterations: Optional[int] = None) -> Tuple[int, float]:
+    """
+    Push overlapping agents apart along their routes.
+
+    Args:
+        agents: All agents (used to find new contacts between iterations)
+        contacts: Overlapping pairs from find_contact_pairs(), if already known
+        max_iterations: Solver passes (defaults to Config.OVERLAP_RESOLVER)
+
+    Returns:
+        (number of pair corrections, total distance moved in pixels)
+    """
+    settings = Config.OVERLAP_RESOLVER
+    if max_iterations is None:
+        max_iterations = settings["MAX_ITERATIONS"]
+    margin = settings["MARGIN"]
+
+    # Only road users can be moved along a route (boats sail their own course)
+    movable = [a for a in agents if hasattr(a, 'move_to_progress') and not getattr(a, 'done', False)]
+    if contacts is None:
+        contacts = find_contact_pairs(movable)
+
+    corrections = 0
+    moved = 0.0
+    for _ in range(max_iterations):
+        pairs = [(a, b) for a, b in contacts
+                 if hasattr(a, 'move_to_progress') and hasattr(b, 'move_to_progress')]
+        if not pairs:
+            break
+        for a, b in pairs:
+            if not rectangles_collide(a, b):
+                continue  # Already solved by an earlier correction in this pass
+            distance = _resolve_pair(a, b, margin)
+            if distance > 0:
+                corrections += 1
+                moved += distance
+        contacts = find_contact_pairs(movable)
+
+    return corrections, moved
+
+
+__all__ = ["resolve_overlaps"]
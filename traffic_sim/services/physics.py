@@ -38,10 +38,10 @@ def get_collision_rect(vehicle: RoadUser):
     
     return pygame.Rect(rect_x, rect_y, rect_width, rect_height)
 
-def get_rotated_collision_points(vehicle: RoadUser):
+def get_collision_half_extents(vehicle: RoadUser) -> Tuple[float, float]:
     """
-    Get the four corner points of the rotated collision rectangle.
-    Returns list of (x, y) tuples representing the corners.
+    Get (half_width, half_length) of the vehicle's collision rectangle.
+    The length runs along the direction of travel.
     """
     # Get collision radius for this vehicle type
     vehicle_type = type(vehicle).__name__.upper()
@@ -56,6 +56,15 @@ def get_rotated_collision_points(vehicle: RoadUser):
         half_width = (collision_radius * 1.4) / 2   # Other vehicles: standard width
         half_height = (collision_radius * 4.0) / 2  # Other vehicles: standard height
     
+    return half_width, half_height
+
+def get_rotated_collision_points(vehicle: RoadUser):
+    """
+    Get the four corner points of the rotated collision rectangle.
+    Returns list of (x, y) tuples representing the corners.
+    """
+    half_width, half_height = get_collision_half_extents(vehicle)
+    
     # Get vehicle rotation angle
     if hasattr(vehicle, 'get_rotation'):
         angle_deg = vehicle.get_rotation()
@@ -88,6 +97,19 @@ def get_rotated_collision_points(vehicle: RoadUser):
     
     return rotated_corners
 
+def get_axes(points) -> List[Tuple[float, float]]:
+    """
+    Separating axes of a rectangle given by its corners in order: the unit
+    normals of two adjacent edges (the other two edges are parallel).
+    """
+    axes = []
+    for p1, p2 in ((points[0], points[1]), (points[1], points[2])):
+        edge_x, edge_y = p2[0] - p1[0], p2[1] - p1[1]
+        length = math.hypot(edge_x, edge_y)
+        if length > 0:
+            axes.append((-edge_y / length, edge_x / length))
+    return axes
+
 def rotated_rectangles_collide(vehicle_a: RoadUser, vehicle_b: RoadUser) -> bool:
     """
     Check if two vehicles' rotated collision rectangles overlap using Separating Axis Theorem (SAT).
@@ -97,24 +119,7 @@ def rotated_rectangles_collide(vehicle_a: RoadUser, vehicle_b: RoadUser) -> bool
     points_a = get_rotated_collision_points(vehicle_a)
     points_b = get_rotated_collision_points(vehicle_b)
     
-    # Get the axes to test (perpendicular to each edge)
-    def get_axes(points):
-        axes = []
-        for i in range(len(points)):
-            p1 = points[i]
-            p2 = points[(i + 1) % len(points)]
-            # Edge vector
-            edge_x = p2[0] - p1[0]
-            edge_y = p2[1] - p1[1]
-            # Perpendicular (normal) vector
-            normal_x = -edge_y
-            normal_y = edge_x
-            # Normalize
-            length = math.hypot(normal_x, normal_y)
-            if length > 0:
-                axes.append((normal_x / length, normal_y / length))
-        return axes
-    
+    # The axes to test (perpendicular to the edges)
     axes = get_axes(points_a) + get_axes(points_b)
     
     # Test separation on each axis
@@ -144,6 +149,162 @@ def rectangles_collide(vehicle_a: RoadUser, vehicle_b: RoadUser) -> bool:
     """
     return rotated_rectangles_collide(vehicle_a, vehicle_b)
 
+def get_heading_vector(vehicle: RoadUser) -> Tuple[float, float]:
+    """
+    Unit vector of the vehicle's direction of travel, matching the rotation
+    used by get_rotated_collision_points().
+    """
+    if hasattr(vehicle, 'get_rotation'):
+        angle_rad = math.radians(-vehicle.get_rotation())
+    else:
+        angle_rad = 0
+    return math.sin(angle_rad), -math.cos(angle_rad)
+
+def get_obb_corners(center, direction, half_width: float, half_length: float):
+    """
+    Corner points of an oriented collision box centred at `center` whose length
+    runs along the unit vector `direction`.
+    """
+    dx, dy = direction
+    px, py = -dy, dx  # Perpendicular (width axis)
+    cx, cy = center
+    return [
+        (cx - dx * half_length - px * half_width, cy - dy * half_length - py * half_width),
+        (cx - dx * half_length + px * half_width, cy - dy * half_length + py * half_width),
+        (cx + dx * half_length + px * half_width, cy + dy * half_length + py * half_width),
+        (cx + dx * half_length - px * half_width, cy + dy * half_length - py * half_width),
+    ]
+
+def make_sweep(vehicle: RoadUser, points: List[Tuple[float, float]]):
+    """
+    Describe a vehicle's movement during one step for continuous collision detection.
+    
+    `points` are the positions it passes through in order: the old position, any
+    waypoints reached on the way and the new position. The vehicle moves at constant
+    speed along them, so time in the step (0..1) is proportional to arc length.
+    
+    Returns (keyframes, half_width, half_length, heading) with keyframes as
+    (t, x, y) tuples and heading the direction to use when not moving.
+    """
+    half_width, half_length = get_collision_half_extents(vehicle)
+    lengths = [0.0]
+    for (ax, ay), (bx, by) in zip(points, points[1:]):
+        lengths.append(lengths[-1] + math.hypot(bx - ax, by - ay))
+    
+    total = lengths[-1]
+    if total <= 1e-9:
+        keyframes = [(0.0, points[0][0], points[0][1]), (1.0, points[0][0], points[0][1])]
+    else:
+        keyframes = [(length / total, x, y) for length, (x, y) in zip(lengths, points)]
+    return keyframes, half_width, half_length, get_heading_vector(vehicle)
+
+def _sweep_segment(sweep, t0: float, t1: float):
+    """Start position, end position and box direction of a sweep between t0 and t1."""
+    keyframes, _, _, heading = sweep
+    
+    def position_at(t):
+        for (ta, xa, ya), (tb, xb, yb) in zip(keyframes, keyframes[1:]):
+            if t <= tb or tb >= 1.0:
+                f = 0.0 if tb - ta <= 1e-12 else (t - ta) / (tb - ta)
+                f = min(1.0, max(0.0, f))
+                return xa + (xb - xa) * f, ya + (yb - ya) * f
+        return keyframes[-1][1], keyframes[-1][2]
+    
+    start = position_at(t0)
+    end = position_at(t1)
+    # [t0, t1] lies within one path segment: the box faces along it
+    dx, dy = end[0] - start[0], end[1] - start[1]
+    length = math.hypot(dx, dy)
+    if length > 1e-9:
+        return start, end, (dx / length, dy / length)
+    return start, end, heading
+
+def approach_alignment(sweep, other, t: float) -> float:
+    """
+    How directly a sweep moves at another one at time t: cosine between its
+    direction of motion and the direction to the other's centre (1: straight
+    at it, 0: past its side, -1: away from it).
+    """
+    here, _, _ = _sweep_segment(sweep, t, t)
+    there, _, _ = _sweep_segment(other, t, t)
+    _, _, direction = _sweep_segment(sweep, max(0.0, t - 1e-3), min(1.0, t + 1e-3))
+    dx, dy = there[0] - here[0], there[1] - here[1]
+    distance = math.hypot(dx, dy)
+    if distance <= 1e-9:
+        return 0.0
+    return (direction[0] * dx + direction[1] * dy) / distance
+
+def _linear_time_of_impact(corners_a, move_a, corners_b, move_b) -> Optional[float]:
+    """
+    Separating Axis Theorem for two boxes translating without rotating:
+    earliest t in [0, 1] at which they touch, or None.
+    """
+    rel_x = move_a[0] - move_b[0]
+    rel_y = move_a[1] - move_b[1]
+    t_enter, t_exit = 0.0, 1.0
+    for axis_x, axis_y in get_axes(corners_a) + get_axes(corners_b):
+        proj_a = [px * axis_x + py * axis_y for px, py in corners_a]
+        proj_b = [px * axis_x + py * axis_y for px, py in corners_b]
+        min_a, max_a = min(proj_a), max(proj_a)
+        min_b, max_b = min(proj_b), max(proj_b)
+        speed = rel_x * axis_x + rel_y * axis_y
+        
+        if abs(speed) < 1e-12:
+            if max_a < min_b or max_b < min_a:
+                return None  # Separated on this axis for the whole interval
+            continue
+        
+        # Times at which the projections start / stop overlapping
+        t0 = (min_b - max_a) / speed
+        t1 = (max_b - min_a) / speed
+        if t0 > t1:
+            t0, t1 = t1, t0
+        t_enter = max(t_enter, t0)
+        t_exit = min(t_exit, t1)
+        if t_enter > t_exit:
+            return None
+    
+    return t_enter
+
+def time_of_impact(sweep_a, sweep_b) -> Optional[float]:
+    """
+    Continuous collision check between two sweeps from make_sweep().
+    
+    The movement is split at every waypoint either vehicle passes; within each
+    piece both boxes translate in a straight line, so the swept SAT test is exact.
+    Returns the fraction of the step (0..1) at which the boxes first touch, or
+    None when they stay apart. Boxes that already overlap at the start are left
+    to the overlap resolver and also return None.
+    """
+    times = sorted({t for t, _, _ in sweep_a[0]} | {t for t, _, _ in sweep_b[0]})
+    
+    for index, (t0, t1) in enumerate(zip(times, times[1:])):
+        if t1 - t0 <= 1e-12:
+            continue
+        start_a, end_a, dir_a = _sweep_segment(sweep_a, t0, t1)
+        start_b, end_b, dir_b = _sweep_segment(sweep_b, t0, t1)
+        corners_a = get_obb_corners(start_a, dir_a, sweep_a[1], sweep_a[2])
+        corners_b = get_obb_corners(start_b, dir_b, sweep_b[1], sweep_b[2])
+        hit = _linear_time_of_impact(
+            corners_a, (end_a[0] - start_a[0], end_a[1] - start_a[1]),
+            corners_b, (end_b[0] - start_b[0], end_b[1] - start_b[1]),
+        )
+        if hit is None:
+            continue
+        if hit <= 0.0 and index == 0:
+            return None  # Already overlapping before the step
+        return t0 + hit * (t1 - t0)
+    
+    return None
+
+def get_sweep_bounds(sweep) -> Tuple[float, float, float, float]:
+    """Axis-aligned (min_x, min_y, max_x, max_y) around everything a sweep covers (broad phase)."""
+    keyframes, half_width, half_length, _ = sweep
+    reach = math.hypot(half_width, half_length)
+    xs = [x for _, x, _ in keyframes]
+    ys = [y for _, _, y in keyframes]
+    return min(xs) - reach, min(ys) - reach, max(xs) + reach, max(ys) + reach
+
 def distance(a: RoadUser, b: RoadUser) -> float:
     """
     Calculate center-to-center distance between two vehicles.
@@ -153,16 +314,64 @@ def distance(a: RoadUser, b: RoadUser) -> float:
     dy = a.pos[1] - b.pos[1]
     return math.hypot(dx, dy)
 
+def get_collision_bounds(vehicle: RoadUser) -> Tuple[float, float, float, float]:
+    """Axis-aligned (min_x, min_y, max_x, max_y) around the rotated collision rectangle."""
+    points = get_rotated_collision_points(vehicle)
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    return min(xs), min(ys), max(xs), max(ys)
+
+def find_contact_pairs(agents: List[RoadUser]) -> List[Tuple[RoadUser, RoadUser]]:
+    """
+    All pairs of agents whose collision rectangles overlap.
+    Broad phase: sort by left edge and only compare agents whose bounding boxes
+    overlap; narrow phase: rotated rectangle SAT test.
+    """
+    active = list(agents)
+    bounds = [get_collision_bounds(a) for a in active]
+    order = sorted(range(len(active)), key=lambda k: bounds[k][0])
+    
+    pairs = []
+    for n, k in enumerate(order):
+        for m in order[n + 1:]:
+            if bounds[m][0] > bounds[k][2]:
+                break  # Everything further right starts past our right edge
+            if bounds[m][1] > bounds[k][3] or bounds[k][1] > bounds[m][3]:
+                continue
+            if rectangles_collide(active[k], active[m]):
+                pairs.append((active[k], active[m]))
+    return pairs
+
+def separation_distance(vehicle_a: RoadUser, direction, vehicle_b: RoadUser) -> float:
+    """
+    How far vehicle_a has to move along the unit vector `direction` before its
+    collision rectangle no longer overlaps vehicle_b's (0 if already apart,
+    inf if moving that way never separates them).
+    """
+    points_a = get_rotated_collision_points(vehicle_a)
+    points_b = get_rotated_collision_points(vehicle_b)
+    
+    best = float('inf')
+    for axis_x, axis_y in get_axes(points_a) + get_axes(points_b):
+        proj_a = [px * axis_x + py * axis_y for px, py in points_a]
+        proj_b = [px * axis_x + py * axis_y for px, py in points_b]
+        min_a, max_a = min(proj_a), max(proj_a)
+        min_b, max_b = min(proj_b), max(proj_b)
+        if max_a < min_b or max_b < min_a:
+            return 0.0  # Already separated
+        speed = direction[0] * axis_x + direction[1] * axis_y
+        if speed > 1e-9:
+            best = min(best, (max_b - min_a) / speed)
+        elif speed < -1e-9:
+            best = min(best, (max_a - min_b) / -speed)
+    return best
+
 def check_collisions(agents: List[RoadUser], min_dist: float = 15.0):
     """
     Check if any two agents have colliding rectangles.
     Uses rectangular collision detection instead of circular distance.
     """
-    for i in range(len(agents)):
-        for j in range(i + 1, len(agents)):
-            if rectangles_collide(agents[i], agents[j]):
-                return True
-    return False
+    return bool(find_contact_pairs(agents))
 
 def find_vehicle_ahead(current_vehicle: RoadUser, all_vehicles: List[RoadUser], 
                       search_distance: float = None) -> Optional[Tuple[RoadUser, float]]:
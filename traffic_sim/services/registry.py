@@ -0,0 +1,44 @@
+# src/traffic_sim/services/registry.py
+"""
+Agent registry with O(1) removal.
+
+The App keeps its agents in a plain list that everything iterates over
+(planning, collision checks, drawing). Removing a finished agent with
+list.remove() searches the list; the registry instead remembers every
+agent's slot and swap-removes: the last agent moves into the freed slot.
+Agent order is therefore not spawn order.
+"""
+from typing import Iterable
+
+
+class AgentRegistry(list):
+    """A list of agents that knows where each one is."""
+
+    def __init__(self, agents: Iterable = ()):
+        super().__init__()
+        for agent in agents:
+            self.append(agent)
+
+    def append(self, agent) -> None:
+        agent._slot = len(self)
+        super().append(agent)
+
+    def remove(self, agent) -> None:
+        """Swap-remove; falls back to a search when the slot is stale."""
+        slot = getattr(agent, "_slot", None)
+        if slot is None or slot >= len(self) or self[slot] is not agent:
+            slot = self.index(agent)  # Raises ValueError like list.remove
+        last = super().pop()
+        if last is not agent:
+            self[slot] = last
+            last._slot = slot
+        agent._slot = None
+
+    def clear(self) -> None:
+        """Remove every agent (their slots are forgotten too)."""
+        for agent in self:
+            agent._slot = None
+        super().clear()
+
+
+__all__ = ["AgentRegistry"]
@@ -0,0 +1,146 @@
+# src/traffic_sim/services/river.py
+"""
+River traffic: many boats on the river under the bridges.
+
+The river has one lane per direction and boats keep to the right of the
+fairway (northbound on the east side, southbound on the west side). Within
+a lane boats never overtake: each one sails at its own speed but stays
+`gap` behind the boat ahead, so a slow barge collects a platoon. A lane
+can be held at a stop position (Lane.stop_at, set by the bridge
+controller). Arrivals come from a PoissonDemand over the lane names (actor
+"BOAT"); when a lane's entry is still occupied they wait and are launched
+in order.
+
+Lanes are deques ordered front to back, so the boat that finishes is
+always the first one, and finished boats go to a pool to be launched
+again: a busy waterway sails without allocating boats or sprites per
+frame.
+"""
+import random
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    from ..domain.world.boat import Boat
+    from .demand import PoissonDemand
+except ImportError:
+    from traffic_sim.domain.world.boat import Boat
+    from traffic_sim.services.demand import PoissonDemand
+
+Vec2 = Tuple[float, float]
+
+# Clear water between two boats in a lane (px); hull length is 60 px * scale
+BOAT_CLEARANCE = 25.0
+
+
+class Lane:
+    """One direction of the river: its path, boats (front to back) and waiting arrivals"""
+
+    def __init__(self, name: str, path: List[Vec2]):
+        self.name = name
+        self.path = path
+        self.boats: Deque[Boat] = deque()
+        self.waiting = 0  # Arrivals waiting for the lane entry to clear
+        # Boats that have not passed this distance along the path stop there
+        # (the closed bridge, services/bridge.py); None: free passage
+        self.stop_at: Optional[float] = None
+        self.held = 0  # Boats slowed by stop_at (or queued behind one) in the last update
+
+    def has_room(self, scale: float) -> bool:
+        """True when a boat of this scale can enter behind the last one"""
+        if not self.boats:
+            return True
+        last = self.boats[-1]
+        return last.travelled >= gap_between(last, scale)
+
+
+def gap_between(leader: Boat, scale: float) -> float:
+    """Centre distance a follower of this scale keeps behind leader"""
+    return 30.0 * (leader.scale + scale) + BOAT_CLEARANCE
+
+
+class RiverTraffic:
+    """Boat demand, lane discipline and boat reuse for the river"""
+
+    def __init__(self, lanes: Dict[str, List[Vec2]], demand: PoissonDemand, speed: float = 50.0,
+                 speed_spread: float = 0.2, scales: Sequence[float] = (1.0,), max_boats: int = 40,
+                 seed: Optional[int] = None):
+        self.lanes = {name: Lane(name, path) for name, path in lanes.items()}
+        self.demand = demand
+        self.speed = speed
+        self.speed_spread = speed_spread  # Boat speeds vary +/- this fraction
+        self.scales = tuple(scales)        # Boat sizes drawn from these
+        self.max_boats = max_boats
+        self._rng = random.Random(f"{demand.seed if seed is None else seed}:river")
+        self._pool: List[Boat] = []
+        self._next_scale: Dict[str, float] = {}  # Size of the next boat to launch per lane
+        self.count = 0
+        self.launched = 0
+        self.completed = 0
+
+    @property
+    def boats(self) -> Iterator[Boat]:
+        for lane in self.lanes.values():
+            yield from lane.boats
+
+    @property
+    def active(self) -> bool:
+        """True while boats sail or wait to enter"""
+        return any(lane.boats or lane.waiting for lane in self.lanes.values())
+
+    def time_until_next(self, now: float) -> float:
+        """0 while boats are active, otherwise until the next arrival"""
+        if self.active:
+            return 0.0
+        return self.demand.time_until_next(now)
+
+    def _launch(self, lane: Lane) -> None:
+        scale = self._next_scale.pop(lane.name)
+        boat = self._pool.pop() if self._pool else Boat()
+        boat.scale = scale
+        boat.speed = self.speed * (1.0 + self._rng.uniform(-self.speed_spread, self.speed_spread))
+        boat.reset(lane.path)
+        lane.boats.append(boat)
+        lane.waiting -= 1
+        self.count += 1
+        self.launched += 1
+
+    def update(self, dt: float, now: float) -> None:
+        """Launch due boats and sail every lane one step, front to back."""
+        for route, _ in self.demand.pop_due(now):
+            self.lanes[route].waiting += 1
+
+        for lane in self.lanes.values():
+            if lane.waiting and self.count < self.max_boats:
+                if lane.name not in self._next_scale:
+                    self._next_scale[lane.name] = self._rng.choice(self.scales)
+                if lane.has_room(self._next_scale[lane.name]):
+                    self._launch(lane)
+
+            leader = None
+            lane.held = 0
+            for boat in lane.boats:
+                free = step = boat.speed * dt
+                held = lane.stop_at is not None and boat.travelled <= lane.stop_at
+                if held:
+                    step = min(step, lane.stop_at - boat.travelled)
+                if leader is not None:
+                    # No overtaking: stay gap behind the boat ahead
+                    room = leader.travelled - gap_between(leader, boat.scale) - boat.travelled
+                    step = min(step, max(0.0, room))
+                if held and step < 0.5 * free:
+                    lane.held += 1
+                boat.advance(step)
+                leader = boat
+
+            while lane.boats and lane.boats[0].done:
+                self._pool.append(lane.boats.popleft())
+                self.count -= 1
+                self.completed += 1
+
+    def draw(self, screen) -> List:
+        """Draw every boat; returns the areas drawn"""
+        return [boat.draw(screen) for lane in self.lanes.values() for boat in lane.boats]
+
+
+__all__ = ["RiverTraffic", "Lane", "BOAT_CLEARANCE"]
@@ -0,0 +1,122 @@
+# src/traffic_sim/services/sleeping.py
+"""
+Sleeping agents with wake-up lists.
+
+In a busy scene most road users stand in a queue at red. Planning them every
+tick (traffic light callback, collision checks, following distance) costs as
+much as planning a moving agent, for nothing. An agent that has come to a
+standstill for a reason we can watch is parked instead:
+
+- "signal": waiting at the stop line for red; woken when its signal group
+  (or the gate it obeys) changes (Controller change notification)
+- "leader": waiting behind a standing vehicle; woken when that vehicle moves
+  or leaves the simulation
+
+Agents arriving in a lane also wake the sleepers in it. Parked agents are
+skipped by the App's plan/integrate loop, so tick cost scales with the moving
+agents. The time they slept is credited to total_time/stopped_time/total_stopped_time on wake-up.
+"""
+from typing import Dict, List, Set
+
+# Slower than this (px/s) counts as standing still for parking
+SLEEP_SPEED_THRESHOLD = 1.0
+
+
+class SleepScheduler:
+    """Keeps track of parked agents and what will wake them."""
+
+    def __init__(self):
+        self.clock = 0.0  # Simulation time up to which awake agents are accounted
+        self._sleepers: Set = set()
+        self._by_group: Dict[str, List] = {}
+        self._by_leader: Dict[int, List] = {}
+        self._by_lane: Dict[tuple, List] = {}
+
+    def __len__(self) -> int:
+        return len(self._sleepers)
+
+    def is_sleeping(self, agent) -> bool:
+        return getattr(agent, 'sleeping', False)
+
+    def get_sleepers(self) -> List:
+        return list(self._sleepers)
+
+    def slept(self, agent) -> float:
+        """Time a parked agent has slept so far (credited to it on wake-up)."""
+        return self.clock - agent._parked_since if agent in self._sleepers else 0.0
+
+    def end_tick(self, dt: float) -> None:
+        """All awake agents have been planned and moved for this tick."""
+        self.clock += dt
+
+    # --- Parking ---
+    def try_park(self, agent) -> bool:
+        """Park a standing agent when we know what it is waiting for."""
+        if agent.velocity > SLEEP_SPEED_THRESHOLD or getattr(agent, 'done', False):
+            return False
+
+        reason = getattr(agent, 'wait_reason', None)
+        if reason == "signal":
+            # Woken by changes of the flag it obeys: a gate or its own group
+            group = getattr(agent, 'signal_key', None) or getattr(agent, 'signal_group', None)
+            if group is None:
+                return False
+            self._by_group.setdefault(group, []).append(agent)
+        elif reason == "leader":
+            leader = getattr(agent, 'blocking_leader', None)
+            if (leader is None or getattr(leader, 'done', False) or
+                    getattr(leader, 'velocity', 0.0) > SLEEP_SPEED_THRESHOLD):
+                return False
+            self._by_leader.setdefault(id(leader), []).append(agent)
+        else:
+            return False
+
+        agent.sleeping = True
+        agent._parked_since = self.clock
+        self._sleepers.add(agent)
+        self._by_lane.setdefault(agent.get_lane_key(), []).append(agent)
+        return True
+
+    def wake(self, agent) -> None:
+        """Wake one agent and credit the ticks it slept through."""
+        if agent not in self._sleepers:
+            return
+        self._sleepers.discard(agent)
+        agent.sleeping = False
+        slept = self.clock - agent._parked_since
+        agent.total_time += slept
+        agent.stopped_time += slept
+        agent.total_stopped_time += slept
+        agent.velocity = 0.0
+
+    def _wake_all(self, agents: List) -> int:
+        woken = 0
+        for agent in agents:
+            if agent in self._sleepers:
+                self.wake(agent)
+                woken += 1
+        return woken
+
+    # --- Wake-up triggers ---
+    def on_agent_moved(self, agent) -> int:
+        """The agent moved (or left): wake everyone parked behind it."""
+        return self._wake_all(self._by_leader.pop(id(agent), []))
+
+    def on_signal_change(self, group: str, state=None) -> int:
+        """A signal group changed state: wake everyone waiting at its stop line."""
+        return self._wake_all(self._by_group.pop(group, []))
+
+    def on_agent_arrived(self, agent) -> int:
+        """A new agent entered a lane: wake the sleepers in it."""
+        return self._wake_all(self._by_lane.pop(agent.get_lane_key(), []))
+
+    def wake_everyone(self) -> int:
+        """Wake all parked agents (e.g. when the rules of the game change)."""
+        woken = self._wake_all(list(self._sleepers))
+        self._by_group.clear()
+        self._by_leader.clear()
+        self._by_lane.clear()
+        return woken
+
+
+__all__ = ["SleepScheduler", "SLEEP_SPEED_THRESHOLD"]
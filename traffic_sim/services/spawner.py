@@ -20,9 +20,12 @@ except ImportError:
 class Spawner:
     """Spawner helper and timed spawner in one.
 
-    Two usages are supported:
+    Three usages are supported:
     - As a simple factory: `s = Spawner(); car = s.spawn_car(path, ...)`
-    - As a timed spawner used by the App: `s = Spawner(factory=..., interval_s=3.0, ...)`
+    - As the App uses it: `s.spawn(path)` for each arrival of the demand
+      model (services/demand.py), with the agent bound to its signal group;
+      despawned agents are handed back with `s.recycle(agent)` and reused
+    - As a timed spawner: `s = Spawner(factory=..., interval_s=3.0, ...)`
 
     When used as a timed spawner, call `s.update(dt)` each frame — it will
     return a newly spawned RoadUser when it's time, or None otherwise.
@@ -34,16 +37,22 @@ class Spawner:
         interval_s: float = 1.0,
         random_offset: float = 0.0,
         max_count: Optional[int] = None,
+        signal_group: Optional[str] = None,
+        signals=None,
     ):
         # Timed-spawner state
         self.factory = factory
+        self.signal_group = signal_group  # Controller signal group the spawned agents obey
+        self.signals = signals            # Controller whose green flags they read
+        self._pool: List[RoadUser] = []   # Despawned agents of ours, ready for reuse
+        self._speed: Optional[float] = None  # Cruise speed the factory gives its agents
         self.interval = float(interval_s)
         self.random_offset = float(random_offset)
         self.max_count = max_count
         self._acc = 0.0
         self._spawned = 0
 
-    # --- Timed spawner API (used by App) ---
+    # --- Timed spawner API ---
     def update(self, dt: float, allow_spawn: bool = True, **kwargs) -> Optional[RoadUser]:
         """Advance the spawner timer by dt seconds; spawn when interval elapsed.
 
@@ -66,11 +75,39 @@ class Spawner:
             self._acc = max(0.0, self._acc - self.interval)
             self._spawned += 1
             try:
-                return self.factory()
+                return self.spawn()
             except Exception:
                 return None
         return None
 
+    def spawn(self, path_px: Optional[List[Vec2]] = None) -> RoadUser:
+        """
+        Create one agent with the factory (on path_px when given, the factory
+        then takes it as its argument), tagged with and bound to our signal group.
+        """
+        if path_px is not None and self._pool:
+            # Reuse a despawned agent of ours: same type and looks, and the
+            # factory's speed whatever it drove at on its last trip
+            agent = self._pool.pop()
+            agent.reset(path_px, agent.speed if self._speed is None else self._speed)
+        else:
+            agent = self.factory(path_px) if path_px is not None else self.factory()
+            self._speed = agent.speed
+        if self.signal_group is not None:
+            agent.signal_group = self.signal_group
+            if self.signals is not None:
+                agent.bind_signal(self.signals.green, self.signals.signal_index(self.signal_group))
+        return agent
+
+    def recycle(self, agent: RoadUser, max_pooled: int = 64) -> None:
+        """
+        Take back a despawned agent made by this spawner, to be reset by
+        spawn() as the factory would build it (the factory gives all its
+        agents the same looks and speed, like the App's do).
+        """
+        if len(self._pool) < max_pooled:
+            self._pool.append(agent)
+
     # --- Direct factory helpers (used by testapp.py and quick scripts) ---
     def spawn_car(self, path: List[Vec2], **kwargs) -> Car:
         return Car(path_px=path, **kwargs)
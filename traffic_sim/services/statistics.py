@@ -10,15 +10,31 @@ class SimulationStats:
         self.pedestrian_count = 0
         self.cyclist_count = 0
         self.collisions = 0
+        # Overlap resolver corrections (services/overlap_resolver.py)
+        self.overlap_corrections = 0
+        self.overlap_distance = 0.0
         self.average_wait_time = 0.0
         self.total_wait_time = 0.0
         self.vehicles_served = 0
         self.total_completed_time = 0.0
+        self.total_stopped_time = 0.0  # Time completed agents spent standing still
+        # Entry queues (services/entries.py): arrivals waiting to spawn
+        self.entry_queue_length = 0
+        self.max_entry_queue_length = 0
+        self.entry_releases = 0
+        self.total_entry_delay = 0.0
+        # Movable bridge (services/bridge.py)
+        self.bridge_openings = 0
+        self.bridge_boats = 0           # Boats in the batches the bridge opened for
+        self.bridge_closed_time = 0.0   # Time the road over the bridge was closed
+        self.bridge_road_delay = 0.0    # Road user seconds standing at green while it was closed
+        self.bridge_boat_delay = 0.0    # Boat seconds held in front of the bridge
         # completions per type
         self.completions: Dict[str, int] = {}
         # spawned counts per type
         self.spawns: Dict[str, int] = {}
         self.start_time = datetime.now()
+        self.sim_time = 0.0  # Simulated seconds (App.step), the base for throughput
         
         # Detailed stats per type
         self.wait_times: Dict[str, List[float]] = {
@@ -60,10 +76,41 @@ class SimulationStats:
                 / stats['vehicles_passed']
             )
     
+    def advance_clock(self, dt: float) -> None:
+        """Advance the simulated clock by dt seconds"""
+        self.sim_time += dt
+
     def record_collision(self):
         """Record a collision event"""
         self.collisions += 1
 
+    def record_overlap_resolution(self, corrections: int, distance: float) -> None:
+        """Record agents pushed back along their route by the overlap resolver"""
+        self.overlap_corrections += corrections
+        self.overlap_distance += distance
+
+    def record_entry_queue(self, length: int) -> None:
+        """Record the number of arrivals currently waiting at the entries"""
+        self.entry_queue_length = length
+        self.max_entry_queue_length = max(self.max_entry_queue_length, length)
+
+    def record_entry_delay(self, delay: float) -> None:
+        """Record how long a spawned arrival waited in its entry queue"""
+        self.entry_releases += 1
+        self.total_entry_delay += delay
+
+    def record_bridge_opening(self, boats: int) -> None:
+        """Record that the bridge opened for a batch of boats"""
+        self.bridge_openings += 1
+        self.bridge_boats += boats
+
+    def record_bridge_delay(self, dt: float, road_closed: bool, road_waiting: int, boats_waiting: int) -> None:
+        """Accumulate one tick of bridge delay (agents waiting times dt)"""
+        if road_closed:
+            self.bridge_closed_time += dt
+        self.bridge_road_delay += road_waiting * dt
+        self.bridge_boat_delay += boats_waiting * dt
+
     def record_spawn(self, actor_type: str) -> None:
         """Record that an actor of given type was spawned into the simulation.
 
@@ -90,12 +137,27 @@ class SimulationStats:
         
         return {
             'runtime_seconds': runtime,
+            'sim_time_seconds': self.sim_time,
             'total_vehicles': self.vehicle_count,
             'total_pedestrians': self.pedestrian_count,
             'total_cyclists': self.cyclist_count,
             'collisions': self.collisions,
+            'overlap_corrections': self.overlap_corrections,
+            'overlap_distance': self.overlap_distance,
             'average_wait_time': self.average_wait_time,
-            'vehicles_per_minute': (self.vehicles_served * 60) / runtime if runtime > 0 else 0,
+            'mean_stopped_time': self.total_stopped_time / self.vehicles_served if self.vehicles_served else 0.0,
+            'entry_queue_length': self.entry_queue_length,
+            'max_entry_queue_length': self.max_entry_queue_length,
+            'mean_entry_delay': self.total_entry_delay / self.entry_releases if self.entry_releases else 0.0,
+            'bridge': {
+                'openings': self.bridge_openings,
+                'boats': self.bridge_boats,
+                'closed_time': self.bridge_closed_time,
+                'road_delay': self.bridge_road_delay,
+                'boat_delay': self.bridge_boat_delay,
+            },
+            # Per simulated minute: headless runs go much faster than real time
+            'vehicles_per_minute': (self.vehicles_served * 60) / self.sim_time if self.sim_time > 0 else 0,
             'flow_stats': self.flow_stats,
             'spawns': self.spawns,
             'completions': self.completions,
@@ -110,21 +172,23 @@ class SimulationStats:
     def get_summary(self) -> Dict[str, any]:
         return self.get_stats_summary()
 
-    def record_completion(self, actor_type: str, total_time: float = 0.0) -> None:
+    def record_completion(self, actor_type: str, total_time: float = 0.0, stopped_time: float = 0.0) -> None:
         """Record that an actor completed its journey (left the simulation).
 
-        `total_time` is the time the actor spent in the simulation (seconds).
+        `total_time` is the time the actor spent in the simulation (seconds),
+        `stopped_time` the part of it spent standing still.
         """
         t = (actor_type or "").lower()
         self.completions[t] = self.completions.get(t, 0) + 1
         try:
             self.total_completed_time += float(total_time)
+            self.total_stopped_time += float(stopped_time)
         except Exception:
             pass
         # Treat a completion as a served vehicle for throughput metrics
         self.vehicles_served += 1
     
-    def record_frame_exit(self, actor_type: str, total_time: float = 0.0) -> None:
+    def record_frame_exit(self, actor_type: str, total_time: float = 0.0, stopped_time: float = 0.0) -> None:
         """Record that an actor left the simulation by exiting the frame.
         
         This is tracked separately from normal completions to distinguish
@@ -139,13 +203,13 @@ class SimulationStats:
         self.frame_exits[t] = self.frame_exits.get(t, 0) + 1
         
         # Also record as completion for throughput metrics
-        self.record_completion(actor_type, total_time)
+        self.record_completion(actor_type, total_time, stopped_time)
     
     def render_stats_overlay(self, screen, font, pos=(10, 10), color=(255, 255, 255)):
         """Render statistics as an overlay on the simulation"""
         stats = self.get_stats_summary()
         lines = [
-            f"Runtime: {stats['runtime_seconds']:.1f}s",
+            f"Sim time: {stats['sim_time_seconds']:.1f}s",
             f"Vehicles/min: {stats['vehicles_per_minute']:.1f}",
             f"Avg wait: {self.average_wait_time:.1f}s",
             f"Collisions: {self.collisions}",
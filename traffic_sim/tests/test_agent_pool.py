@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Test script for agent pooling and the swap-remove registry:
+- Removing an agent moves the last one into its slot, slots stay consistent
+- A recycled agent comes back as new on another route, with the same surface
+- A recycled agent no longer blocks the entry it was last released at
+- A recycled agent is in every attribute the agent its factory would build
+- In a running App despawned agents are reused instead of rebuilt
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from traffic_sim.configuration import Config
+from traffic_sim.core.app import App
+from traffic_sim.domain.actors.car import Car
+from traffic_sim.domain.world.intersection import Controller
+from traffic_sim.services.pathing import to_pixels, CARS_NS_UP, CARS_NS_LEFT
+from traffic_sim.services.entries import EntryQueues
+from traffic_sim.services.registry import AgentRegistry
+from traffic_sim.services.spawner import Spawner
+
+
+class Item:
+    pass
+
+
+def test_swap_remove():
+    """O(1) removal keeps every slot pointing at its agent"""
+    print("🔀 SWAP-REMOVE REGISTRY")
+    items = [Item() for _ in range(5)]
+    registry = AgentRegistry(items)
+    registry.remove(items[1])
+    assert list(registry) == [items[0], items[4], items[2], items[3]]
+    registry.remove(items[3])  # The last one: nothing moves
+    registry.remove(items[0])
+    print(f"  left: {[items.index(i) for i in registry]}")
+    assert all(registry[i]._slot == i for i in range(len(registry)))
+    try:
+        registry.remove(items[0])
+        assert False, "removing twice should fail like list.remove"
+    except ValueError:
+        pass
+    kept = list(registry)
+    registry.clear()
+    assert len(registry) == 0 and all(i._slot is None for i in kept)
+
+
+def test_recycled_agent_is_fresh():
+    """reset() gives a fresh agent on a new route and keeps the looks"""
+    print("\n♻️  RECYCLING")
+    ctrl = Controller()
+    up = to_pixels(CARS_NS_UP, Config.WIDTH, Config.HEIGHT)
+    left = to_pixels(CARS_NS_LEFT, Config.WIDTH, Config.HEIGHT)
+    spawner = Spawner(factory=lambda path=None: Car(path or up, speed_px_s=130, color=(1, 2, 3)),
+                      signal_group="cars_ns", signals=ctrl)
+    car = spawner.spawn(up)
+    surface = car._car_surf
+    car.advance_along_path(500)
+    car.total_stopped_time = 12.0
+    car._loop_zone = 4
+    car.done = True
+
+    spawner.recycle(car)
+    again = spawner.spawn(left)
+    print(f"  same object: {again is car}, pos={again.pos}, speed={again.speed}")
+    assert again is car and again.path is left and list(again.pos) == list(left[0])
+    assert not again.done and again.i == 0 and again.total_stopped_time == 0.0
+    assert not hasattr(again, "_loop_zone") and again.speed == 130 and again.color == (1, 2, 3)
+    assert again._car_surf is surface and again.signal_index == ctrl.signal_index("cars_ns")
+
+
+def test_recycled_agent_matches_new():
+    """Whatever changed on its last trip, a pooled agent comes back as the factory builds it"""
+    print("\n🆕 RECYCLED = NEW")
+    ctrl = Controller()
+    up = to_pixels(CARS_NS_UP, Config.WIDTH, Config.HEIGHT)
+    left = to_pixels(CARS_NS_LEFT, Config.WIDTH, Config.HEIGHT)
+
+    def factory(path=None):
+        return Car(path or up, speed_px_s=130)
+
+    spawner = Spawner(factory=factory, signal_group="cars_ns", signals=ctrl)
+    car = spawner.spawn(up)
+    car.speed = 45.0  # Changed on the way
+    car.velocity = 12.0
+    car.advance_along_path(300)
+    car.done = True
+    spawner.recycle(car)
+
+    again = spawner.spawn(left)
+    fresh = Spawner(factory=factory, signal_group="cars_ns", signals=ctrl).spawn(left)
+    different = sorted(k for k in set(vars(again)) | set(vars(fresh))
+                       if vars(again).get(k, Item) != vars(fresh).get(k, Item))
+    print(f"  reused: {again is car}, speed={again.speed}, attributes that differ: {different}")
+    assert again is car and again is not fresh
+    assert again.speed == fresh.speed == 130 and not different
+
+
+def test_recycled_agent_leaves_entry():
+    """The entry forgets a despawned agent, wherever the pool sends it next"""
+    print("\n🚦 ENTRY AFTER RECYCLING")
+    ctrl = Controller()
+    up = to_pixels(CARS_NS_UP, Config.WIDTH, Config.HEIGHT)
+    spawner = Spawner(factory=lambda path=None: Car(path or up), signal_group="cars_ns", signals=ctrl)
+    queues = EntryQueues()
+    car = spawner.spawn(up)
+    queues.occupy(car)
+    queues.arrive(up[0], "CARS_NS_UP", "CAR", 0.0)
+    entry = queues.entry(up[0])
+    queues.release(entry, car, 0.0)
+    car.advance_along_path(2000)
+    car.done = True
+    queues.remove(car)
+    spawner.recycle(car)
+    assert entry.last_agent is None and car not in entry.occupants
+
+    # Reused at this spawn point but not admitted (say the spawn was unsafe):
+    # it stands at the entry without being in the simulation
+    again = spawner.spawn(up)
+    assert again is car and not again.done
+    queues.arrive(up[0], "CARS_NS_UP", "CAR", 1.0)
+    print(f"  entry blocked: {entry.blocked(queues.clearance)}, ready: {list(queues.ready()) == [entry]}")
+    assert not entry.blocked(queues.clearance) and list(queues.ready()) == [entry]
+
+
+def test_app_reuses_agents():
+    """After a few minutes most spawns are recycled agents"""
+    print("\n🏭 APP POOLING")
+    random.seed(8)
+    app = App(headless=True)
+    built = []
+    for sp in set(app._spawner_of_kind.values()):
+        sp.factory = (lambda f: lambda path=None: built.append(f(path)) or built[-1])(sp.factory)
+    app.run_headless(180.0, 0.1)
+    spawned = sum(app.stats.get_summary()["spawns"].values())
+    print(f"  spawned {spawned}, constructed {len(built)}")
+    assert spawned > len(built)
+    assert all(app.agents[i]._slot == i for i in range(len(app.agents)))
+
+
+if __name__ == "__main__":
+    test_swap_remove()
+    test_recycled_agent_is_fresh()
+    test_recycled_agent_matches_new()
+    test_recycled_agent_leaves_entry()
+    test_app_reuses_agents()
+    print("\n✅ Agent pooling works!")
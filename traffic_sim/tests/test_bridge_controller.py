@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Test script for the movable bridge:
+- A gate follows its signal group while open, closes on its own and notifies
+- Boats wait at the closed bridge and the bridge opens for a batch of them
+- The road is cleared before the bridge rises and opens again afterwards
+- Boats far upstream neither start an opening nor keep the bridge open
+- In the App road users over the bridge stop for it and the delay is reported
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from traffic_sim.configuration import Config
+from traffic_sim.core.app import App
+from traffic_sim.domain.world.boat import Boat
+from traffic_sim.domain.world.intersection import Controller
+from traffic_sim.domain.world.traffic_light import Light
+from traffic_sim.services.bridge import BridgeController, BridgeState
+from traffic_sim.services.demand import PoissonDemand
+from traffic_sim.services.river import RiverTraffic
+from traffic_sim.services.statistics import SimulationStats
+
+LANES = {
+    "RIVER_UP": [(900, 818), (900, -50)],
+    "RIVER_DOWN": [(800, -50), (800, 818)],
+}
+BRIDGE_TOP, BRIDGE_BOTTOM = 277, 489
+
+
+def test_gate_follows_group():
+    """A gated flag is green only while its group is green and the gate is open"""
+    print("🚧 SIGNAL GATES")
+    ctrl = Controller()
+    index = ctrl.add_gate("cars_ew>bridge", "cars_ew")
+    base = ctrl.signal_index("cars_ew")
+    assert ctrl.signal_index("cars_ew>bridge") == index
+    changes = []
+    ctrl.subscribe(lambda group, state: changes.append((group, state)))
+    for _ in range(1200):
+        ctrl.update(0.1)
+        assert ctrl.green[index] == ctrl.green[base]
+    assert ("cars_ew>bridge", Light.GREEN) in changes
+    while not ctrl.green[base]:
+        ctrl.update(0.1)
+    changes.clear()
+    ctrl.set_gate("cars_ew>bridge", False)
+    print(f"  closed at green: {changes}")
+    assert changes == [("cars_ew>bridge", Light.RED)] and ctrl.green[base] and not ctrl.green[index]
+    ctrl.set_gate("cars_ew>bridge", True)
+    assert ctrl.green[index] and ctrl.gate_is_open("cars_ew>bridge")
+
+
+def run_bridge(deck_clear=lambda: True, rate=120.0, seconds=600.0, **kwargs):
+    ctrl = Controller()
+    ctrl.add_gate("cars_ew>bridge", "cars_ew")
+    demand = PoissonDemand({lane: {"BOAT": rate} for lane in LANES}, seed=3)
+    river = RiverTraffic(LANES, demand, speed=50.0, speed_spread=0.2, scales=(1.0, 1.4))
+    stats = SimulationStats()
+    bridge = BridgeController(ctrl, ["cars_ew>bridge"], river, BRIDGE_TOP, BRIDGE_BOTTOM,
+                              deck_clear, stats=stats, **kwargs)
+    trace = []
+    now = 0.0
+    while now < seconds:
+        now += 0.1
+        ctrl.update(0.1)
+        river.update(0.1, now)
+        bridge.update(0.1, now, road_waiting=2)
+        trace.append((now, bridge.state, ctrl.gate_is_open("cars_ew>bridge"),
+                      [(name, b.travelled) for name, lane in river.lanes.items() for b in lane.boats]))
+    return bridge, river, stats, trace
+
+
+def test_boats_wait_and_batch():
+    """No boat passes the closed bridge; every opening serves a batch"""
+    print("\n⛴️  BATCHED OPENINGS")
+    bridge, river, stats, trace = run_bridge(min_batch=4)
+    for now, state, gate_open, boats in trace:
+        if state is not BridgeState.OPEN:
+            for name, travelled in boats:
+                stop, clear = bridge.spans[name]
+                # Held boats stay at the stop; only boats already under way may be past it
+                assert travelled <= stop + 1e-6 or travelled > stop + 5.0 or state is BridgeState.LOWERING
+        if state is BridgeState.RAISING or state is BridgeState.OPEN:
+            assert not gate_open
+    summary = stats.get_summary()["bridge"]
+    print(f"  {summary}, completed boats={river.completed}")
+    assert summary["openings"] > 0 and river.completed > 0
+    assert summary["boats"] >= 4 * summary["openings"] - 4  # The max-wait opening may be smaller
+    assert summary["boat_delay"] > 0 and summary["road_delay"] > 0
+    assert summary["road_delay"] <= 2 * summary["closed_time"] + 1e-6
+
+
+def test_max_wait_opens_for_one_boat():
+    """A single boat does not wait longer than max_wait (plus the opening cycle)"""
+    print("\n⏱️  MAX WAIT")
+    bridge, river, stats, trace = run_bridge(rate=3.0, seconds=1200.0, min_batch=50, max_wait=30.0)
+    opened = [now for (now, state, _, _), (_, before, _, _) in zip(trace[1:], trace)
+              if state is BridgeState.CLEARING and before is BridgeState.ROAD_OPEN]
+    print(f"  openings at {[round(t) for t in opened]}")
+    assert stats.bridge_openings > 0 and river.completed > 0
+    waited = longest = 0.0
+    for now, state, _, boats in trace:
+        at_stop = any(bridge.spans[name][0] - 0.5 <= travelled <= bridge.spans[name][0]
+                      for name, travelled in boats)
+        waited = waited + 0.1 if state is BridgeState.ROAD_OPEN and at_stop else 0.0
+        longest = max(longest, waited)
+    print(f"  longest wait with the road open: {longest:.1f}s")
+    assert 0.0 < longest <= 30.0 + 0.2
+
+
+def test_deck_cleared_first():
+    """The bridge does not rise while a road user is on it"""
+    print("\n🚗 DECK CLEARING")
+    on_deck = [True]
+    bridge, river, stats, trace = run_bridge(deck_clear=lambda: not on_deck[0], seconds=120.0, min_batch=1)
+    assert all(state in (BridgeState.ROAD_OPEN, BridgeState.CLEARING) for _, state, _, _ in trace)
+    assert trace[-1][1] is BridgeState.CLEARING and not trace[-1][2]
+    on_deck[0] = False
+    now = trace[-1][0]
+    for _ in range(600):
+        now += 0.1
+        bridge.river.update(0.1, now)
+        bridge.update(0.1, now)
+    print(f"  state after the deck cleared: {bridge.state.name}, openings={stats.bridge_openings}")
+    assert stats.bridge_openings == 1
+
+
+def place(lane, travelled, speed=2.0):
+    """A boat sailing speed px/s at travelled along lane (appended at the back)"""
+    boat = Boat()
+    boat.speed = speed
+    boat.reset(lane.path)
+    boat.advance(travelled)
+    lane.boats.append(boat)
+    return boat
+
+
+def test_far_boats_do_not_count():
+    """Only boats within approach_px of the stop count for opening and staying open"""
+    print("\n🔭 APPROACH DISTANCE")
+    ctrl = Controller()
+    ctrl.add_gate("cars_ew>bridge", "cars_ew")
+    river = RiverTraffic(LANES, PoissonDemand({lane: {"BOAT": 0.0} for lane in LANES}, seed=3))
+    bridge = BridgeController(ctrl, ["cars_ew>bridge"], river, BRIDGE_TOP, BRIDGE_BOTTOM,
+                              lambda: True, min_batch=2, max_wait=1000.0, approach_px=150.0)
+    lane = river.lanes["RIVER_UP"]
+    stop = bridge.spans["RIVER_UP"][0]
+    near, far = place(lane, stop, speed=50.0), place(lane, 0.0)  # One at the bridge, one just launched
+    assert bridge.approaching() == 1
+
+    now = 0.0
+    states = []
+    while now < 120.0 and (not states or states[-1][0] is not BridgeState.LOWERING):
+        now += 0.1
+        river.update(0.1, now)
+        bridge.update(0.1, now)
+        states.append((bridge.state, far.travelled))
+    opened = next(travelled for state, travelled in states if state is BridgeState.CLEARING)
+    print(f"  opened with the far boat at {opened:.0f}px (stop {stop:.0f}px), "
+          f"lowering with it at {far.travelled:.0f}px")
+    # The batch of two was complete only once the far boat came within approach_px ...
+    assert opened >= stop - 150.0
+    assert not any(state is BridgeState.CLEARING for state, t in states if t < stop - 150.0)
+
+    # ... and with it released, the bridge does not wait for the next far one
+    bridge = BridgeController(ctrl, ["cars_ew>bridge"], river, BRIDGE_TOP, BRIDGE_BOTTOM,
+                              lambda: True, min_batch=1, max_wait=1000.0, approach_px=150.0)
+    lane.boats.clear()
+    near, far = place(lane, stop, speed=50.0), place(lane, 0.0)
+    seen = set()
+    while bridge.state is not BridgeState.LOWERING:
+        now += 0.1
+        river.update(0.1, now)
+        bridge.update(0.1, now)
+        seen.add(bridge.state)
+    print(f"  lowering after {sorted(s.name for s in seen)} with the far boat at {far.travelled:.0f}px")
+    assert BridgeState.OPEN in seen and far.travelled < stop - 150.0 and near.travelled > stop
+
+
+def test_app_bridge():
+    """Road users over the bridge obey its gate; boats cross; the delay is reported"""
+    print("\n🌉 APP BRIDGE")
+    random.seed(4)
+    bridge_config = Config.BRIDGE
+    Config.BRIDGE = dict(bridge_config, ENABLED=True)  # Whatever the configured scene
+    try:
+        app = App(headless=True)
+    finally:
+        Config.BRIDGE = bridge_config
+    assert app.bridge is not None
+    gated = {app.ctrl.signal_index(g) for g in app._bridge_gate_of.values()}
+    crossing = {id(p) for p in (app.cars_ew_right_px, app.cars_ns_right_px,
+                                app.bikes_ew_right_px, app.bikes_ns_right_px)}
+    on_deck_while_open = 0
+    sim_time = 0.0
+    while sim_time < 900.0:
+        app.step(0.1)
+        sim_time += 0.1
+        for a in app.agents:
+            assert (a.signal_index in gated) == (id(a.path) in crossing)
+        if app.bridge.state is BridgeState.OPEN and not app._bridge_deck_clear():
+            on_deck_while_open += 1
+    summary = app.stats.get_summary()["bridge"]
+    print(f"  {summary}, boats completed={app.river.completed}")
+    assert summary["openings"] > 0 and app.river.completed > 0
+    assert on_deck_while_open == 0
+    assert summary["road_delay"] >= 0.0 and summary["closed_time"] > 0
+
+
+if __name__ == "__main__":
+    test_gate_follows_group()
+    test_boats_wait_and_batch()
+    test_max_wait_opens_for_one_boat()
+    test_deck_cleared_first()
+    test_far_boats_do_not_count()
+    test_app_bridge()
+    print("\n✅ Bridge controller works!")
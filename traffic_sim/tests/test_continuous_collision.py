@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test script for continuous collision detection:
+- Time of impact between swept collision boxes (tunnelling, cross traffic)
+- The integrator cuts a move short instead of jumping through another vehicle
+- Only the vehicle that drives into the other is cut short; both keep moving
+"""
+
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from traffic_sim.domain.actors.car import Car
+from traffic_sim.services.physics import make_sweep, time_of_impact, rotated_rectangles_collide
+from traffic_sim.services.kinematics import integrate
+
+
+def test_time_of_impact():
+    """A big step over a standing car and a crossing car are both caught"""
+    print("⏱️  TIME OF IMPACT")
+    mover = Car([(100, 500), (100, 0)], speed_px_s=100)
+    standing = Car([(100, 300), (100, 0)], speed_px_s=100)
+    crossing = Car([(-100, 100), (500, 100)], speed_px_s=100)
+
+    # 300px in one step: both end positions are clear, the sweep is not
+    jump = time_of_impact(make_sweep(mover, [(100, 500), (100, 200)]),
+                          make_sweep(standing, [(100, 300), (100, 300)]))
+    # Front bumper at 456 meets the rear bumper at 344 after 112 of 300 px
+    print(f"  Jump over standing car: impact at t={jump:.3f}")
+    assert abs(jump - 112 / 300) < 1e-9
+
+    cross = time_of_impact(make_sweep(mover, [(100, 300), (100, -100)]),
+                           make_sweep(crossing, [(-100, 100), (300, 100)]))
+    print(f"  Crossing paths: impact at t={cross:.3f}")
+    assert cross is not None and 0 < cross < 1
+
+    missed = time_of_impact(make_sweep(mover, [(300, 300), (300, -100)]),
+                            make_sweep(crossing, [(-100, 100), (0, 100)]))
+    print(f"  Crossing car stays out of the way: {missed}")
+    assert missed is None
+
+
+def test_integrator_stops_at_impact():
+    """One 2 second step does not carry a car through the car ahead"""
+    print("\n🚧 INTEGRATOR WITH A HUGE STEP")
+    path = [(100, 700), (100, -200)]
+    follower = Car(path, speed_px_s=150)
+    leader = Car(path, speed_px_s=150)
+    leader.pos = [100.0, 400.0]
+    for car in (follower, leader):
+        car.desired_acceleration = 0.0
+        car.max_advance = float('inf')
+        car.hard_stop = False
+    follower.velocity = 150.0
+    leader.velocity = 0.0
+    leader.hard_stop = True
+
+    integrate([follower, leader], 2.0)
+    print(f"  Follower stopped at y={follower.pos[1]:.1f}, leader at y={leader.pos[1]:.1f}")
+    assert follower.pos[1] > leader.pos[1]
+    assert not rotated_rectangles_collide(follower, leader)
+    assert follower.velocity < 150.0
+
+
+def _drive(car, velocity):
+    """Plan as RoadUser.plan would on an open road: speed up, nothing ahead"""
+    car.desired_acceleration = car.get_kinematic_limits()["MAX_ACCELERATION"]
+    car.max_advance = float('inf')
+    car.hard_stop = False
+    if velocity is not None:
+        car.velocity = velocity
+
+
+def test_moving_leader_keeps_its_move():
+    """A fast follower is held back; the slow leader it runs into is not"""
+    print("\n🚙 MOVING LEADER")
+    path = [(100, 700), (100, -2000)]
+    follower = Car(path, speed_px_s=130)
+    leader = Car(path, speed_px_s=30)
+    leader.pos = [100.0, 580.0]
+    _drive(follower, 130.0)
+    _drive(leader, 30.0)
+
+    integrate([follower, leader], 0.5)
+    print(f"  leader y=580 -> {leader.pos[1]:.1f} at {leader.velocity:.0f} px/s, "
+          f"follower y=700 -> {follower.pos[1]:.1f} at {follower.velocity:.0f} px/s")
+    assert abs(leader.pos[1] - 565.0) < 1e-6 and leader.velocity == 30.0
+    assert 0.0 < follower.velocity < 130.0 and follower.pos[1] < 700.0
+    assert not rotated_rectangles_collide(follower, leader)
+
+
+def test_crossing_pair_keeps_moving():
+    """Two cars meeting at a crossing never overlap and both get through"""
+    print("\n✖️  CROSSING PAIR")
+    north = Car([(100, 400), (100, -2000)], speed_px_s=100)
+    east = Car([(-200, 100), (2000, 100)], speed_px_s=100)
+    _drive(north, 100.0)
+    _drive(east, 100.0)
+    for _ in range(12):
+        _drive(north, None)
+        _drive(east, None)
+        integrate([north, east], 0.5)
+        assert not rotated_rectangles_collide(north, east)
+        assert north.velocity > 0.0 or east.velocity > 0.0  # Never both held
+    print(f"  after 6s: north at y={north.pos[1]:.0f}, east at x={east.pos[0]:.0f}")
+    assert north.pos[1] < 0 and east.pos[0] > 150
+
+
+if __name__ == "__main__":
+    test_time_of_impact()
+    test_integrator_stops_at_impact()
+    test_moving_leader_keeps_its_move()
+    test_crossing_pair_keeps_moving()
+    print("\n✅ Continuous collision detection works!")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test script for dirty-rectangle rendering:
+- Only the areas layers covered last frame and this frame are repainted
+- A layer that cannot say what it covered falls back to full frames
+- Frame after frame the dirty screen equals a fully redrawn one
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pygame
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from traffic_sim.core.app import App
+from traffic_sim.render.layers import Compositor
+
+
+def test_dirty_rects():
+    """A moving square repaints its old and new position only"""
+    print("🧽 DIRTY RECTANGLES")
+    background = pygame.Surface((100, 100))
+    background.fill((10, 10, 10))
+    compositor = Compositor(background)
+    pos = [0, 0]
+    sprite = pygame.Surface((10, 10))
+    sprite.fill((255, 255, 255))
+    compositor.add("square", lambda screen: screen.blit(sprite, pos))
+
+    screen = pygame.Surface((100, 100))
+    assert compositor.draw_dirty(screen) == [screen.get_rect()]  # First frame: everything
+    pos[:] = [50, 50]
+    rects = compositor.draw_dirty(screen)
+    print(f"  updated: {rects}")
+    assert rects == [pygame.Rect(0, 0, 10, 10), pygame.Rect(50, 50, 10, 10)]
+    assert tuple(screen.get_at((5, 5)))[:3] == (10, 10, 10)  # Old position restored
+    assert tuple(screen.get_at((55, 55)))[:3] == (255, 255, 255)
+
+    # A layer that returns None forces a full update this frame and the next
+    compositor.add("unknown", lambda screen: None)
+    assert compositor.draw_dirty(screen) == [screen.get_rect()]
+    compositor.layers.pop()
+    assert compositor.draw_dirty(screen) == [screen.get_rect()]
+    assert len(compositor.draw_dirty(screen)) == 2
+
+
+def test_app_dirty_frames_match():
+    """Dirty frames of a running App equal full redraws"""
+    print("\n🎞️  APP DIRTY FRAMES")
+    random.seed(16)
+    app = App(headless=True)
+    app.dirty_rects = True
+    app.boat_active = True
+    app.agents.append(app.boat)
+    area = app.screen.get_width() * app.screen.get_height()
+    updated = []
+    for frame in range(150):
+        app.step(1 / 30)
+        rects = app.compositor.draw_dirty(app.screen)
+        updated.append(sum(r.width * r.height for r in rects))
+        if frame % 10 == 5:
+            dirty = pygame.image.tobytes(app.screen, "RGB")
+            app.compositor.draw(app.screen)  # The next dirty frame is a full one again
+            assert dirty == pygame.image.tobytes(app.screen, "RGB"), f"frame {frame} differs"
+    print(f"  mean updated area: {sum(updated[1:]) / len(updated[1:]) / area:.1%} of the screen")
+    assert sum(updated[1:]) / len(updated[1:]) < area / 2
+
+
+if __name__ == "__main__":
+    test_dirty_rects()
+    test_app_dirty_frames_match()
+    print("\n✅ Dirty-rectangle rendering works!")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test script for the per-entry occupancy registry:
+- Agents count against the entry they spawned at until they leave its radius
+- A full entry holds its queue back without looking at any other agent
+- The App registers every agent it adds at its spawn point
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from traffic_sim.core.app import App
+from traffic_sim.services.entries import EntryQueues
+
+
+class Dummy:
+    def __init__(self, path):
+        self.path = path
+        self.pos = list(path[0])
+        self.done = False
+
+
+def test_occupancy_counters():
+    """Three agents in the radius fill an entry; leaving frees it"""
+    print("👥 ENTRY OCCUPANCY")
+    path = [(100, 900), (100, 600), (100, -80)]
+    queues = EntryQueues(clearance=0.0, radius=180.0)
+    agents = [Dummy(path) for _ in range(3)]
+    for a in agents:
+        queues.occupy(a)
+    queues.arrive(path[0], "CARS_NS_UP", "CAR", 0.0)
+    entry = queues.entry(path[0])
+    assert len(entry.occupants) == 3 and not entry.has_room()
+    assert list(queues.ready()) == []
+
+    agents[0].pos[1] -= 200            # Drove out of the radius
+    agents[1].done = True              # Left the simulation
+    queues.update_occupancy()
+    print(f"  occupants after update: {len(entry.occupants)}")
+    assert entry.occupants == [agents[2]] and list(queues.ready()) == [entry]
+
+    # Agents elsewhere are never looked at: only registered occupants count
+    agents[2].pos[1] -= 500
+    queues.update_occupancy()
+    assert not queues._occupied
+
+
+def test_app_registers_agents():
+    """Every added agent occupies its spawn point's entry"""
+    print("\n🏁 APP REGISTRATION")
+    random.seed(6)
+    app = App(headless=True)
+    # The initial cars and trucks stand on their spawn points
+    occupied = {point: len(entry.occupants) for point, entry in app.entries.entries.items() if entry.occupants}
+    print(f"  occupied entries: {occupied}")
+    assert sum(occupied.values()) == len(app.agents)
+    assert app.entries.entry(app.bikes_ew_right_px[0]).limit == 8
+
+    app.run_headless(30.0, 0.1)
+    app.entries.update_occupancy()
+    for point, entry in app.entries.entries.items():
+        near = [a for a in app.agents if getattr(a, "path", None) and a.path[0] == point
+                and ((a.pos[0] - point[0]) ** 2 + (a.pos[1] - point[1]) ** 2) ** 0.5 < 180]
+        assert len(entry.occupants) == len(near)
+
+
+if __name__ == "__main__":
+    test_occupancy_counters()
+    test_app_registers_agents()
+    print("\n✅ Entry occupancy works!")
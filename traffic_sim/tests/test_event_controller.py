@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test script for the event-driven signal controller:
+- Phases change through scheduled events at exact times (no drift with big steps)
+- next_transition_time() announces the next change
+- Subscribers are notified of every signal group change
+"""
+
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from traffic_sim.domain.world.intersection import Controller, Phase
+from traffic_sim.domain.world.traffic_light import Light
+
+
+def test_scheduled_phases():
+    """NS green 8s, amber 2s, then EW cars, then the ped/bike phases"""
+    print("🚦 SCHEDULED PHASES")
+    ctrl = Controller()
+    changes = []
+    ctrl.subscribe(lambda group, state: changes.append((round(ctrl.time, 6), group, state)))
+
+    assert ctrl.next_transition_time() == 8.0
+    ctrl.update(7.9)
+    assert ctrl.cars_ns.state is Light.GREEN and not changes
+
+    ctrl.update(0.1)
+    assert ctrl.cars_ns.state is Light.AMBER
+    assert ctrl.next_transition_time() == 10.0
+
+    # One big step crosses several events, each at its own exact time
+    ctrl.update(12.5)
+    print(f"  t={ctrl.time:.1f}: phase {ctrl.phase.name}, next change at {ctrl.next_transition_time():.1f}")
+    for change in changes:
+        print(f"    {change[0]:5.1f}s {change[1]:8s} -> {change[2].name}")
+    assert ctrl.phase is Phase.NS_PED_BIKE
+    assert ctrl.next_transition_time() == 26.0
+    assert changes == [
+        (8.0, "cars_ns", Light.AMBER),
+        (10.0, "cars_ns", Light.RED),
+        (10.0, "cars_ew", Light.GREEN),
+        (18.0, "cars_ew", Light.AMBER),
+        (20.0, "cars_ew", Light.RED),
+        (20.0, "ped_ns", Light.GREEN),
+    ]
+
+
+def test_full_cycle_without_drift():
+    """After many small steps the cycle is still exactly 32 seconds"""
+    print("\n⏱️  NO DRIFT")
+    ctrl = Controller()
+    for _ in range(32 * 60):
+        ctrl.update(1 / 60)
+    print(f"  Phase after 32s: {ctrl.phase.name}, next change at {ctrl.next_transition_time():.4f}s")
+    assert ctrl.phase is Phase.NS_CARS_GREEN
+    assert abs(ctrl.next_transition_time() - 40.0) < 1e-6
+
+
+if __name__ == "__main__":
+    test_scheduled_phases()
+    test_full_cycle_without_drift()
+    print("\n✅ Event-driven controller works!")
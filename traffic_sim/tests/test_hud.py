@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script for the cached HUD widgets:
+- Buttons render their label once per state, labels once per text
+- The statistics overlay re-renders at most every refresh_s seconds
+- Frames of a running App render no text at all
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pygame
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from traffic_sim.core.app import App
+from traffic_sim.render.hud import Button, Label, StatsOverlay
+from traffic_sim.services.statistics import SimulationStats
+
+
+class CountingFont:
+    """A font that counts render() calls"""
+
+    def __init__(self):
+        self.font = pygame.font.Font(None, 24)
+        self.renders = 0
+
+    def render(self, *args):
+        self.renders += 1
+        return self.font.render(*args)
+
+
+def test_button_and_label_cache():
+    """Switching back and forth reuses the pre-rendered faces"""
+    print("🔘 CACHED BUTTONS")
+    pygame.font.init()
+    font = CountingFont()
+    button = Button(pygame.Rect(10, 10, 100, 40), font, {
+        False: ((0, 150, 0), (255, 255, 255), "Start"),
+        True: ((150, 150, 150), (200, 200, 200), "Busy"),
+    })
+    label = Label(font, (0, 60))
+    screen = pygame.Surface((200, 100))
+    for frame in range(100):
+        assert button.draw(screen, frame % 20 < 10) == pygame.Rect(10, 10, 100, 40)
+        label.draw(screen, "same text")
+    print(f"  font renders for 100 frames: {font.renders}")
+    assert font.renders == 3
+    assert tuple(screen.get_at((10, 30)))[:3] == (255, 255, 255)  # Border
+    assert tuple(screen.get_at((15, 15)))[:3] == (0, 150, 0)  # Last frame: False
+
+
+def test_stats_overlay_throttled():
+    """Re-rendered only when refresh_s has passed"""
+    print("\n📊 STATS OVERLAY")
+    now = [0.0]
+    overlay = StatsOverlay(SimulationStats(), CountingFont(), refresh_s=0.25, clock=lambda: now[0])
+    screen = pygame.Surface((400, 300))
+    for _ in range(60):  # One second at 60 FPS
+        overlay.draw(screen)
+        now[0] += 1 / 60
+    print(f"  renders in 1 s: {overlay.renders}")
+    assert overlay.renders == 4
+
+
+def test_app_hud_renders_no_text():
+    """Once every face is cached, frames don't call font.render"""
+    print("\n🖥️  APP HUD")
+    random.seed(18)
+    app = App(headless=True)
+    app.boat_active = True
+    app.agents.append(app.boat)
+    app.render()
+    font = CountingFont()
+    for widget in (app.boat_button, app.collision_button, app.pause_button, app.boat_status):
+        widget.font = font
+    for _ in range(30):
+        app.step(1 / 30)
+        app.render()
+    print(f"  font renders in 30 frames: {font.renders}")
+    assert font.renders == 0
+
+
+if __name__ == "__main__":
+    test_button_and_label_cache()
+    test_stats_overlay_throttled()
+    test_app_hud_renders_no_text()
+    print("\n✅ HUD text is cached!")
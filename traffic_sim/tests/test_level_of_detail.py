@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test script for level-of-detail rendering:
+- The detail steps up past a threshold and back only well below it (hysteresis)
+- Boxes fill the collision rectangle, dots are a single pixel, in the agent's colour
+- A crowded App draws boxes instead of sprites and reports what it drew
+- With the agent cap raised, App.render() reaches the configured threshold
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pygame
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from traffic_sim.configuration import Config
+from traffic_sim.core.app import App
+from traffic_sim.domain.actors.car import Car
+from traffic_sim.domain.actors.truck import Truck
+from traffic_sim.render.lod import Detail, LevelOfDetail, draw_box, draw_dot
+from traffic_sim.services.demand import PoissonDemand
+from traffic_sim.services.physics import get_rotated_collision_points
+
+
+def test_hysteresis():
+    """Counts around a threshold do not toggle the detail"""
+    print("🔍 HYSTERESIS")
+    lod = LevelOfDetail(box_above=100, dot_above=1000, hysteresis=0.2)
+    seen = [lod.update(n) for n in (50, 101, 95, 85, 79, 1200, 900, 801, 799, 10)]
+    print(f"  {[d.name for d in seen]}")
+    assert seen == [Detail.FULL, Detail.BOX, Detail.BOX, Detail.BOX, Detail.FULL,
+                    Detail.DOT, Detail.DOT, Detail.DOT, Detail.BOX, Detail.FULL]
+    flips = 0
+    for n in [100 + random.choice((-3, 3)) for _ in range(200)]:
+        before = lod.detail
+        flips += lod.update(n) is not before
+    print(f"  changes while hovering at the threshold: {flips}")
+    assert flips <= 1
+
+
+def test_cheap_drawings():
+    """draw_box covers the collision box, draw_dot exactly one pixel"""
+    print("\n🟥 BOXES AND DOTS")
+    screen = pygame.Surface((200, 200))
+    truck = Truck([(100, 100), (200, 200)], trailer_color=(250, 10, 10))
+    rect = draw_box(screen, truck)
+    corners = get_rotated_collision_points(truck)
+    print(f"  box {rect}, corners {[(round(x), round(y)) for x, y in corners]}")
+    assert screen.get_at((100, 100))[:3] == (250, 10, 10)
+    assert rect.collidepoint(min(x for x, _ in corners) + 1, min(y for _, y in corners) + 1)
+
+    screen.fill((0, 0, 0))
+    car = Car([(50, 60), (150, 60)], color=(10, 250, 10))
+    rect = draw_dot(screen, car)
+    lit = [(x, y) for x in range(200) for y in range(200) if screen.get_at((x, y))[:3] != (0, 0, 0)]
+    print(f"  dot {rect}, lit {lit}")
+    assert lit == [(50, 60)] and rect.size == (1, 1)
+    assert screen.get_at((50, 60))[:3] == (10, 250, 10)
+
+
+def test_app_switches_detail():
+    """With a low threshold the App draws boxes and switches back when it empties"""
+    print("\n🏙️  APP LEVEL OF DETAIL")
+    random.seed(2)
+    app = App(headless=True)
+    app.run_headless(30.0, 0.1)
+    visible = sum(1 for a in app.agents if app.screen_rect.collidepoint(a.pos))
+    app.lod = LevelOfDetail(box_above=visible - 1, dot_above=10 * visible, hysteresis=0.5)
+    drawn = app._draw_agents(app.screen)
+    print(f"  {visible} visible agents -> {app.lod.detail.name}, {len(drawn)} rects")
+    assert app.lod.detail is Detail.BOX and len(drawn) == visible
+
+    app.lod.dot_above = visible - 1
+    drawn = app._draw_agents(app.screen)
+    assert app.lod.detail is Detail.DOT and all(r.size in ((1, 1), (0, 0)) for r in drawn)
+
+    app.lod = LevelOfDetail(box_above=10 * visible, dot_above=100 * visible)
+    drawn = app._draw_agents(app.screen)
+    assert app.lod.detail is Detail.FULL and len(drawn) == len(app.agents)
+    assert sum(1 for r in drawn if r.width > 1) >= visible  # Sprites again
+
+
+def test_dense_render_switches_detail():
+    """A raised agent cap lets a busy App pass BOX_ABOVE; render() switches and switches back"""
+    print("\n🚦 DENSE SCENE RENDER")
+    random.seed(3)
+    busy = PoissonDemand({route: {actor: 2.0 * rate for actor, rate in actors.items()}
+                          for route, actors in Config.DEMAND_RATES.items()}, seed=3)
+    box_above = Config.LEVEL_OF_DETAIL["BOX_ABOVE"]
+    app = App(headless=True, demand=busy, max_agents=10 * box_above)
+    assert Config.MAX_TOTAL_AGENTS < box_above < app.max_total_agents
+
+    def visible():
+        return sum(1 for a in app.agents if app.screen_rect.collidepoint(a.pos))
+
+    sim_time = 0.0
+    while visible() <= box_above and sim_time < 300.0:
+        app.step(0.1)
+        sim_time += 0.1
+    app.render()
+    print(f"  {visible()} visible after {sim_time:.0f}s -> {app.lod.detail.name}")
+    assert visible() > box_above and app.lod.detail is Detail.BOX
+
+    # Thin the scene out well below the threshold: sprites again
+    for agent in list(app.agents)[box_above // 2:]:
+        app.agents.remove(agent)
+    app.render()
+    print(f"  {visible()} visible -> {app.lod.detail.name}")
+    assert app.lod.detail is Detail.FULL
+
+
+if __name__ == "__main__":
+    pygame.init()
+    test_hysteresis()
+    test_cheap_drawings()
+    test_app_switches_detail()
+    test_dense_render_switches_detail()
+    print("\n✅ Level of detail works!")
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Test script for the max-pressure signal controller:
+- Loop detectors keep queue and downstream link counts up to date as agents move
+- A blocked downstream link lowers the pressure of the movements feeding it
+- The stage with the largest pressure is served next, out of cycle order
+- The current stage keeps green while it is the best one, up to max_green
+- A new stage waits for the box to clear
+"""
+
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from traffic_sim.configuration import Config
+from traffic_sim.domain.actors.car import Car
+from traffic_sim.domain.world.intersection import Controller, Phase
+from traffic_sim.services.detectors import LoopDetectors
+from traffic_sim.services.pathing import to_pixels, CARS_NS_UP, CARS_NS_RIGHT, CARS_EW_RIGHT
+
+
+def test_pressure_counts():
+    """Queued agents add pressure, discharged ones still on screen take it away"""
+    print("📊 PRESSURE COUNTS")
+    path = to_pixels(CARS_NS_UP, Config.WIDTH, Config.HEIGHT)
+    detectors = LoopDetectors()
+    detectors.add_route("cars_ns", path)
+    stop = path[1]
+    cars = []
+    for offset in (10, 60, 110):
+        car = Car(path, speed_px_s=100, can_cross_ok=lambda: True)
+        car.signal_group = "cars_ns"
+        car.pos = [stop[0], stop[1] + offset]
+        cars.append(car)
+    detectors.update(cars, 0.0)
+    assert detectors.pressure("cars_ns") == 3
+
+    cars[0].advance_along_path(100)
+    detectors.update([cars[0]], 1.0)
+    print(f"  queued={detectors.queued['cars_ns']}, on the exit link={detectors.link_occupancy[tuple(path[-1])]}")
+    assert detectors.pressure("cars_ns") == 2 - 1
+
+    detectors.remove(cars[0])
+    assert detectors.pressure("cars_ns") == 2
+
+
+def place(path, group, offsets):
+    """Cars on path at these arc-length offsets from the stop line (negative: queued before it)"""
+    cars = []
+    for offset in offsets:
+        car = Car(path, speed_px_s=100, can_cross_ok=lambda: True)
+        car.signal_group = group
+        car.advance_along_path(car._path_cumulative_lengths()[1] + offset)
+        cars.append(car)
+    return cars
+
+
+def test_blocked_downstream():
+    """Agents standing on an exit link lower the pressure of every movement into it"""
+    print("\n🚧 BLOCKED DOWNSTREAM")
+    up = to_pixels(CARS_NS_UP, Config.WIDTH, Config.HEIGHT)
+    right = to_pixels(CARS_NS_RIGHT, Config.WIDTH, Config.HEIGHT)
+    east = to_pixels(CARS_EW_RIGHT, Config.WIDTH, Config.HEIGHT)
+    assert tuple(right[-1]) == tuple(east[-1])  # Both leave over the bridge
+    detectors = LoopDetectors()
+    for group, path in (("cars_ns", up), ("cars_ns", right), ("cars_ew", east)):
+        detectors.add_route(group, path)
+    queue = place(right, "cars_ns", (-60, -10))
+    detectors.update(queue, 0.0)
+    free = detectors.pressure("cars_ns")
+
+    # EW traffic discharged over the bridge is standing on the east exit
+    jam = place(east, "cars_ew", (400, 500, 600))
+    detectors.update(jam, 1.0)
+    blocked = detectors.pressure("cars_ns")
+    print(f"  cars_ns pressure free={free}, east exit blocked={blocked}")
+    assert free == 2 and blocked == 2 - 3
+
+    # A queue for the free north exit is not affected by the jam
+    detectors.update(place(up, "cars_ns", (-30,)), 2.0)
+    assert detectors.pressure("cars_ns") == blocked + 1
+
+    for car in jam:
+        detectors.remove(car)
+    assert detectors.pressure("cars_ns") == free + 1
+
+
+class FakeDetectors:
+    def __init__(self):
+        self.pressures = {}
+        self.occupied = set()
+
+    def pressure(self, group):
+        return self.pressures.get(group, 0)
+
+    def box_clear(self, groups):
+        return not self.occupied.intersection(groups)
+
+
+def test_serves_highest_pressure():
+    """Hold while best, jump to the busiest stage, give up green at max_green"""
+    print("\n⚖️  MAX-PRESSURE CONTROL")
+    ctrl = Controller()
+    detectors = FakeDetectors()
+    detectors.pressures = {"cars_ns": 4, "ped_ew": 2}
+    ctrl.set_max_pressure(detectors, decision_interval=2.0)
+
+    # NS is the busiest: green beyond min_green (5 s)
+    ctrl.update(9.0)
+    assert ctrl.phase is Phase.NS_CARS_GREEN
+
+    # The EW crossing builds up more pressure: served next, skipping EW cars
+    detectors.pressures = {"cars_ns": 1, "ped_ew": 3}
+    ctrl.update(2.0)                   # Decision at 11 s, amber until 13 s
+    assert not ctrl.can_cars_cross_ns()
+    ctrl.update(2.0)
+    print(f"  t={ctrl.time:.1f}: {ctrl.phase.name}")
+    assert ctrl.phase is Phase.EW_PED_BIKE and ctrl.can_ped_cross_ew()
+
+    # Still the busiest stage, but max_green (10 s) ends it for NS cars
+    detectors.pressures = {"cars_ns": 1, "ped_ew": 5}
+    ctrl.update(9.9)
+    assert ctrl.phase is Phase.EW_PED_BIKE
+    ctrl.update(0.2)
+    print(f"  t={ctrl.time:.1f}: {ctrl.phase.name}")
+    assert ctrl.phase is Phase.NS_CARS_GREEN
+
+
+def test_clearance_hold():
+    """The next stage waits until the box is clear of the other groups"""
+    print("\n🧹 CLEARANCE HOLD")
+    ctrl = Controller()
+    detectors = FakeDetectors()
+    detectors.pressures = {"cars_ew": 3}
+    ctrl.set_max_pressure(detectors)
+
+    # NS gives way at min_green (5 s), but an NS car is still in the box after amber
+    detectors.occupied.add("cars_ns")
+    ctrl.update(8.0)
+    assert not ctrl.can_cars_cross_ns() and not ctrl.can_cars_cross_ew()
+    detectors.occupied.clear()
+    ctrl.update(0.5)
+    print(f"  t={ctrl.time:.1f}: {ctrl.phase.name}")
+    assert ctrl.phase is Phase.EW_CARS_GREEN
+
+
+if __name__ == "__main__":
+    test_pressure_counts()
+    test_blocked_downstream()
+    test_serves_highest_pressure()
+    test_clearance_hold()
+    print("\n✅ Max-pressure control works!")
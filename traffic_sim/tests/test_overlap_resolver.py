@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test script for the constraint-based overlap resolver:
+- Overlapping vehicles are pushed back along their route, never sideways
+- Corrections are counted in the statistics instead of printed
+"""
+
+import sys
+import io
+import contextlib
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from traffic_sim.domain.actors.car import Car
+from traffic_sim.domain.actors.pedestrian import Pedestrian
+from traffic_sim.services.physics import find_contact_pairs, rectangles_collide
+from traffic_sim.services.overlap_resolver import resolve_overlaps
+from traffic_sim.core.app import App
+
+
+def test_pushed_back_along_route():
+    """The rear car of an overlapping pair goes back along its own lane"""
+    print("↩️  PUSH BACK ALONG ROUTE")
+    path = [(100, 700), (100, 300), (400, 300)]
+    leader = Car(path, speed_px_s=100)
+    follower = Car(path, speed_px_s=100)
+    leader.pos = [100.0, 450.0]
+    follower.pos = [100.0, 500.0]  # 50px apart, car boxes are 88px long
+    agents = [leader, follower]
+
+    corrections, distance = resolve_overlaps(agents)
+    print(f"  {corrections} correction(s), moved {distance:.1f}px; follower now at {follower.pos}")
+
+    assert corrections == 1
+    assert not find_contact_pairs(agents)
+    assert leader.pos == [100.0, 450.0]
+    assert follower.pos[0] == 100.0 and follower.pos[1] > 500.0
+
+
+def test_crossing_overlap_stays_on_routes():
+    """A car overlapping a crossing pedestrian backs up on its own road"""
+    print("\n🚶 CROSSING OVERLAP")
+    car = Car([(500, 700), (500, 0)], speed_px_s=100)
+    ped = Pedestrian([(300, 300), (700, 300)], 40, lambda: True)
+    car.pos = [500.0, 340.0]
+    ped.pos = [500.0, 300.0]
+
+    resolve_overlaps([car, ped])
+    print(f"  Car at {car.pos}, pedestrian at {ped.pos}")
+    assert not rectangles_collide(car, ped)
+    assert car.pos[0] == 500.0 and ped.pos[1] == 300.0
+
+
+def test_app_reports_to_stats():
+    """App counts corrections in the stats and prints nothing"""
+    print("\n📊 STATS INSTEAD OF STDOUT")
+    app = App(headless=True)
+    path = [(100, 700), (100, 0)]
+    front, back = Car(path, speed_px_s=100), Car(path, speed_px_s=100)
+    front.pos, back.pos = [100.0, 400.0], [100.0, 430.0]
+    app.agents[:] = [front, back]
+
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        app._separate_colliding_vehicles()
+    summary = app.stats.get_summary()
+    print(f"  Corrections: {summary['overlap_corrections']}, distance {summary['overlap_distance']:.1f}px")
+    assert summary['overlap_corrections'] == 1
+    assert out.getvalue() == ""
+
+
+if __name__ == "__main__":
+    test_pushed_back_along_route()
+    test_crossing_overlap_stays_on_routes()
+    test_app_reports_to_stats()
+    print("\n✅ Overlap resolver works!")
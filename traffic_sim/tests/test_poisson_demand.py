@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test script for the Poisson demand model:
+- Arrival counts match the flow rates, with exponential (not periodic) gaps
+- Arrivals come out in time order across routes, block after block
+- The same seed gives the same arrivals on a route whatever the other flows are
+- The App spawns agents on the route of each arrival
+"""
+
+import random
+import statistics
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from traffic_sim.core.app import App
+from traffic_sim.services.demand import PoissonDemand, arrival_times
+
+
+def test_arrival_statistics():
+    """3600 veh/h gives ~1 arrival per second with exponential gaps"""
+    print("🎲 POISSON ARRIVALS")
+    times = arrival_times(random.Random(7), 1.0, 10000.0)
+    gaps = [b - a for a, b in zip(times, times[1:])]
+    mean, sd = statistics.mean(gaps), statistics.stdev(gaps)
+    print(f"  {len(times)} arrivals, mean gap {mean:.3f}s, sd {sd:.3f}s")
+    assert 9600 < len(times) < 10400
+    assert abs(mean - 1.0) < 0.05 and abs(sd - 1.0) < 0.05  # Exponential: sd == mean
+    assert times == sorted(times) and times[-1] < 10000.0
+
+
+def test_schedule_order_and_seeds():
+    """Due arrivals come out in order over block boundaries; streams are per flow"""
+    print("\n📅 ARRIVAL SCHEDULE")
+    demand = PoissonDemand({"CARS_NS_UP": {"CAR": 720.0}, "PEDS_EW_RIGHT": {"PEDESTRIAN": 360.0}},
+                           seed=42, block_s=60.0)
+    first = demand.time_until_next(0.0)
+    assert 0.0 < first < 60.0
+    arrivals = []
+    for second in range(1, 601):
+        arrivals += demand.pop_due(float(second))
+    counts = {route: sum(1 for r, _ in arrivals if r == route) for route in ("CARS_NS_UP", "PEDS_EW_RIGHT")}
+    print(f"  10 minutes: {counts}")
+    assert 90 < counts["CARS_NS_UP"] < 150 and 40 < counts["PEDS_EW_RIGHT"] < 80
+
+    def car_times(rates):
+        d = PoissonDemand(rates, seed=42, block_s=60.0)
+        out, t = [], 0.0
+        while t < 300.0:
+            t += d.time_until_next(t)
+            out += [t for route, _ in d.pop_due(t) if route == "CARS_NS_UP"]
+        return out
+
+    alone = car_times({"CARS_NS_UP": {"CAR": 720.0}})
+    assert alone == car_times({"CARS_NS_UP": {"CAR": 720.0}, "BIKES_NS_UP": {"CYCLIST": 900.0}})
+    assert all(b >= a for a, b in zip(alone, alone[1:]))
+
+
+def test_app_spawns_arrivals():
+    """Arrivals become agents on their own route"""
+    print("\n🚗 APP DEMAND")
+    random.seed(5)
+    app = App(headless=True)
+    app.demand = PoissonDemand({"BIKES_EW_LEFT": {"CYCLIST": 1800.0}}, seed=1)
+    app.agents.clear()
+    app.run_headless(10.0, 0.1)
+    bikes = [a for a in app.agents if a.signal_group == "ped_ew"]
+    print(f"  {len(bikes)} cyclists spawned, spawns={app.stats.get_summary()['spawns']}")
+    assert bikes and all(a.path == app.bikes_ew_left_px for a in bikes)
+
+
+if __name__ == "__main__":
+    test_arrival_statistics()
+    test_schedule_order_and_seeds()
+    test_app_spawns_arrivals()
+    print("\n✅ Poisson demand works!")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test script for the layered frame compositor:
+- Layers are drawn bottom to top over the static background
+- The bridge overlay is pre-baked, transparent and cropped to the bridges
+- A boat under the bridge is hidden by the overlay in the App frame
+"""
+
+import sys
+from pathlib import Path
+
+import pygame
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from traffic_sim.configuration import Config
+from traffic_sim.core.app import App
+from traffic_sim.render.draw_world import WorldRenderer
+from traffic_sim.render.layers import Compositor
+
+
+def test_layer_order():
+    """Later layers cover earlier ones, the background is blitted first"""
+    print("🧅 LAYER ORDER")
+    background = pygame.Surface((40, 40))
+    background.fill((1, 2, 3))
+    compositor = Compositor(background)
+    sprite = pygame.Surface((10, 10))
+    sprite.fill((200, 0, 0))
+    overlay = pygame.Surface((20, 5), pygame.SRCALPHA)
+    overlay.fill((0, 0, 200, 255))
+    compositor.add("sprite", lambda screen: screen.blit(sprite, (0, 0)))
+    compositor.add_static("overlay", overlay, (0, 5))
+
+    screen = pygame.Surface((40, 40))
+    compositor.draw(screen)
+    print(f"  layers: {[layer[0] for layer in compositor.layers]}")
+    assert tuple(screen.get_at((2, 2)))[:3] == (200, 0, 0)
+    assert tuple(screen.get_at((2, 7)))[:3] == (0, 0, 200)
+    assert tuple(screen.get_at((30, 30)))[:3] == (1, 2, 3)
+
+
+def test_bridge_overlay():
+    """Transparent outside the bridges, only as large as the bridges"""
+    print("\n🌉 BRIDGE OVERLAY")
+    world = WorldRenderer()
+    overlay, (x, y) = world.bridge_overlay, world.bridge_pos
+    print(f"  overlay {overlay.get_size()} at {(x, y)}")
+    assert overlay.get_flags() & pygame.SRCALPHA
+    assert overlay.get_width() * overlay.get_height() < Config.WIDTH * Config.HEIGHT / 4
+    assert x >= Config.WIDTH * 0.7 - 1
+    # Between the pedestrian bridge and the road bridge the river shows through
+    gap_y = int(Config.HEIGHT * 0.30) + 25 - y
+    assert overlay.get_at((overlay.get_width() // 2, gap_y)).a == 0
+
+
+def test_app_frame():
+    """A boat on the road bridge is drawn under it"""
+    print("\n🖼️  APP FRAME")
+    app = App(headless=True)
+    assert [layer[0] for layer in app.compositor.layers][:3] == ["boats", "bridge", "agents"]
+    app.agents.clear()
+    app.boat.pos = [app.boat.path[2][0], app.boat.path[2][1]]
+    app.boat.done = False
+    app.agents.append(app.boat)
+    app.render()
+    centre = (int(app.boat.pos[0]), int(app.boat.pos[1]))
+    print(f"  pixel under the boat: {tuple(app.screen.get_at(centre))[:3]}")
+    assert tuple(app.screen.get_at(centre))[:3] == (80, 80, 80)
+
+
+if __name__ == "__main__":
+    test_layer_order()
+    test_bridge_overlay()
+    test_app_frame()
+    print("\n✅ Layered rendering works!")
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test script for river traffic:
+- Boats in a lane never overtake and keep their gap behind slower boats
+- Arrivals wait while the lane entry is occupied, none are lost
+- Finished boats are reused and share their sprites
+- The App sails a busy waterway next to road traffic
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pygame
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from traffic_sim.core.app import App
+from traffic_sim.domain.world import boat as boat_module
+from traffic_sim.services.demand import PoissonDemand
+from traffic_sim.services.river import RiverTraffic, gap_between
+
+LANES = {
+    "RIVER_UP": [(900, 818), (900, -50)],
+    "RIVER_DOWN": [(800, -50), (800, 818)],
+}
+
+
+def busy_river(rate=720.0, **kwargs):
+    demand = PoissonDemand({lane: {"BOAT": rate} for lane in LANES}, seed=5)
+    return RiverTraffic(LANES, demand, speed=50.0, speed_spread=0.4, scales=(1.0, 1.4), **kwargs)
+
+
+def check_lanes(river):
+    for lane in river.lanes.values():
+        boats = list(lane.boats)
+        assert all(b.pos[0] == lane.path[0][0] for b in boats)  # Own side of the river
+        for leader, follower in zip(boats, boats[1:]):
+            assert leader.travelled - follower.travelled >= gap_between(leader, follower.scale) - 1e-6
+
+
+def test_lane_discipline():
+    """Front-to-back order is kept and gaps are respected"""
+    print("⛵ LANE DISCIPLINE")
+    river = busy_river()
+    now = 0.0
+    platooned = 0
+    for _ in range(3000):  # 5 minutes
+        now += 0.1
+        river.update(0.1, now)
+        check_lanes(river)
+        for lane in river.lanes.values():
+            platooned += sum(1 for leader, follower in zip(lane.boats, list(lane.boats)[1:])
+                             if leader.travelled - follower.travelled < gap_between(leader, follower.scale) + 1.0)
+    waiting = sum(lane.waiting for lane in river.lanes.values())
+    print(f"  launched={river.launched}, completed={river.completed}, sailing={river.count}, "
+          f"waiting={waiting}, boat-steps held back={platooned}")
+    assert platooned > 0  # Fast boats caught up and had to follow
+    assert river.launched + waiting == river.demand.released
+    assert river.completed > 0 and river.launched == river.completed + river.count
+    up = river.lanes["RIVER_UP"].boats
+    assert all(b.heading == 0.0 for b in up) and all(b.heading == 180.0 for b in river.lanes["RIVER_DOWN"].boats)
+
+
+def test_boats_are_reused():
+    """After warm-up no boats or boat sprites are created"""
+    print("\n♻️  BOAT POOL")
+    river = busy_river(rate=60.0)
+    screen = pygame.Surface((1024, 768))
+    now = 0.0
+    for _ in range(3000):
+        now += 0.1
+        river.update(0.1, now)
+        river.draw(screen)
+    created = []
+    original = boat_module.Boat.__init__
+    boat_module.Boat.__init__ = lambda self, *a, **k: created.append(self) or original(self, *a, **k)
+    built = []
+    sprite_builder = boat_module.Boat._create_surface
+    boat_module.Boat._create_surface = lambda self: built.append(self) or sprite_builder(self)
+    try:
+        launched = river.launched
+        for _ in range(3000):
+            now += 0.1
+            river.update(0.1, now)
+            river.draw(screen)
+    finally:
+        boat_module.Boat.__init__ = original
+        boat_module.Boat._create_surface = sprite_builder
+    print(f"  launched {river.launched - launched}, new boats {len(created)}, new sprites {len(built)}")
+    assert river.launched > launched and len(created) < river.launched - launched
+    assert not built
+
+
+def test_app_river():
+    """Boats sail in the App; road traffic is not affected"""
+    print("\n🌊 APP RIVER")
+    random.seed(20)
+    app = App(headless=True)
+    app.river.demand = PoissonDemand({lane: {"BOAT": 120.0} for lane in app.river.lanes}, seed=7)
+    app.run_headless(120.0, 0.1)
+    print(f"  boats launched={app.river.launched}, sailing={app.river.count}")
+    assert app.river.launched > 0 and app.river.count > 0
+    assert not any(isinstance(a, boat_module.Boat) for a in app.agents)
+    check_lanes(app.river)
+    app.render()
+
+
+if __name__ == "__main__":
+    test_lane_discipline()
+    test_boats_are_reused()
+    test_app_river()
+    print("\n✅ River traffic works!")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test script for the signal state broadcast table:
+- Spawned agents read their group's green flag from the Controller's array
+- The flags follow phase changes without any per-agent callback
+- Agents pickle (pygame surfaces are rebuilt on load) and stay bound to the
+  controller they were pickled with
+"""
+
+import pickle
+import random
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from traffic_sim.configuration import Config
+from traffic_sim.core.app import App
+from traffic_sim.domain.actors.car import Car
+from traffic_sim.domain.world.intersection import Controller, Phase
+from traffic_sim.services.pathing import to_pixels, CARS_NS_UP
+from traffic_sim.services.spawner import Spawner
+
+
+def test_spawned_agents_read_flags():
+    """Agents from a bound spawner follow the controller's flags"""
+    print("📡 SIGNAL BROADCAST TABLE")
+    ctrl = Controller()
+    path = to_pixels(CARS_NS_UP, Config.WIDTH, Config.HEIGHT)
+    ns = Spawner(factory=lambda: Car(path), signal_group="cars_ns", signals=ctrl).spawn()
+    ew = Spawner(factory=lambda: Car(path), signal_group="cars_ew", signals=ctrl).spawn()
+
+    assert ns.signal_flags is ctrl.green and ns.signal_index == ctrl.signal_index("cars_ns")
+    assert ctrl.phase is Phase.NS_CARS_GREEN
+    assert ns._can_cross() and not ew._can_cross()
+
+    # Run to EW green: same flag list, updated in place on the phase change
+    while ctrl.phase is not Phase.EW_CARS_GREEN:
+        ctrl.update(0.5)
+    print(f"  t={ctrl.time:.1f}: flags={dict(zip(ctrl.SIGNAL_GROUPS, ctrl.green))}")
+    assert not ns._can_cross() and ew._can_cross()
+
+    # Unbound agents keep the callback (or always cross without one)
+    assert Car(path)._can_cross() and not Car(path, can_cross_ok=lambda: False)._can_cross()
+
+
+def test_agents_pickle():
+    """A running simulation's agents and controller pickle together"""
+    print("\n🥒 PICKLING AGENTS")
+    random.seed(3)
+    app = App(headless=True)
+    app.run_headless(20.0, 0.1)
+    assert app.agents, "expected agents on screen after 20 s"
+
+    ctrl, agents = pickle.loads(pickle.dumps((app.ctrl, app.agents)))
+    print(f"  {len(agents)} agents restored")
+    for before, after in zip(app.agents, agents):
+        assert type(after) is type(before) and after.pos == before.pos
+        assert after.signal_flags is ctrl.green  # Still shares the restored controller's table
+        assert after._can_cross() == before._can_cross()
+        for name in after._SURFACE_ATTRS:
+            assert getattr(after, name).get_size() == getattr(before, name).get_size()
+
+
+if __name__ == "__main__":
+    test_spawned_agents_read_flags()
+    test_agents_pickle()
+    print("\n✅ Signal broadcast table works!")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test script for sleeping agents:
+- A queue at red parks: the first car on its signal group, the next on its leader
+- Green wakes the first car, and it wakes the one behind it when it drives off
+- Slept time still counts towards total_time
+- IDM only computes awake agents; parked ones are standing leaders
+"""
+
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from traffic_sim.configuration import Config
+from traffic_sim.domain.actors.car import Car
+from traffic_sim.services.car_following import compute_lane_accelerations
+from traffic_sim.services.kinematics import integrate
+from traffic_sim.services.pathing import to_pixels, CARS_NS_UP
+from traffic_sim.services.sleeping import SleepScheduler, SLEEP_SPEED_THRESHOLD
+
+
+def _step(agents, sleep, dt):
+    """One tick the way App.step handles awake and parked agents."""
+    planned = [a for a in agents if not a.sleeping and a.plan(dt)]
+    integrate(planned, dt, obstacles=sleep.get_sleepers())
+    sleep.end_tick(dt)
+    for a in planned:
+        if a.velocity > SLEEP_SPEED_THRESHOLD:
+            sleep.on_agent_moved(a)
+        else:
+            sleep.try_park(a)
+
+
+def test_queue_sleeps_and_wakes():
+    """Queue at red parks, green wakes it front to back"""
+    print("😴 SLEEPING QUEUE AT RED")
+    light = {"green": False}
+    path = to_pixels(CARS_NS_UP, Config.WIDTH, Config.HEIGHT)
+    leader = Car(path, speed_px_s=100, can_cross_ok=lambda: light["green"])
+    follower = Car(path, speed_px_s=100, can_cross_ok=lambda: light["green"])
+    leader.pos = [path[0][0], path[0][1] - 150]
+    agents = [leader, follower]
+    for a in agents:
+        a.all_agents = agents
+        a.signal_group = "cars_ns"
+
+    sleep = SleepScheduler()
+    dt = 0.05
+    for _ in range(int(10 / dt)):
+        _step(agents, sleep, dt)
+
+    print(f"  Leader: sleeping={leader.sleeping} ({leader.wait_reason})")
+    print(f"  Follower: sleeping={follower.sleeping} ({follower.wait_reason})")
+    assert leader.sleeping and leader.wait_reason == "signal"
+    assert follower.sleeping and follower.wait_reason == "leader"
+    assert follower.blocking_leader is leader
+
+    # Green: only the car at the stop line is woken by the signal group
+    light["green"] = True
+    assert sleep.on_signal_change("cars_ns") == 1
+    assert not leader.sleeping and follower.sleeping
+    assert abs(leader.total_time - 10.0) < dt + 1e-6
+
+    for _ in range(20):
+        _step(agents, sleep, dt)
+    print(f"  After green: leader v={leader.velocity:.1f}, follower v={follower.velocity:.1f}")
+    assert not follower.sleeping
+    assert follower.velocity > SLEEP_SPEED_THRESHOLD
+
+
+def test_idm_skips_parked_agents():
+    """Parked agents get no IDM pass but still hold up the car behind them"""
+    print("\n🅿️  IDM WITH PARKED AGENTS")
+    path = [(100, 700), (100, -200)]
+    parked = Car(path, speed_px_s=100)
+    parked.pos = [100.0, 400.0]
+    parked.velocity = 0.0
+    follower = Car(path, speed_px_s=100)
+    follower.pos = [100.0, 520.0]
+    follower.velocity = 100.0
+    other_lane = [Car([(300, 700), (300, -200)], speed_px_s=100)]  # Only parked agents
+    for a in [parked] + other_lane:
+        a.idm_acceleration = None
+
+    compute_lane_accelerations([follower], standing=[parked] + other_lane)
+    print(f"  follower: leader={type(follower.idm_leader).__name__}, gap={follower.idm_gap:.1f}, "
+          f"a={follower.idm_acceleration:.1f}")
+    assert follower.idm_leader is parked and follower.idm_gap < 120.0
+    assert follower.idm_acceleration < 0.0  # Brakes for the standing car
+    assert parked.idm_acceleration is None and other_lane[0].idm_acceleration is None
+
+
+if __name__ == "__main__":
+    test_queue_sleeps_and_wakes()
+    test_idm_skips_parked_agents()
+    print("\n✅ Sleeping agents work!")
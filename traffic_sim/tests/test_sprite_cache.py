@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared sprite cache:
+- Agents that look the same share one surface, different looks do not
+- Pickled agents get the shared surface back on load
+- A running App holds far fewer sprites than it spawned agents
+"""
+
+import pickle
+import random
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from traffic_sim.configuration import Config
+from traffic_sim.core.app import App
+from traffic_sim.domain.actors.car import Car
+from traffic_sim.domain.actors.pedestrian import Pedestrian
+from traffic_sim.render.sprites import sprite_count
+from traffic_sim.services.pathing import to_pixels, CARS_NS_UP, PEDS_EW_RIGHT
+
+
+def test_same_look_same_surface():
+    """One surface per (type, colours, size)"""
+    print("🎨 SHARED SPRITES")
+    path = to_pixels(CARS_NS_UP, Config.WIDTH, Config.HEIGHT)
+    a = Car(path, color=(10, 20, 30), roof_color=(40, 50, 60))
+    b = Car(path, color=(10, 20, 30), roof_color=(40, 50, 60))
+    c = Car(path, color=(200, 20, 30), roof_color=(40, 50, 60))
+    print(f"  a is b: {a._car_surf is b._car_surf}, a is c: {a._car_surf is c._car_surf}")
+    assert a._car_surf is b._car_surf
+    assert a._car_surf is not c._car_surf
+
+    ped_path = to_pixels(PEDS_EW_RIGHT, Config.WIDTH, Config.HEIGHT)
+    p = Pedestrian(ped_path)
+    q = pickle.loads(pickle.dumps(p))
+    assert q._ped_surf is p._ped_surf
+
+
+def test_app_sprite_count():
+    """Memory follows distinct looks, not agents"""
+    print("\n🧮 SPRITES IN THE APP")
+    random.seed(12)
+    app = App(headless=True)
+    before = sprite_count()
+    app.run_headless(120.0, 0.1)
+    spawned = sum(app.stats.get_summary()["spawns"].values())
+    print(f"  spawned {spawned}, new sprites {sprite_count() - before}")
+    assert sprite_count() - before < spawned
+
+
+if __name__ == "__main__":
+    test_same_look_same_surface()
+    test_app_sprite_count()
+    print("\n✅ Sprite cache works!")
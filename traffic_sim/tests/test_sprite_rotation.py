@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script for the rotated sprite cache:
+- Headings are quantised, each (sprite, heading) is rotated once
+- Driving straight draws without a single rotation
+- Drawing a busy App frame twice rotates nothing the second time
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pygame
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from traffic_sim.configuration import Config
+from traffic_sim.core.app import App
+from traffic_sim.domain.actors.car import Car
+from traffic_sim.render import sprites
+from traffic_sim.render.sprites import rotated_sprite, rotation_count
+from traffic_sim.services.pathing import to_pixels, CARS_NS_UP
+
+
+class CountRotations:
+    """Counts pygame.transform.rotate calls made while active"""
+
+    def __enter__(self):
+        self.calls = 0
+        self._rotate = sprites.pg.transform.rotate
+
+        def rotate(surface, angle):
+            self.calls += 1
+            return self._rotate(surface, angle)
+        sprites.pg.transform.rotate = rotate
+        return self
+
+    def __exit__(self, *exc):
+        sprites.pg.transform.rotate = self._rotate
+
+
+def test_quantised_headings():
+    """Nearby angles share one rotated surface"""
+    print("🧭 QUANTISED HEADINGS")
+    sprite = pygame.Surface((20, 40), pygame.SRCALPHA)
+    assert rotated_sprite(sprite, 0.4) is sprite
+    assert rotated_sprite(sprite, 359.3) is sprite
+    before = rotation_count()
+    a = rotated_sprite(sprite, 45.4)
+    assert rotated_sprite(sprite, 46.3) is a and rotated_sprite(sprite, 46.3 - 360) is a
+    assert rotated_sprite(sprite, 47.5) is not a
+    print(f"  cached rotations: {rotation_count() - before}")
+    assert rotation_count() - before == 2
+
+
+def test_straight_driving_never_rotates():
+    """A car driving up its lane keeps the unrotated sprite"""
+    print("\n🚗 STRAIGHT DRIVING")
+    screen = pygame.Surface((Config.WIDTH, Config.HEIGHT))
+    car = Car(to_pixels(CARS_NS_UP, Config.WIDTH, Config.HEIGHT))
+    with CountRotations() as counter:
+        for _ in range(50):
+            car.advance_along_path(3.0)
+            car.draw(screen)
+    print(f"  rotations while driving straight: {counter.calls}")
+    assert counter.calls == 0
+
+
+def test_app_frames_reuse_rotations():
+    """The second draw of the same frame is lookups only"""
+    print("\n🖼️  APP FRAMES")
+    random.seed(14)
+    app = App(headless=True)
+    app.run_headless(60.0, 0.1)
+    screen = pygame.Surface((Config.WIDTH, Config.HEIGHT))
+    for agent in app.agents:
+        agent.draw(screen)
+    with CountRotations() as counter:
+        for agent in app.agents:
+            agent.draw(screen)
+    print(f"  agents={len(app.agents)}, rotations on redraw={counter.calls}")
+    assert counter.calls == 0
+
+
+if __name__ == "__main__":
+    test_quantised_headings()
+    test_straight_driving_never_rotates()
+    test_app_frames_reuse_rotations()
+    print("\n✅ Rotated sprite cache works!")
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Test script for the pre-rendered traffic light surfaces:
+- All three states are drawn and rotated once, at construction
+- Switching state and drawing never builds or rotates a surface
+"""
+
+import sys
+from pathlib import Path
+
+import pygame
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from traffic_sim.domain.world.traffic_light import Light, Stoplicht
+from traffic_sim.render import draw_traffic_light
+from traffic_sim.render.draw_traffic_light import DrawableStoplicht
+
+
+def test_states_prerendered():
+    """One rotated surface per state, picked by set_active"""
+    print("🚦 PRE-RENDERED LIGHT STATES")
+    light = DrawableStoplicht(Stoplicht(), (100, 100), rotation=90)
+    assert set(light._surfaces) == set(Light)
+    # Rotated by 90 degrees: wider than high
+    assert all(s.get_width() > s.get_height() for s in light._surfaces.values())
+    assert len({id(s) for s in light._surfaces.values()}) == 3
+
+    screen = pygame.Surface((200, 200))
+    built = []
+    original = draw_traffic_light.pg.Surface
+    draw_traffic_light.pg.Surface = lambda *a, **k: built.append(a) or original(*a, **k)
+    rotate = draw_traffic_light.pg.transform.rotate
+    draw_traffic_light.pg.transform.rotate = lambda *a: built.append(a) or rotate(*a)
+    try:
+        for state in [Light.GREEN, Light.AMBER, Light.RED] * 20:
+            light.set_active(state)
+            light.draw(screen)
+    finally:
+        draw_traffic_light.pg.Surface = original
+        draw_traffic_light.pg.transform.rotate = rotate
+    print(f"  surfaces built while cycling: {len(built)}")
+    assert not built and light.surface is light._surfaces[Light.RED]
+
+    # The green lamp (top of the housing, left side after rotating) is lit
+    light.set_active(Light.GREEN)
+    screen.fill((0, 0, 0))
+    light.draw(screen)
+    w = light.surface.get_width()
+    left = 100 - w // 2
+    print(f"  green lamp pixel: {tuple(screen.get_at((left + 16, 100)))[:3]}")
+    assert tuple(screen.get_at((left + 16, 100)))[:3] == (0, 255, 0)
+
+
+if __name__ == "__main__":
+    test_states_prerendered()
+    print("\n✅ Traffic light surfaces are pre-rendered!")